@@ -1,8 +1,12 @@
 #include "g1_arm_wrapper.h"
+#ifdef G1_COMBINED_LIBRARY
+#include "g1_session.h"
+#endif
 #include <unitree/robot/g1/arm/g1_arm_action_api.hpp>
 #include <unitree/robot/g1/arm/g1_arm_action_client.hpp>
 #include <iostream>
 #include <memory>
+#include <string>
 #include <cstring>
 #include <cstdlib>
 
@@ -10,6 +14,7 @@
 class G1ArmClientWrapper {
 public:
     unitree::robot::g1::G1ArmActionClient client;
+    std::string action_list;  // get_action_list_buf 응답 버퍼
 
     G1ArmClientWrapper() {
         // Constructor
@@ -25,9 +30,17 @@ extern "C" {
 
 ArmClientHandle create_arm_client(const char* network_interface) {
     try {
+#ifdef G1_COMBINED_LIBRARY
+        // 통합 라이브러리: 세션이 ChannelFactory를 한 번만 초기화하므로 loco보다 먼저 생성해도 됨
+        if (g1_session_init(network_interface) != 0) {
+            return nullptr;
+        }
+        std::cout << "Creating ArmActionClient" << std::endl;
+#else
         // ChannelFactory는 싱글톤이므로 이미 초기화되었다면 스킵
         // (loco wrapper에서 이미 초기화했을 가능성 있음)
         std::cout << "Creating ArmActionClient (ChannelFactory should be already initialized)" << std::endl;
+#endif
 
         // Create wrapper (ChannelFactory 초기화 안 함)
         G1ArmClientWrapper* wrapper = new G1ArmClientWrapper();
@@ -110,6 +123,29 @@ StringResult get_action_list(ArmClientHandle handle) {
     return result;
 }
 
+int get_action_list_buf(ArmClientHandle handle, char* buffer, int buffer_size, int* required_size) {
+    if (required_size) *required_size = 0;
+    if (!handle) return -1;
+    
+    try {
+        G1ArmClientWrapper* wrapper = static_cast<G1ArmClientWrapper*>(handle);
+        std::string& data = wrapper->action_list;  // 호출 간 재사용 (용량 유지)
+        data.clear();
+        int32_t ret = wrapper->client.GetActionList(data);
+        if (ret != 0) return ret;
+        
+        int required = static_cast<int>(data.size()) + 1;
+        if (required_size) *required_size = required;
+        if (!buffer || buffer_size < required) return G1_ARM_ERR_BUFFER_TOO_SMALL;
+        
+        memcpy(buffer, data.c_str(), required);
+        return 0;
+    } catch (const std::exception& e) {
+        std::cerr << "Error getting action list: " << e.what() << std::endl;
+        return -1;
+    }
+}
+
 void free_string_result(StringResult result) {
     if (result.data) {
         free(result.data);
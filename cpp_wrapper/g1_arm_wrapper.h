@@ -11,6 +11,9 @@ typedef struct {
     char* data;
 } StringResult;
 
+// 호출자 버퍼가 작을 때의 반환 코드 (required_size에 필요한 크기 기록)
+#define G1_ARM_ERR_BUFFER_TOO_SMALL (-9)
+
 // 클래스 포인터 타입 (opaque pointer)
 typedef void* ArmClientHandle;
 
@@ -24,6 +27,11 @@ int set_arm_timeout(ArmClientHandle handle, float timeout);
 int execute_action(ArmClientHandle handle, int action_id);
 StringResult get_action_list(ArmClientHandle handle);
 
+// 호출자 버퍼에 action 목록 JSON 기록 (NUL 포함, 힙 할당 없음)
+// required_size에는 NUL을 포함한 필요한 크기를 기록
+// 반환값: 0 = 성공, G1_ARM_ERR_BUFFER_TOO_SMALL = 버퍼 부족 (버퍼 내용은 정의되지 않음), 그 외 SDK 에러 코드
+int get_action_list_buf(ArmClientHandle handle, char* buffer, int buffer_size, int* required_size);
+
 // 메모리 해제 함수
 void free_string_result(StringResult result);
 
@@ -1,4 +1,5 @@
 #include "g1_loco_wrapper.h"
+#include "g1_session.h"
 #include <unitree/robot/g1/loco/g1_loco_api.hpp>
 #include <unitree/robot/g1/loco/g1_loco_client.hpp>
 #include <iostream>
@@ -28,11 +29,10 @@ extern "C" {
 
 LocoClientHandle create_loco_client(const char* network_interface) {
     try {
-        std::cout << "Initializing ChannelFactory with interface: " << network_interface << std::endl;
-
-        // Initialize channel factory - 예제와 동일한 방식
-        unitree::robot::ChannelFactory::Instance()->Init(0, network_interface);
-        std::cout << "ChannelFactory initialized successfully" << std::endl;
+        // Initialize channel factory - 세션에서 한 번만 (이미 초기화되었으면 스킵)
+        if (g1_session_init(network_interface) != 0) {
+            return nullptr;
+        }
 
         // Create wrapper
         G1LocoClientWrapper* wrapper = new G1LocoClientWrapper();
@@ -44,6 +44,19 @@ LocoClientHandle create_loco_client(const char* network_interface) {
     }
 }
 
+LocoClientHandle create_loco_client_shared(void) {
+    try {
+        // ChannelFactory는 create_loco_client에서 이미 초기화되어 있어야 함
+        // (비상 정지 등 우선순위 명령 전용 클라이언트로 사용)
+        G1LocoClientWrapper* wrapper = new G1LocoClientWrapper();
+        std::cout << "Shared LocoClient wrapper created successfully" << std::endl;
+        return static_cast<LocoClientHandle>(wrapper);
+    } catch (const std::exception& e) {
+        std::cerr << "Error creating shared loco client: " << e.what() << std::endl;
+        return nullptr;
+    }
+}
+
 void destroy_loco_client(LocoClientHandle handle) {
     if (handle) {
         G1LocoClientWrapper* wrapper = static_cast<G1LocoClientWrapper*>(handle);
@@ -163,6 +176,52 @@ FloatResult get_stand_height(LocoClientHandle handle) {
     return result;
 }
 
+LocoState get_loco_state(LocoClientHandle handle) {
+    LocoState state = {-1, 0, -1, 0, -1, 0, -1, 0.0f, -1, 0.0f};
+    if (!handle) return state;
+
+    G1LocoClientWrapper* wrapper = static_cast<G1LocoClientWrapper*>(handle);
+
+    // 필드별로 독립 처리 - 한 필드가 실패해도 나머지는 채움
+    // return code는 개별 GET 함수와 동일하게 무시 (SDK 예제와 동일)
+    try {
+        wrapper->client.GetFsmId(state.fsm_id);
+        state.fsm_id_code = 0;
+    } catch (const std::exception& e) {
+        std::cerr << "Error getting FSM ID: " << e.what() << std::endl;
+    }
+
+    try {
+        wrapper->client.GetFsmMode(state.fsm_mode);
+        state.fsm_mode_code = 0;
+    } catch (const std::exception& e) {
+        std::cerr << "Error getting FSM mode: " << e.what() << std::endl;
+    }
+
+    try {
+        wrapper->client.GetBalanceMode(state.balance_mode);
+        state.balance_mode_code = 0;
+    } catch (const std::exception& e) {
+        std::cerr << "Error getting balance mode: " << e.what() << std::endl;
+    }
+
+    try {
+        wrapper->client.GetSwingHeight(state.swing_height);
+        state.swing_height_code = 0;
+    } catch (const std::exception& e) {
+        std::cerr << "Error getting swing height: " << e.what() << std::endl;
+    }
+
+    try {
+        wrapper->client.GetStandHeight(state.stand_height);
+        state.stand_height_code = 0;
+    } catch (const std::exception& e) {
+        std::cerr << "Error getting stand height: " << e.what() << std::endl;
+    }
+
+    return state;
+}
+
 // SET 함수들
 int set_fsm_id(LocoClientHandle handle, int fsm_id) {
     if (!handle) return -1;
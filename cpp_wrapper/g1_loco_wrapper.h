@@ -16,11 +16,26 @@ typedef struct {
     float value;
 } FloatResult;
 
+// 전체 상태 스냅샷 (필드별 반환 코드 포함)
+typedef struct {
+    int fsm_id_code;
+    int fsm_id;
+    int fsm_mode_code;
+    int fsm_mode;
+    int balance_mode_code;
+    int balance_mode;
+    int swing_height_code;
+    float swing_height;
+    int stand_height_code;
+    float stand_height;
+} LocoState;
+
 // 클래스 포인터 타입 (opaque pointer)
 typedef void* LocoClientHandle;
 
 // 초기화/해제 함수
 LocoClientHandle create_loco_client(const char* network_interface);
+LocoClientHandle create_loco_client_shared(void);  // ChannelFactory 초기화 없이 추가 클라이언트 생성
 void destroy_loco_client(LocoClientHandle handle);
 int init_loco_client(LocoClientHandle handle);
 int set_timeout(LocoClientHandle handle, float timeout);
@@ -31,6 +46,7 @@ IntResult get_fsm_mode(LocoClientHandle handle);
 IntResult get_balance_mode(LocoClientHandle handle);
 FloatResult get_swing_height(LocoClientHandle handle);
 FloatResult get_stand_height(LocoClientHandle handle);
+LocoState get_loco_state(LocoClientHandle handle);  // 위 5개 GET을 한 번의 호출로
 
 // SET 함수들
 int set_fsm_id(LocoClientHandle handle, int fsm_id);
@@ -0,0 +1,58 @@
+#include "g1_session.h"
+#include <unitree/robot/channel/channel_factory.hpp>
+#include <chrono>
+#include <iostream>
+#include <mutex>
+#include <string>
+
+namespace {
+
+std::mutex g_session_mutex;
+bool g_initialized = false;
+std::string g_interface;
+double g_init_ms = 0.0;
+
+} // namespace
+
+extern "C" {
+
+int g1_session_init(const char* network_interface) {
+    std::lock_guard<std::mutex> lock(g_session_mutex);
+    std::string interface_name = network_interface ? network_interface : "";
+
+    if (g_initialized) {
+        if (interface_name != g_interface) {
+            std::cerr << "ChannelFactory already initialized with interface " << g_interface
+                      << " (requested: " << interface_name << ")" << std::endl;
+            return G1_SESSION_ERR_INTERFACE_MISMATCH;
+        }
+        return 0;
+    }
+
+    try {
+        std::cout << "Initializing ChannelFactory with interface: " << interface_name << std::endl;
+        auto start = std::chrono::steady_clock::now();
+        unitree::robot::ChannelFactory::Instance()->Init(0, interface_name);
+        g_init_ms = std::chrono::duration<double, std::milli>(std::chrono::steady_clock::now() - start).count();
+
+        g_initialized = true;
+        g_interface = interface_name;
+        std::cout << "ChannelFactory initialized successfully (" << g_init_ms << " ms)" << std::endl;
+        return 0;
+    } catch (const std::exception& e) {
+        std::cerr << "Error initializing ChannelFactory: " << e.what() << std::endl;
+        return -1;
+    }
+}
+
+int g1_session_is_initialized(void) {
+    std::lock_guard<std::mutex> lock(g_session_mutex);
+    return g_initialized ? 1 : 0;
+}
+
+double g1_session_init_ms(void) {
+    std::lock_guard<std::mutex> lock(g_session_mutex);
+    return g_init_ms;
+}
+
+} // extern "C"
@@ -0,0 +1,28 @@
+#ifndef G1_SESSION_H
+#define G1_SESSION_H
+
+// SDK 세션 - ChannelFactory(DDS) 초기화를 프로세스당 한 번만 수행
+// loco/arm 클라이언트는 초기화된 세션 위에서 생성된다.
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+// 이미 다른 네트워크 인터페이스로 초기화된 경우의 반환 코드
+#define G1_SESSION_ERR_INTERFACE_MISMATCH (-2)
+
+// ChannelFactory 초기화 (여러 번 호출해도 한 번만 초기화)
+// 반환값: 0 = 성공 (이미 같은 인터페이스로 초기화된 경우 포함), -1 = 실패, -2 = 인터페이스 불일치
+int g1_session_init(const char* network_interface);
+
+// 초기화 여부 (1 = 초기화됨)
+int g1_session_is_initialized(void);
+
+// ChannelFactory 초기화에 걸린 시간 (ms, 초기화 전이면 0)
+double g1_session_init_ms(void);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // G1_SESSION_H
@@ -0,0 +1,514 @@
+#include "g1_sim_wrapper.h"
+#include <algorithm>
+#include <chrono>
+#include <cstdlib>
+#include <cstring>
+#include <iostream>
+#include <map>
+#include <mutex>
+#include <random>
+#include <sstream>
+#include <string>
+#include <thread>
+
+// 시뮬레이션 백엔드 - unitree_sdk2/DDS 없이 loco/arm C ABI를 구현
+// (호출 지연, 지터, 에러 코드 주입, FSM 상태 머신)
+
+namespace {
+
+// SDK 예제와 동일한 FSM ID
+const int FSM_ZERO_TORQUE = 0;
+const int FSM_DAMP = 1;
+const int FSM_SQUAT = 2;
+const int FSM_SIT = 3;
+const int FSM_STAND_UP = 4;
+const int FSM_START = 500;
+
+const int CODE_ROBOT_NOT_READY = 3104;
+const int CODE_TIMEOUT = 3105;
+const int CODE_ARM_INVALID_ACTION = -7;
+const int CODE_ARM_INVALID_FSM = -8;
+
+const float STAND_HEIGHT_LOW = 0.0f;
+const float STAND_HEIGHT_HIGH = 1.0f;
+
+struct SimClient {
+    bool initialized = false;
+    float timeout = 3.0f;  // 초
+};
+
+struct SimError {
+    int code;
+    float rate;
+};
+
+struct SimState {
+    bool channel_initialized = false;
+    int fsm_id = FSM_ZERO_TORQUE;
+    int fsm_mode = 0;
+    int balance_mode = 0;
+    int speed_mode = 0;
+    int task_id = 0;
+    float swing_height = 0.08f;
+    float stand_height = 0.75f;
+    float vx = 0.0f;
+    float vy = 0.0f;
+    float vyaw = 0.0f;
+    bool continuous_move = false;
+};
+
+struct ArmAction {
+    int id;
+    const char* name;
+};
+
+// g1_arm_action_client.hpp와 동일한 action 목록
+const ArmAction ARM_ACTIONS[] = {
+    {99, "release_arm"}, {11, "two_hand_kiss"}, {12, "left_kiss"}, {13, "right_kiss"},
+    {15, "hands_up"}, {17, "clap"}, {18, "high_five"}, {19, "hug"}, {20, "heart"},
+    {21, "right_heart"}, {22, "reject"}, {23, "right_hand_up"}, {24, "x_ray"},
+    {25, "face_wave"}, {26, "high_wave"}, {27, "shake_hand"},
+};
+
+std::mutex g_mutex;
+SimState g_state;
+float g_latency_ms = 0.0f;
+float g_jitter_ms = 0.0f;
+float g_arm_action_ms = 0.0f;
+std::map<std::string, SimError> g_errors;
+std::map<std::string, int> g_calls;
+int g_total_calls = 0;
+std::mt19937 g_rng(0);
+std::string g_session_interface;
+double g_session_init_ms = 0.0;
+
+// 호출 공통 처리: 호출 수 기록, 지연(잠금 밖에서 sleep), 에러 주입
+// 반환값: 0 = 정상 진행, 그 외 = 해당 코드로 즉시 반환
+int sim_call(const char* name, const SimClient* client, float extra_ms = 0.0f) {
+    float delay_ms = 0.0f;
+    int injected = 0;
+    {
+        std::lock_guard<std::mutex> lock(g_mutex);
+        g_calls[name]++;
+        g_total_calls++;
+
+        delay_ms = g_latency_ms + extra_ms;
+        if (g_jitter_ms > 0.0f) {
+            std::uniform_real_distribution<float> jitter(-g_jitter_ms, g_jitter_ms);
+            delay_ms += jitter(g_rng);
+        }
+
+        auto it = g_errors.find(name);
+        if (it == g_errors.end()) it = g_errors.find("*");
+        if (it != g_errors.end()) {
+            std::uniform_real_distribution<float> chance(0.0f, 1.0f);
+            if (chance(g_rng) < it->second.rate) injected = it->second.code;
+        }
+    }
+
+    // 클라이언트 타임아웃을 넘으면 타임아웃까지만 기다리고 실패
+    float timeout_ms = client ? client->timeout * 1000.0f : 0.0f;
+    bool timed_out = client && timeout_ms > 0.0f && delay_ms > timeout_ms;
+    if (timed_out) delay_ms = timeout_ms;
+
+    if (delay_ms > 0.0f) {
+        std::this_thread::sleep_for(std::chrono::microseconds(static_cast<long long>(delay_ms * 1000.0f)));
+    }
+
+    if (injected != 0) return injected;
+    return timed_out ? CODE_TIMEOUT : 0;
+}
+
+SimClient* to_client(void* handle) {
+    return static_cast<SimClient*>(handle);
+}
+
+// 보행/arm action이 허용되는 FSM ID {500, 501, 801}
+bool motion_fsm_allowed(int fsm_id) {
+    return fsm_id == 500 || fsm_id == 501 || fsm_id == 801;
+}
+
+// 상태 변경 명령 공통 처리
+template <typename Fn>
+int sim_command(const char* name, LocoClientHandle handle, Fn apply) {
+    if (!handle) return -1;
+    int code = sim_call(name, to_client(handle));
+    if (code != 0) return code;
+    std::lock_guard<std::mutex> lock(g_mutex);
+    return apply(g_state);
+}
+
+template <typename T, typename Result, typename Fn>
+Result sim_get(const char* name, LocoClientHandle handle, Fn read) {
+    Result result = {-1, T()};
+    if (!handle) return result;
+    result.code = sim_call(name, to_client(handle));
+    std::lock_guard<std::mutex> lock(g_mutex);
+    result.value = read(g_state);
+    return result;
+}
+
+// action 목록 JSON (고정 목록이므로 한 번만 생성)
+const std::string& action_list_json() {
+    static const std::string json = [] {
+        std::ostringstream out;
+        out << "[";
+        bool first = true;
+        for (const ArmAction& action : ARM_ACTIONS) {
+            if (!first) out << ",";
+            out << "{\"id\":" << action.id << ",\"name\":\"" << action.name << "\"}";
+            first = false;
+        }
+        out << "]";
+        return out.str();
+    }();
+    return json;
+}
+
+} // namespace
+
+extern "C" {
+
+// ========== 시뮬레이션 설정 ==========
+void sim_configure(float latency_ms, float jitter_ms, float arm_action_ms) {
+    std::lock_guard<std::mutex> lock(g_mutex);
+    g_latency_ms = std::max(0.0f, latency_ms);
+    g_jitter_ms = std::max(0.0f, jitter_ms);
+    g_arm_action_ms = std::max(0.0f, arm_action_ms);
+}
+
+void sim_set_error(const char* function_name, int error_code, float error_rate) {
+    if (!function_name) return;
+    std::lock_guard<std::mutex> lock(g_mutex);
+    if (error_rate <= 0.0f || error_code == 0) {
+        g_errors.erase(function_name);
+    } else {
+        g_errors[function_name] = {error_code, error_rate};
+    }
+}
+
+void sim_reset(int fsm_id) {
+    std::lock_guard<std::mutex> lock(g_mutex);
+    bool channel_initialized = g_state.channel_initialized;
+    g_state = SimState();
+    g_state.channel_initialized = channel_initialized;
+    g_state.fsm_id = fsm_id;
+    g_errors.clear();
+    g_calls.clear();
+    g_total_calls = 0;
+}
+
+void sim_set_seed(unsigned int seed) {
+    std::lock_guard<std::mutex> lock(g_mutex);
+    g_rng.seed(seed);
+}
+
+int sim_get_call_count(const char* function_name) {
+    std::lock_guard<std::mutex> lock(g_mutex);
+    if (!function_name || std::strcmp(function_name, "*") == 0) return g_total_calls;
+    auto it = g_calls.find(function_name);
+    return it == g_calls.end() ? 0 : it->second;
+}
+
+// ========== 세션 ==========
+int g1_session_init(const char* network_interface) {
+    std::string interface_name = network_interface ? network_interface : "";
+    {
+        std::lock_guard<std::mutex> lock(g_mutex);
+        if (g_state.channel_initialized) {
+            return interface_name == g_session_interface ? 0 : G1_SESSION_ERR_INTERFACE_MISMATCH;
+        }
+    }
+
+    std::cout << "[SIM] Initializing simulated ChannelFactory with interface: " << interface_name << std::endl;
+    auto start = std::chrono::steady_clock::now();
+    int code = sim_call("g1_session_init", nullptr);
+    if (code != 0) return -1;
+
+    std::lock_guard<std::mutex> lock(g_mutex);
+    g_state.channel_initialized = true;
+    g_session_interface = interface_name;
+    g_session_init_ms = std::chrono::duration<double, std::milli>(std::chrono::steady_clock::now() - start).count();
+    return 0;
+}
+
+int g1_session_is_initialized(void) {
+    std::lock_guard<std::mutex> lock(g_mutex);
+    return g_state.channel_initialized ? 1 : 0;
+}
+
+double g1_session_init_ms(void) {
+    std::lock_guard<std::mutex> lock(g_mutex);
+    return g_session_init_ms;
+}
+
+// ========== Loco 초기화/해제 ==========
+LocoClientHandle create_loco_client(const char* network_interface) {
+    if (g1_session_init(network_interface) != 0) return nullptr;
+    return static_cast<LocoClientHandle>(new SimClient());
+}
+
+LocoClientHandle create_loco_client_shared(void) {
+    return static_cast<LocoClientHandle>(new SimClient());
+}
+
+void destroy_loco_client(LocoClientHandle handle) {
+    delete to_client(handle);
+}
+
+int init_loco_client(LocoClientHandle handle) {
+    if (!handle) return -1;
+    std::lock_guard<std::mutex> lock(g_mutex);
+    if (!g_state.channel_initialized) return -1;
+    to_client(handle)->initialized = true;
+    return 0;
+}
+
+int set_timeout(LocoClientHandle handle, float timeout) {
+    if (!handle) return -1;
+    to_client(handle)->timeout = timeout;
+    return 0;
+}
+
+// ========== Loco GET ==========
+IntResult get_fsm_id(LocoClientHandle handle) {
+    return sim_get<int, IntResult>("get_fsm_id", handle, [](SimState& s) { return s.fsm_id; });
+}
+
+IntResult get_fsm_mode(LocoClientHandle handle) {
+    return sim_get<int, IntResult>("get_fsm_mode", handle, [](SimState& s) { return s.fsm_mode; });
+}
+
+IntResult get_balance_mode(LocoClientHandle handle) {
+    return sim_get<int, IntResult>("get_balance_mode", handle, [](SimState& s) { return s.balance_mode; });
+}
+
+FloatResult get_swing_height(LocoClientHandle handle) {
+    return sim_get<float, FloatResult>("get_swing_height", handle, [](SimState& s) { return s.swing_height; });
+}
+
+FloatResult get_stand_height(LocoClientHandle handle) {
+    return sim_get<float, FloatResult>("get_stand_height", handle, [](SimState& s) { return s.stand_height; });
+}
+
+LocoState get_loco_state(LocoClientHandle handle) {
+    LocoState state = {-1, 0, -1, 0, -1, 0, -1, 0.0f, -1, 0.0f};
+    if (!handle) return state;
+
+    // 실제 래퍼와 동일하게 내부적으로 5번의 RPC 지연을 가짐
+    SimClient* client = to_client(handle);
+    state.fsm_id_code = sim_call("get_fsm_id", client);
+    state.fsm_mode_code = sim_call("get_fsm_mode", client);
+    state.balance_mode_code = sim_call("get_balance_mode", client);
+    state.swing_height_code = sim_call("get_swing_height", client);
+    state.stand_height_code = sim_call("get_stand_height", client);
+
+    std::lock_guard<std::mutex> lock(g_mutex);
+    state.fsm_id = g_state.fsm_id;
+    state.fsm_mode = g_state.fsm_mode;
+    state.balance_mode = g_state.balance_mode;
+    state.swing_height = g_state.swing_height;
+    state.stand_height = g_state.stand_height;
+    return state;
+}
+
+// ========== Loco SET ==========
+int set_fsm_id(LocoClientHandle handle, int fsm_id) {
+    return sim_command("set_fsm_id", handle, [fsm_id](SimState& s) { s.fsm_id = fsm_id; return 0; });
+}
+
+int set_balance_mode(LocoClientHandle handle, int balance_mode) {
+    return sim_command("set_balance_mode", handle, [balance_mode](SimState& s) { s.balance_mode = balance_mode; return 0; });
+}
+
+int set_swing_height(LocoClientHandle handle, float swing_height) {
+    return sim_command("set_swing_height", handle, [swing_height](SimState& s) { s.swing_height = swing_height; return 0; });
+}
+
+int set_stand_height(LocoClientHandle handle, float stand_height) {
+    return sim_command("set_stand_height", handle, [stand_height](SimState& s) { s.stand_height = stand_height; return 0; });
+}
+
+int set_velocity(LocoClientHandle handle, float vx, float vy, float omega, float duration) {
+    (void)duration;
+    return sim_command("set_velocity", handle, [=](SimState& s) {
+        if (!motion_fsm_allowed(s.fsm_id)) return CODE_ROBOT_NOT_READY;
+        s.vx = vx;
+        s.vy = vy;
+        s.vyaw = omega;
+        return 0;
+    });
+}
+
+int set_task_id(LocoClientHandle handle, int task_id) {
+    return sim_command("set_task_id", handle, [task_id](SimState& s) { s.task_id = task_id; return 0; });
+}
+
+int set_speed_mode(LocoClientHandle handle, int speed_mode) {
+    return sim_command("set_speed_mode", handle, [speed_mode](SimState& s) { s.speed_mode = speed_mode; return 0; });
+}
+
+// ========== Loco 고수준 동작 (SDK LocoClient와 동일한 FSM 전환) ==========
+int damp(LocoClientHandle handle) {
+    return sim_command("damp", handle, [](SimState& s) { s.fsm_id = FSM_DAMP; return 0; });
+}
+
+int start_robot(LocoClientHandle handle) {
+    return sim_command("start_robot", handle, [](SimState& s) { s.fsm_id = FSM_START; return 0; });
+}
+
+int stand_up(LocoClientHandle handle) {
+    return sim_command("stand_up", handle, [](SimState& s) { s.fsm_id = FSM_STAND_UP; return 0; });
+}
+
+int squat(LocoClientHandle handle) {
+    return sim_command("squat", handle, [](SimState& s) { s.fsm_id = FSM_SQUAT; return 0; });
+}
+
+int sit(LocoClientHandle handle) {
+    return sim_command("sit", handle, [](SimState& s) { s.fsm_id = FSM_SIT; return 0; });
+}
+
+int zero_torque(LocoClientHandle handle) {
+    return sim_command("zero_torque", handle, [](SimState& s) { s.fsm_id = FSM_ZERO_TORQUE; return 0; });
+}
+
+int stop_move(LocoClientHandle handle) {
+    return sim_command("stop_move", handle, [](SimState& s) {
+        s.vx = s.vy = s.vyaw = 0.0f;
+        return 0;
+    });
+}
+
+int high_stand(LocoClientHandle handle) {
+    return sim_command("high_stand", handle, [](SimState& s) { s.stand_height = STAND_HEIGHT_HIGH; return 0; });
+}
+
+int low_stand(LocoClientHandle handle) {
+    return sim_command("low_stand", handle, [](SimState& s) { s.stand_height = STAND_HEIGHT_LOW; return 0; });
+}
+
+int balance_stand(LocoClientHandle handle) {
+    return sim_command("balance_stand", handle, [](SimState& s) { s.balance_mode = 0; return 0; });
+}
+
+int continuous_gait(LocoClientHandle handle, int flag) {
+    (void)flag;
+    return sim_command("continuous_gait", handle, [](SimState&) { return 0; });
+}
+
+int switch_move_mode(LocoClientHandle handle, int flag) {
+    return sim_command("switch_move_mode", handle, [flag](SimState& s) { s.continuous_move = (flag != 0); return 0; });
+}
+
+int move_robot(LocoClientHandle handle, float vx, float vy, float vyaw) {
+    return sim_command("move_robot", handle, [=](SimState& s) {
+        if (!motion_fsm_allowed(s.fsm_id)) return CODE_ROBOT_NOT_READY;
+        s.vx = vx;
+        s.vy = vy;
+        s.vyaw = vyaw;
+        return 0;
+    });
+}
+
+int wave_hand(LocoClientHandle handle, int turn_flag) {
+    (void)turn_flag;
+    return sim_command("wave_hand", handle, [](SimState&) { return 0; });
+}
+
+int shake_hand(LocoClientHandle handle, int stage) {
+    (void)stage;
+    return sim_command("shake_hand", handle, [](SimState&) { return 0; });
+}
+
+// ========== Arm ==========
+ArmClientHandle create_arm_client(const char* network_interface) {
+    (void)network_interface;
+    std::cout << "[SIM] Creating simulated ArmActionClient" << std::endl;
+    return static_cast<ArmClientHandle>(new SimClient());
+}
+
+void destroy_arm_client(ArmClientHandle handle) {
+    delete to_client(handle);
+}
+
+int init_arm_client(ArmClientHandle handle) {
+    if (!handle) return -1;
+    std::lock_guard<std::mutex> lock(g_mutex);
+    // 실제 SDK와 동일하게 ChannelFactory(loco) 초기화 이후에만 성공
+    if (!g_state.channel_initialized) {
+        std::cerr << "[SIM] ChannelFactory not initialized - create loco client first" << std::endl;
+        return -1;
+    }
+    to_client(handle)->initialized = true;
+    return 0;
+}
+
+int set_arm_timeout(ArmClientHandle handle, float timeout) {
+    if (!handle) return -1;
+    to_client(handle)->timeout = timeout;
+    return 0;
+}
+
+int execute_action(ArmClientHandle handle, int action_id) {
+    if (!handle) return -1;
+
+    bool known = false;
+    for (const ArmAction& action : ARM_ACTIONS) {
+        if (action.id == action_id) known = true;
+    }
+
+    float action_ms;
+    {
+        std::lock_guard<std::mutex> lock(g_mutex);
+        if (!motion_fsm_allowed(g_state.fsm_id)) {
+            g_calls["execute_action"]++;
+            g_total_calls++;
+            return CODE_ARM_INVALID_FSM;
+        }
+        action_ms = known ? g_arm_action_ms : 0.0f;
+    }
+
+    int code = sim_call("execute_action", to_client(handle), action_ms);
+    if (code != 0) return code;
+    return known ? 0 : CODE_ARM_INVALID_ACTION;
+}
+
+StringResult get_action_list(ArmClientHandle handle) {
+    StringResult result = {-1, nullptr};
+    if (!handle) return result;
+
+    result.code = sim_call("get_action_list", to_client(handle));
+    if (result.code != 0) return result;
+
+    const std::string& data = action_list_json();
+    result.data = static_cast<char*>(malloc(data.size() + 1));
+    if (result.data) {
+        memcpy(result.data, data.c_str(), data.size() + 1);
+    }
+    return result;
+}
+
+int get_action_list_buf(ArmClientHandle handle, char* buffer, int buffer_size, int* required_size) {
+    if (required_size) *required_size = 0;
+    if (!handle) return -1;
+
+    int code = sim_call("get_action_list_buf", to_client(handle));
+    if (code != 0) return code;
+
+    const std::string& data = action_list_json();
+    int required = static_cast<int>(data.size()) + 1;
+    if (required_size) *required_size = required;
+    if (!buffer || buffer_size < required) return G1_ARM_ERR_BUFFER_TOO_SMALL;
+
+    memcpy(buffer, data.c_str(), required);
+    return 0;
+}
+
+void free_string_result(StringResult result) {
+    if (result.data) {
+        free(result.data);
+    }
+}
+
+} // extern "C"
@@ -0,0 +1,34 @@
+#ifndef G1_SIM_WRAPPER_H
+#define G1_SIM_WRAPPER_H
+
+// 시뮬레이션 백엔드 - g1_loco_wrapper.h / g1_arm_wrapper.h / g1_session.h의 C ABI 전체를
+// SDK/DDS 없이 구현하고, 아래 설정 함수를 추가로 제공한다.
+#include "g1_loco_wrapper.h"
+#include "g1_arm_wrapper.h"
+#include "g1_session.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+// 호출 지연 설정 (ms): 모든 RPC에 latency ± jitter, arm action은 arm_action_ms 추가
+void sim_configure(float latency_ms, float jitter_ms, float arm_action_ms);
+
+// 에러 주입: function_name 호출 시 error_rate 확률로 error_code 반환
+// function_name이 "*"이면 모든 함수, error_rate가 0이면 주입 해제
+void sim_set_error(const char* function_name, int error_code, float error_rate);
+
+// 상태 초기화 (FSM ID 지정, 주입된 에러 해제)
+void sim_reset(int fsm_id);
+
+// 지터/에러 주입 난수 시드
+void sim_set_seed(unsigned int seed);
+
+// 누적 호출 수 (function_name이 "*"이면 전체)
+int sim_get_call_count(const char* function_name);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif // G1_SIM_WRAPPER_H
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from typing import Dict, Optional, Sequence, Tuple
+
+# 속도 성분 순서 (모든 벡터 연산은 이 순서의 3-튜플로 처리)
+VELOCITY_AXES = ("vx", "vy", "vyaw")
+
+
+def _clamp(value: float, limit: float) -> float:
+    return max(-limit, min(limit, value))
+
+
+class G1AnalogMapper:
+    """아날로그 스틱 값 → 속도 변환 (데드존, 커브, 축별 최대 속도)
+
+    axes 설정 예: {"vx": (1, -1.0), "vy": (0, -1.0)}
+      - 튜플은 (joy axes 인덱스, 부호)
+      - 설정되지 않은 성분은 항상 0
+    """
+
+    def __init__(self, axes: Dict[str, Sequence] = None, deadzone: float = 0.1,
+                 expo: float = 0.5, limits: Dict[str, float] = None):
+        axes = axes or {"vx": (1, -1.0), "vy": (0, -1.0)}
+        limits = limits or {}
+
+        # 성분별 (인덱스, 부호 * 최대 속도)를 미리 계산
+        self._channels = []
+        for name in VELOCITY_AXES:
+            if name in axes:
+                index, sign = axes[name]
+                self._channels.append((int(index), float(sign) * float(limits.get(name, 0.0))))
+            else:
+                self._channels.append((None, 0.0))
+
+        self.deadzone = float(deadzone)
+        self.expo = float(expo)
+        self._scale = 1.0 / (1.0 - self.deadzone) if self.deadzone < 1.0 else 0.0
+
+    @property
+    def axis_indices(self):
+        """아날로그 제어에 사용되는 joy axes 인덱스 집합"""
+        return {index for index, _ in self._channels if index is not None}
+
+    def map(self, axes_values: Sequence[float]) -> Tuple[float, float, float]:
+        """joy axes 배열 → (vx, vy, vyaw)"""
+        count = len(axes_values)
+        return tuple(
+            self._shape(axes_values[index]) * gain if index is not None and index < count else 0.0
+            for index, gain in self._channels
+        )
+
+    def _shape(self, value: float) -> float:
+        """데드존 제거 후 [-1, 1] 재정규화, expo 커브 적용"""
+        magnitude = abs(value)
+        if magnitude <= self.deadzone:
+            return 0.0
+        x = min(1.0, (magnitude - self.deadzone) * self._scale)
+        x = (1.0 - self.expo) * x + self.expo * x * x * x
+        return x if value > 0 else -x
+
+
+class G1RateLimiter:
+    """가속도/저크 제한기 (속도 스트리머의 매 주기마다 step 호출)
+
+    accel_limits: 성분별 최대 가속도 (단위/s^2)
+    jerk_limits: 성분별 최대 저크 (단위/s^3), None이면 가속도만 제한
+
+    저크 제한 시 목표에 가까워질수록 목표 가속도를 줄여, 가속도를 j_max로 0까지 낮추는 동안
+    이동하는 속도 변화량(a^2/2j + a*dt/2)이 남은 오차를 넘지 않게 한다 (목표를 지나치지 않음).
+    가속도를 강제로 0으로 만들지 않으므로 출력 가속도의 변화는 항상 j_max*dt 이내다.
+    """
+
+    def __init__(self, accel_limits: Dict[str, float], jerk_limits: Optional[Dict[str, float]] = None):
+        self._accel_max = tuple(float(accel_limits.get(name, float("inf"))) for name in VELOCITY_AXES)
+        if jerk_limits:
+            self._jerk_max = tuple(float(jerk_limits.get(name, float("inf"))) for name in VELOCITY_AXES)
+        else:
+            self._jerk_max = (float("inf"),) * 3
+        self.reset()
+
+    def reset(self):
+        """현재 속도/가속도를 0으로 초기화 (정지 명령 이후)"""
+        self._velocity = (0.0, 0.0, 0.0)
+        self._accel = (0.0, 0.0, 0.0)
+
+    def step(self, target: Tuple[float, float, float], dt: float) -> Tuple[float, float, float]:
+        """목표 속도로 dt만큼 진행한 제한된 속도 반환"""
+        if dt <= 0.0:
+            return self._velocity
+
+        velocity, accel = [], []
+        for v, a, goal, a_max, j_max in zip(self._velocity, self._accel, target,
+                                             self._accel_max, self._jerk_max):
+            error = goal - v
+            a_goal = _clamp(error / dt, a_max)
+            if j_max != float("inf"):
+                # 남은 오차 안에서 가속도를 0까지 줄일 수 있는 최대 크기로 제한
+                half_step = 0.5 * j_max * dt
+                a_goal = _clamp(a_goal, (half_step * half_step + 2.0 * j_max * abs(error)) ** 0.5 - half_step)
+            a_new = a + _clamp(a_goal - a, j_max * dt)
+            v_new = v + a_new * dt
+            # 마지막 주기의 잔여 가속도(j_max*dt 이내)로 목표를 지나치면 속도만 목표값에 고정,
+            # 가속도는 다음 주기에 저크 제한 안에서 0이 됨
+            # (목표가 갑자기 바뀌어 가속도가 더 크면 저크 제한상 피할 수 없는 오버슈트 → 되돌아옴)
+            if (goal - v_new) * error <= 0.0 and abs(a_new) <= j_max * dt:
+                v_new = goal
+            velocity.append(v_new)
+            accel.append(a_new)
+
+        self._velocity = tuple(velocity)
+        self._accel = tuple(accel)
+        return self._velocity
@@ -2,14 +2,25 @@
 # -*- coding: utf-8 -*-
 
 import os
+import json
+import time
 import ctypes
 from ctypes import Structure, POINTER, c_void_p, c_int, c_float, c_char_p
 import threading
 from typing import Dict, Tuple, Optional
 
+from g1_metrics import InstrumentedLibrary, format_prometheus
+from g1_logger import get_logger, flush_logging
+
+logger = get_logger(__name__)
+
 # 구조체 정의 (C++ 헤더와 동일)
+# data는 c_void_p로 받아 ctypes가 bytes로 복사하지 않은 원본 포인터를 free_string_result에 전달
 class StringResult(Structure):
-    _fields_ = [("code", c_int), ("data", c_char_p)]
+    _fields_ = [("code", c_int), ("data", c_void_p)]
+
+# get_action_list_buf: 버퍼 부족 시 반환 코드 (g1_arm_wrapper.h와 동일)
+ARM_ERR_BUFFER_TOO_SMALL = -9
 
 class G1ArmBridge:
     """G1 ArmActionClient C++ Wrapper Bridge for Python"""
@@ -40,41 +51,67 @@ class G1ArmBridge:
         -6: "HOLDING ERROR: Robot is holding something",
         -7: "INVALID ACTION ID: Invalid action ID",
         -8: "INVALID FSM ID: Actions only supported in FSM ID {500, 501, 801}",
+        ARM_ERR_BUFFER_TOO_SMALL: "BUFFER TOO SMALL: Response does not fit in the buffer",
     }
     
-    def __init__(self, network_interface: str = "eth0"):
+    # 펌웨어 action 목록에 없어도 항상 허용하는 action (팔 해제는 제스처 목록과 별개)
+    CATALOGUE_EXEMPT_ACTIONS = ("release_arm",)
+
+    # 백엔드별 공유 라이브러리 (sim: SDK 없이 동작하는 시뮬레이션 백엔드)
+    LIBRARY_NAMES = {
+        "sdk": "libg1_arm_wrapper.so",
+        "sim": "libg1_sim_wrapper.so",
+    }
+
+    def __init__(self, network_interface: str = "eth0", backend: str = "sdk", session=None):
+        if backend not in self.LIBRARY_NAMES:
+            raise ValueError(f"Unknown backend: {backend} (available: {list(self.LIBRARY_NAMES)})")
         self.network_interface = network_interface
+        self.backend = backend
+        self.session = session  # G1Session: 통합 라이브러리 공유 (None이면 개별 라이브러리 로드)
         self.handle = None
         self.lib = None
         self._lock = threading.Lock()
+        # 로봇에서 가져온 action 카탈로그 (None이면 ACTION_MAP만 사용)
+        self._catalogue = None
+        # get_action_list_buf 응답 버퍼 (호출 간 재사용, 부족하면 필요한 크기로 확장)
+        self._action_buffer = ctypes.create_string_buffer(4096)
+        self._required_size = c_int(0)
         self._load_library()
     
     def _load_library(self):
         """C++ 공유 라이브러리 로드"""
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            lib_paths = [
-                os.path.join(current_dir, "libg1_arm_wrapper.so"),
-                os.path.join(current_dir, "cpp_wrapper", "libg1_arm_wrapper.so"),
-                "./libg1_arm_wrapper.so"
-            ]
-
-            for lib_path in lib_paths:
-                if os.path.exists(lib_path):
-                    try:
-                        print(f"[INFO] Loading C++ library: {lib_path}")
-                        self.lib = ctypes.CDLL(lib_path)
-                        print(f"[SUCCESS] Loaded C++ library: {lib_path}")
-                        break
-                    except OSError as e:
-                        print(f"[ERROR] Failed to load {lib_path}: {e}")
-                        continue
-
-            if not self.lib:
-                raise RuntimeError(f"Could not find libg1_arm_wrapper.so in any of these paths: {lib_paths}")
+            if self.session:
+                # 통합 라이브러리 공유 (SDK/DDS 한 벌, ChannelFactory는 세션이 초기화)
+                self.lib = self.session.lib
+            else:
+                current_dir = os.path.dirname(os.path.abspath(__file__))
+                lib_name = self.LIBRARY_NAMES[self.backend]
+                lib_paths = [
+                    os.path.join(current_dir, lib_name),
+                    os.path.join(current_dir, "cpp_wrapper", lib_name),
+                    f"./{lib_name}"
+                ]
+
+                for lib_path in lib_paths:
+                    if os.path.exists(lib_path):
+                        try:
+                            logger.info(f"Loading C++ library: {lib_path}")
+                            self.lib = ctypes.CDLL(lib_path)
+                            logger.success(f"Loaded C++ library: {lib_path}")
+                            break
+                        except OSError as e:
+                            logger.error(f"Failed to load {lib_path}: {e}")
+                            continue
+
+                if not self.lib:
+                    raise RuntimeError(f"Could not find {lib_name} in any of these paths: {lib_paths}")
 
             self._setup_function_signatures()
-            print("[SUCCESS] Function signatures configured")
+            # 모든 SDK 호출의 지연/반환 코드 계측
+            self.lib = InstrumentedLibrary(self.lib, "arm")
+            logger.success("Function signatures configured")
 
         except Exception as e:
             raise RuntimeError(f"Failed to load library: {e}")
@@ -108,6 +145,12 @@ class G1ArmBridge:
         # free_string_result
         self.lib.free_string_result.argtypes = [StringResult]
         self.lib.free_string_result.restype = None
+
+        # get_action_list_buf (호출자 버퍼, 이전 버전 라이브러리에는 없음)
+        self.has_action_list_buf = hasattr(self.lib, "get_action_list_buf")
+        if self.has_action_list_buf:
+            self.lib.get_action_list_buf.argtypes = [c_void_p, c_char_p, c_int, POINTER(c_int)]
+            self.lib.get_action_list_buf.restype = c_int
     
     def _get_error_message(self, code: int) -> str:
         """에러 코드를 메시지로 변환"""
@@ -118,52 +161,56 @@ class G1ArmBridge:
         with self._lock:
             try:
                 if self.handle:
-                    print("[WARNING] Already connected")
+                    logger.warning("Already connected")
                     return True
 
-                print(f"[INFO] Connecting to G1 robot via {self.network_interface}...")
+                logger.info(f"Connecting to G1 robot via {self.network_interface}...")
                 
                 interface_bytes = self.network_interface.encode('utf-8')
 
-                print("[DEBUG] Creating arm client...")
+                logger.debug("Creating arm client...")
                 self.handle = self.lib.create_arm_client(interface_bytes)
                 if not self.handle:
                     raise RuntimeError("Failed to create arm client")
-                print(f"[DEBUG] Arm client created successfully: {self.handle}")
+                logger.debug(f"Arm client created successfully: {self.handle}")
 
-                print("[DEBUG] Initializing arm client...")
+                logger.debug("Initializing arm client...")
                 result = self.lib.init_arm_client(self.handle)
                 if result != 0:
                     error_msg = self._get_error_message(result)
                     raise RuntimeError(f"Client initialization failed - Code: {result}, Message: {error_msg}")
-                print("[DEBUG] Arm client initialized successfully")
+                logger.debug("Arm client initialized successfully")
 
-                print("[DEBUG] Setting timeout...")
+                logger.debug("Setting timeout...")
                 timeout_result = self.lib.set_arm_timeout(self.handle, 10.0)
-                print(f"[DEBUG] Timeout set result: {timeout_result}")
+                logger.debug(f"Timeout set result: {timeout_result}")
                 
-                print(f"[SUCCESS] Connected to G1 robot via {self.network_interface}")
-                return True
+                logger.success(f"Connected to G1 robot via {self.network_interface}")
 
             except Exception as e:
-                print(f"[ERROR] Connection failed: {e}")
+                logger.error(f"Connection failed: {e}")
                 self._cleanup()
                 return False
 
+        # action 카탈로그는 연결 시 한 번만 가져옴 (실패해도 ACTION_MAP으로 계속 동작)
+        self.refresh_action_catalogue()
+        return True
+
     def _cleanup(self):
         """정리"""
         try:
             if self.handle:
                 self.lib.destroy_arm_client(self.handle)
                 self.handle = None
+            self._catalogue = None
         except Exception as e:
-            print(f"[WARNING] Cleanup error: {e}")
+            logger.warning(f"Cleanup error: {e}")
     
     def disconnect(self):
         """로봇 연결 해제"""
         with self._lock:
             self._cleanup()
-            print("[SUCCESS] Disconnected from G1 robot")
+            logger.success("Disconnected from G1 robot")
     
     def _check_connection(self):
         """연결 상태 확인"""
@@ -182,9 +229,9 @@ class G1ArmBridge:
         Returns:
             (성공 여부, 메시지)
         """
-        self._check_connection()
-        
+        # 연결 확인도 락 안에서 (disconnect가 핸들을 해제하는 중이면 기다렸다가 거부)
         with self._lock:
+            self._check_connection()
             try:
                 result = self.lib.execute_action(self.handle, action_id)
                 
@@ -201,55 +248,187 @@ class G1ArmBridge:
         """
         이름으로 arm action 실행
         
+        카탈로그가 있으면 로봇이 지원하지 않는 action은 RPC 없이 거부한다.
+        
         Args:
             action_name: 실행할 action의 이름 (예: "wave_hand", "clap")
         
         Returns:
             (성공 여부, 메시지)
         """
-        action_id = self.ACTION_MAP.get(action_name)
+        action_id = self.resolve_action(action_name)
         if action_id is None:
-            available = ", ".join(self.ACTION_MAP.keys())
+            available = ", ".join(self.get_available_actions())
             return False, f"Unknown action '{action_name}'. Available: {available}"
         
         return self.execute_action(action_id)
+
+    def resolve_action(self, action_name: str) -> Optional[int]:
+        """Action 이름 → ID (카탈로그가 있으면 로봇이 지원하는 action만), 없으면 None"""
+        action_id = self.ACTION_MAP.get(action_name)
+        catalogue = self._catalogue
+        if catalogue is None or action_name in self.CATALOGUE_EXEMPT_ACTIONS:
+            return action_id
+        if action_name in catalogue["by_name"]:
+            return catalogue["by_name"][action_name]
+        if action_id is not None and action_id in catalogue["by_id"]:
+            return action_id
+        return None
+
+    def get_available_actions(self):
+        """실행 가능한 action 이름 목록"""
+        names = set(self.ACTION_MAP)
+        if self._catalogue:
+            names.update(self._catalogue["by_name"])
+        return sorted(name for name in names if self.resolve_action(name) is not None)
+
+    def refresh_action_catalogue(self) -> bool:
+        """로봇에서 action 목록을 가져와 카탈로그 갱신 (이름/ID 색인, ACTION_MAP 검증)"""
+        success, data = self.get_action_list()
+        if not success:
+            logger.warning(f"Action catalogue unavailable, using built-in ACTION_MAP: {data}")
+            return False
+        try:
+            by_id = _parse_action_list(data)
+        except ValueError as e:
+            logger.warning(f"Could not parse action list, using built-in ACTION_MAP: {e}")
+            return False
+
+        by_name = {name: action_id for action_id, name in by_id.items() if name}
+        self._catalogue = {"by_id": by_id, "by_name": by_name, "fetched_at": time.time()}
+
+        # ACTION_MAP과 펌웨어 목록 비교
+        for name, action_id in sorted(self.ACTION_MAP.items()):
+            if name in self.CATALOGUE_EXEMPT_ACTIONS:
+                continue
+            if name in by_name and by_name[name] != action_id:
+                logger.warning(f"ACTION_MAP mismatch: '{name}' is ID {action_id}, robot reports ID {by_name[name]}")
+            elif action_id not in by_id and name not in by_name:
+                logger.warning(f"ACTION_MAP action '{name}' (ID {action_id}) is not supported by the robot")
+        unknown = sorted(action_id for action_id in by_id if action_id not in self.ACTION_MAP.values())
+        if unknown:
+            logger.info(f"Robot supports actions not in ACTION_MAP: {unknown}")
+
+        logger.success(f"Action catalogue loaded ({len(by_id)} actions)")
+        return True
+
+    def invalidate_action_catalogue(self):
+        """카탈로그 삭제 (다음 refresh_action_catalogue() 전까지 ACTION_MAP만 사용)"""
+        self._catalogue = None
+
+    def get_action_catalogue(self) -> Optional[Dict[str, object]]:
+        """캐시된 카탈로그 {"by_id": {id: name}, "by_name": {name: id}, "fetched_at"}, 없으면 None"""
+        catalogue = self._catalogue
+        if catalogue is None:
+            return None
+        return {"by_id": dict(catalogue["by_id"]), "by_name": dict(catalogue["by_name"]),
+                "fetched_at": catalogue["fetched_at"]}
     
     def get_action_list(self) -> Tuple[bool, str]:
         """
         사용 가능한 action 목록 가져오기
         
+        get_action_list_buf가 있으면 재사용 버퍼에 직접 받아 호출마다 C 쪽 힙 할당이 없다.
+        
         Returns:
             (성공 여부, action 목록 JSON 문자열 or 에러 메시지)
         """
-        self._check_connection()
-        
         with self._lock:
+            self._check_connection()
             try:
-                result = self.lib.get_action_list(self.handle)
+                if self.has_action_list_buf:
+                    code, data = self._read_action_list_buf()
+                else:
+                    code, data = self._read_action_list_alloc()
                 
-                if result.code == 0 and result.data:
-                    data = result.data.decode('utf-8')
-                    self.lib.free_string_result(result)
+                if code == 0 and data:
                     return True, data
                 else:
-                    error_msg = self._get_error_message(result.code)
+                    error_msg = self._get_error_message(code)
                     return False, f"Failed to get action list: {error_msg}"
                     
             except Exception as e:
                 return False, f"Exception during get_action_list: {e}"
+
+    def _read_action_list_buf(self) -> Tuple[int, Optional[str]]:
+        """호출자 버퍼 API로 읽기 (버퍼가 작으면 필요한 크기로 키운 뒤 한 번 더 호출)"""
+        for _ in range(2):
+            buffer = self._action_buffer
+            code = self.lib.get_action_list_buf(self.handle, buffer, len(buffer), ctypes.byref(self._required_size))
+            if code != ARM_ERR_BUFFER_TOO_SMALL:
+                break
+            self._action_buffer = ctypes.create_string_buffer(self._required_size.value)
+        if code != 0:
+            return code, None
+        length = self._required_size.value - 1
+        return code, bytes(memoryview(buffer)[:length]).decode('utf-8')
+
+    def _read_action_list_alloc(self) -> Tuple[int, Optional[str]]:
+        """이전 API (C 쪽 malloc), 결과 코드와 무관하게 항상 해제"""
+        result = self.lib.get_action_list(self.handle)
+        try:
+            data = ctypes.string_at(result.data).decode('utf-8') if result.data else None
+            return result.code, data
+        finally:
+            if result.data:
+                self.lib.free_string_result(result)
     
     def print_available_actions(self):
         """사용 가능한 action 목록 출력"""
+        flush_logging()
         print("\n=== Available Actions ===")
-        for name, action_id in sorted(self.ACTION_MAP.items()):
-            print(f"  - {name:20s} (ID: {action_id})")
+        for name in self.get_available_actions():
+            print(f"  - {name:20s} (ID: {self.resolve_action(name)})")
         print("========================\n")
     
+    # ========== 계측 ==========
+    def get_metrics(self) -> Dict[str, dict]:
+        """SDK 함수별 호출 수, 반환 코드 분포, 지연(µs) 통계"""
+        return self.lib.get_metrics()
+
+    def get_metrics_text(self) -> str:
+        """Prometheus 텍스트 형식 메트릭"""
+        return format_prometheus({"arm": self.get_metrics()})
+
+    def reset_metrics(self):
+        """메트릭 초기화"""
+        self.lib.reset_metrics()
+
     def __del__(self):
         """소멸자"""
         self.disconnect()
 
 
+def _parse_action_list(data: str) -> Dict[int, Optional[str]]:
+    """get_action_list JSON → {action ID: 이름}
+
+    [{"id": 17, "name": "clap"}, ...], {"actions": [...]}, {"clap": 17, ...}, [17, 18, ...] 형식 지원
+    """
+    try:
+        parsed = json.loads(data)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"invalid JSON: {e}")
+    if isinstance(parsed, dict) and isinstance(parsed.get("actions"), list):
+        parsed = parsed["actions"]
+
+    actions = {}
+    if isinstance(parsed, dict):
+        for name, action_id in parsed.items():
+            if isinstance(action_id, int):
+                actions[action_id] = name
+    elif isinstance(parsed, list):
+        for item in parsed:
+            if isinstance(item, int):
+                actions[item] = None
+            elif isinstance(item, dict):
+                action_id = item.get("id", item.get("action_id"))
+                if isinstance(action_id, int):
+                    actions[action_id] = item.get("name", item.get("action_name"))
+    if not actions:
+        raise ValueError(f"no actions found in {data[:80]!r}")
+    return actions
+
+
 # ===== 사용 예제 =====
 if __name__ == "__main__":
     import time
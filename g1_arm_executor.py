@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Optional
+
+from g1_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class G1ArmExecutor:
+    """Arm action 전용 실행기 (워커 스레드 + bounded queue)
+
+    Arm action RPC는 최대 10초까지 걸릴 수 있으므로 loco 명령과 분리하여
+    별도 스레드에서 순차 실행한다. submit()은 즉시 Future를 반환하며,
+    Future의 결과는 0 (성공) 또는 -1/에러 코드 (실패)이다.
+    """
+
+    def __init__(self, arm_bridge_getter, max_pending: int = 4, bridge_wait=None):
+        # arm_bridge는 재연결 등으로 바뀔 수 있으므로 getter로 전달받음
+        self._get_arm_bridge = arm_bridge_getter
+        # 브릿지가 없을 때 호출 (재연결될 때까지 대기, 대기할 상황이 아니거나 실패하면 False)
+        self._bridge_wait = bridge_wait
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._running = False
+        self._thread = None
+        self.current_action = None
+
+    def start(self):
+        """워커 스레드 시작"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._worker_loop, name="G1ArmExecutor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """워커 스레드 종료 (대기 중인 action은 취소)"""
+        if not self._running:
+            return
+        self._running = False
+        self.cancel_pending()
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+        if self._thread:
+            self._thread.join(timeout)
+
+    def submit(self, action_name: str, command_name: Optional[str] = None) -> Future:
+        """Arm action 실행 요청 (즉시 반환)"""
+        future = Future()
+        command_name = command_name or action_name
+
+        if not self._running:
+            future.set_result(-1)
+            logger.error(f"Arm executor not running - {command_name} ignored")
+            return future
+
+        try:
+            self._queue.put_nowait((action_name, command_name, future))
+        except queue.Full:
+            future.set_result(-1)
+            logger.warning(f"Arm action queue full - {command_name} rejected")
+        return future
+
+    def cancel_pending(self) -> int:
+        """대기 중인 action 모두 취소, 취소된 개수 반환"""
+        cancelled = 0
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                continue
+            _, command_name, future = item
+            if future.cancel():
+                cancelled += 1
+                logger.control(f"{command_name} cancelled")
+        return cancelled
+
+    def pending_count(self) -> int:
+        """대기 중인 action 개수"""
+        return self._queue.qsize()
+
+    def _worker_loop(self):
+        """Action을 하나씩 꺼내 실행"""
+        while self._running:
+            item = self._queue.get()
+            if item is None:
+                continue
+
+            action_name, command_name, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            self.current_action = action_name
+            try:
+                future.set_result(self._execute(action_name, command_name))
+            except Exception as e:
+                logger.error(f"{command_name} failed: {e}")
+                future.set_result(-1)
+            finally:
+                self.current_action = None
+
+    def _execute(self, action_name: str, command_name: str) -> int:
+        """Arm Bridge를 통해 실제 action 실행"""
+        arm_bridge = self._get_arm_bridge()
+        if not arm_bridge and self._bridge_wait and self._bridge_wait():
+            arm_bridge = self._get_arm_bridge()
+        if not arm_bridge:
+            logger.error(f"No Arm Bridge connection - {command_name} ignored")
+            return -1
+
+        success, msg = arm_bridge.execute_action_by_name(action_name)
+        logger.control(f"{command_name} - {msg}")
+        return 0 if success else -1
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from g1_logger import get_logger
+
+logger = get_logger(__name__)
+
+# 일반 executor를 거치지 않는 우선순위 명령 (다른 호출이 밀려 있어도 즉시 실행)
+PRIORITY_METHODS = ("stop", "emergency_stop", "damp")
+
+
+class AsyncG1Controller:
+    """G1SubController asyncio 파사드
+
+    - sub_controller의 공개 메소드(move_*, set_*, get_*, arm_*, 자세 제어 등)를 같은 이름의
+      코루틴으로 제공한다: await controller.move_forward(timeout=1.0)
+    - 동기 호출은 크기가 제한된 스레드 풀에서 실행되고, 동시에 진행 중인 호출 수는
+      max_pending으로 제한된다 (초과 시 이벤트 루프를 막지 않고 대기)
+    - 호출마다 timeout 지정 가능 (초과 시 asyncio.TimeoutError), 취소 시 아직 시작되지 않은
+      호출은 실행되지 않는다 (이미 시작된 SDK 호출은 끝까지 실행됨)
+    - 같은 인자의 get_* 호출이 동시에 여러 개 들어오면 한 번만 실행하고 결과를 공유
+    - stop/emergency_stop/damp는 전용 스레드에서 대기 없이 실행
+    """
+
+    def __init__(self, sub_controller, base_controller=None, max_workers: int = 4,
+                 max_pending: int = 32, default_timeout: Optional[float] = 10.0):
+        self.sub_controller = sub_controller
+        self.base_controller = base_controller
+        self.max_pending = max_pending
+        self.default_timeout = default_timeout
+
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="G1Async")
+        self._priority_executor = ThreadPoolExecutor(1, thread_name_prefix="G1AsyncPriority")
+        self._message_executor = ThreadPoolExecutor(1, thread_name_prefix="G1AsyncMessage")  # 메시지 순서 유지
+        self._semaphore = None  # 이벤트 루프에서 처음 사용할 때 생성
+        self._inflight = {}     # get_* single-flight: (name, args) → asyncio.Task
+
+        self._stats = {"calls": 0, "shared": 0, "timeouts": 0, "cancelled": 0, "errors": 0}
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = getattr(self.sub_controller, name)
+        if not callable(method):
+            raise AttributeError(f"'{type(self.sub_controller).__name__}.{name}' is not callable")
+        if name.startswith("get_"):
+            return functools.partial(self._get, name)
+        return functools.partial(self.call, name)
+
+    async def call(self, method_name: str, *args, timeout: Optional[float] = None, **kwargs):
+        """sub_controller.method_name(*args, **kwargs)을 스레드 풀에서 실행하고 결과 반환"""
+        func = functools.partial(getattr(self.sub_controller, method_name), *args, **kwargs)
+        if method_name in PRIORITY_METHODS:
+            return await self._await(self._run_priority(func), method_name, timeout)
+        return await self._await(self._run(func), method_name, timeout)
+
+    async def _get(self, method_name: str, *args, timeout: Optional[float] = None, **kwargs):
+        """get_* 호출 (동일 인자의 동시 호출은 하나의 실행을 공유)"""
+        key = (method_name, args, tuple(sorted(kwargs.items())))
+        task = self._inflight.get(key)
+        if task is None:
+            func = functools.partial(getattr(self.sub_controller, method_name), *args, **kwargs)
+            task = asyncio.ensure_future(self._run(func))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self._stats["shared"] += 1
+        # 한 호출자의 timeout/취소가 공유 중인 실행을 취소하지 않도록 shield
+        return await self._await(asyncio.shield(task), method_name, timeout)
+
+    async def arm_action(self, action_name: str, timeout: Optional[float] = None) -> int:
+        """Arm action 실행 완료까지 대기 (0 = 성공), 취소 시 대기 중인 action은 실행되지 않음"""
+        future = self.sub_controller.arm_action_async(action_name)
+        return await self._await(asyncio.wrap_future(future), f"arm_action({action_name})", timeout)
+
+    async def handle_message(self, message, timeout: Optional[float] = None):
+        """base_controller.receive_message를 이벤트 루프 밖에서 실행 (수신 순서 유지)"""
+        if not self.base_controller:
+            raise RuntimeError("base_controller is not set")
+        loop = asyncio.get_running_loop()
+        func = functools.partial(self.base_controller.receive_message, message)
+        return await self._await(loop.run_in_executor(self._message_executor, func), "receive_message", timeout)
+
+    async def _run(self, func):
+        """동시 실행 수 제한 후 스레드 풀에서 실행"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func)
+
+    async def _run_priority(self, func):
+        return await asyncio.get_running_loop().run_in_executor(self._priority_executor, func)
+
+    async def _await(self, awaitable, name: str, timeout: Optional[float]):
+        """timeout/취소/예외 집계"""
+        timeout = self.default_timeout if timeout is None else timeout
+        self._stats["calls"] += 1
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError:
+            self._stats["timeouts"] += 1
+            logger.warning(f"{name} timed out after {timeout} s")
+            raise
+        except asyncio.CancelledError:
+            self._stats["cancelled"] += 1
+            raise
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.error(f"{name} failed: {e}")
+            raise
+
+    def get_stats(self):
+        """호출 통계 (shared: single-flight로 합쳐진 get_* 호출 수)"""
+        stats = dict(self._stats)
+        stats["inflight_gets"] = len(self._inflight)
+        return stats
+
+    def close(self):
+        """스레드 풀 종료 (시작되지 않은 호출은 취소)"""
+        for executor in (self._executor, self._priority_executor, self._message_executor):
+            executor.shutdown(wait=False, cancel_futures=True)
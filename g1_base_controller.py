@@ -1,10 +1,20 @@
 from pubsub import pub
+import functools
 import os, sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(sys.executable), "../..")))
 
 from gerri.robot.examples.unitree_g1.g1_sub_controller import G1SubController
 from gerri.robot.status_manager import StatusManager
+from g1_analog_control import G1AnalogMapper, G1RateLimiter
+from g1_joy_dispatch import G1JoyDispatcher
+from g1_dispatch_queue import G1DispatchQueue
+from g1_outbound_batcher import G1OutboundBatcher
+from g1_topic_router import G1TopicRouter
+from g1_cmd_vel import G1CmdVelHandler
+from g1_logger import get_logger, flush_logging
+
+logger = get_logger(__name__)
 
 
 class G1BaseController:
@@ -19,6 +29,75 @@ class G1BaseController:
             self.sub_controller.base_controller = self
         pub.subscribe(self.receive_message, "receive_message")
 
+        # 속도 스트리밍 모드: 조이스틱 입력은 목표 속도만 갱신, 전송은 고정 주기 스레드가 담당
+        self.velocity_streaming = params.get('velocity_streaming', False)
+        self.stream_rate_hz = params.get('stream_rate_hz', 50.0)
+
+        # 아날로그 제어 모드: 스틱 기울기에 비례한 속도 (스트리밍 모드 필요)
+        self.analog_control = params.get('analog_control', False)
+        self.analog_mapper = None
+        self.rate_limiter = None
+        if self.analog_control:
+            self.velocity_streaming = True
+            self.analog_mapper = G1AnalogMapper(
+                axes=params.get('analog_axes'),
+                deadzone=params.get('analog_deadzone', 0.1),
+                expo=params.get('analog_expo', 0.5),
+                limits=params.get('analog_limits', {"vx": 0.6, "vy": 0.4, "vyaw": 1.0}),
+            )
+            accel_limits = params.get('accel_limits')
+            if accel_limits:
+                self.rate_limiter = G1RateLimiter(accel_limits, params.get('jerk_limits'))
+
+        # 수신 메시지 디스패치 큐: receive_message는 큐에 넣고 즉시 반환, 처리는 워커 스레드
+        # (dispatch_workers=0이면 기존처럼 pubsub 콜백 안에서 동기 처리)
+        self.dispatch_queue = None
+        if params.get('dispatch_workers', 2) > 0:
+            self.dispatch_queue = G1DispatchQueue(
+                self._process_message,
+                workers=params.get('dispatch_workers', 2),
+                max_pending=params.get('dispatch_max_pending', 64),
+                overflow=params.get('dispatch_overflow', 'drop_oldest'),
+                overflow_policies=params.get('dispatch_overflow_policies'),
+                # 매칭되는 joy 매핑이 바뀐 프레임(버튼 눌림/뗌 등)은 overflow 시에도 버리지 않음
+                edge_keys={'/joy': lambda message: self._find_joy_mapping(message['value'])},
+            )
+
+        # 송신 묶음 전송: /joy 외 토픽의 callback/echo 메시지를 window 동안 모아 한 번에 전송
+        # (outbound_batch_topics가 None이면 /joy를 제외한 모든 토픽, window 0이면 비활성)
+        self.outbound_batcher = None
+        self.outbound_batch_topics = params.get('outbound_batch_topics')
+        if params.get('outbound_batch_window', 0.05) > 0:
+            self.outbound_batcher = G1OutboundBatcher(
+                lambda message: pub.sendMessage('send_message', message=message),
+                window=params.get('outbound_batch_window', 0.05),
+                max_batch=params.get('outbound_max_batch', 64),
+                dedupe=params.get('outbound_dedupe', True),
+            )
+
+        # 토픽 라우터: 토픽별 핸들러 등록 (/joy는 조이스틱 매핑, 등록되지 않은 토픽은 callback 응답)
+        self.topic_router = G1TopicRouter(async_workers=params.get('router_async_workers', 1))
+        self.topic_router.register('/joy', self._on_joy)
+        self.topic_router.set_default(self._on_callback_topic)
+
+        # 숫자 속도 명령 토픽 (/cmd_vel): 조이스틱 매핑 없이 속도 목표 직접 갱신
+        self.cmd_vel = None
+        cmd_vel_topic = params.get('cmd_vel_topic', '/cmd_vel')
+        if cmd_vel_topic and self.sub_controller:
+            # 결과를 기다리지 않음 (스트리밍이 꺼져 있어도 디스패치 워커가 move RPC에 묶이지 않도록)
+            self.cmd_vel = G1CmdVelHandler(
+                functools.partial(self.sub_controller.set_velocity_target, wait=False),
+                limits=params.get('cmd_vel_limits', params.get('analog_limits')),
+                timeout=params.get('cmd_vel_timeout', 0.5),
+                stamp_reset=params.get('cmd_vel_stamp_reset', 1.0),
+            )
+            self.topic_router.register(cmd_vel_topic, self.cmd_vel.handle)
+
+        # 이름으로 실행할 arm action 시퀀스 (/choreography 토픽, value: 이름 또는 "cancel")
+        self.choreographies = params.get('choreographies', {})
+        if self.choreographies and self.sub_controller:
+            self.topic_router.register('/choreography', self._on_choreography)
+
         # 키 매핑 테이블 
         self.joy_mapping = {
             # ========== 기본 이동 (axes) - 필수 ==========
@@ -30,7 +109,7 @@ class G1BaseController:
             # ========== 회전 및 정지 (buttons) - 필수 ==========
             ('buttons', 1, 1): ('Turn Right #e', lambda: self.sub_controller.turn_right()),
             ('buttons', 2, 1): ('Turn Left #q', lambda: self.sub_controller.turn_left()),
-            ('buttons', 3, 1): ('Stop Motion #r', lambda: self.sub_controller.stop()),
+            ('buttons', 3, 1): ('Stop Motion #r', lambda: self.sub_controller.emergency_stop()),
             
             # ========== 자세 제어 (buttons) - 필수 ==========
             ('buttons', 4, 1): ('Sit Down #z', lambda: self.sub_controller.sit_down()),
@@ -87,66 +166,176 @@ class G1BaseController:
 
         }
 
-        print(f"[INFO] G1BaseController initialized with {len(self.joy_mapping)} key mappings")
+        # 스트리밍 모드에서 이동 매핑이 사용하는 방향 (vx, vy, vyaw 부호)
+        self.motion_directions = {
+            ('axes', 1, 1): (-1, 0, 0),
+            ('axes', 1, -1): (1, 0, 0),
+            ('axes', 0, 1): (0, -1, 0),
+            ('axes', 0, -1): (0, 1, 0),
+            ('buttons', 1, 1): (0, 0, -1),
+            ('buttons', 2, 1): (0, 0, 1),
+        }
+
+        # 레벨 트리거 매핑: 입력이 유지되는 동안 매 프레임 실행 (이동, 입력 없음 → 정지)
+        # 정지 fallback(None)도 매 프레임 다시 보내야 전송이 실패/선점되어도 다음 프레임에서 재시도됨
+        # 그 외 매핑 (정지, 자세, FSM, arm 동작)은 엣지 트리거:
+        # 매핑된 버튼/축 자체가 0→1로 바뀐 프레임에서만 실행하고 유지 프레임은 무시
+        # (우선순위가 높은 버튼을 떼서 매칭이 바뀌어도, 계속 눌려 있던 입력은 다시 실행하지 않음)
+        self.level_triggered_keys = set(self.motion_directions) | {None}
+
+        # 매핑을 한 번만 컴파일 (메시지마다 선형 탐색하지 않음)
+        self._last_joy_key = None
+        self._last_joy_inputs = {'axes': (), 'buttons': ()}  # 입력별 엣지 검출용 직전 프레임
+        self.joy_dispatcher = G1JoyDispatcher(self.joy_mapping, self._analog_axis_indices())
+
+        logger.info(f"G1BaseController initialized with {len(self.joy_mapping)} key mappings")
 
     def receive_message(self, message):
-        if 'topic' in message:
-            topic = message['topic']
-            value = message['value']
+        """pubsub 수신 콜백 - 디스패치 큐에 넣고 즉시 반환 (큐가 없거나 시작 전이면 동기 처리)"""
+        if self.dispatch_queue and self.dispatch_queue.is_running():
+            self.dispatch_queue.submit(message.get('topic'), message)
+            return
+        self._process_message(message)
 
-            try:
-                if topic == '/joy':
-                    self._handle_joy_input(value)
-                else:
-                    self.send_message({'topic': 'callback_' + topic, 'value': 'callback_' + value, 'target': 'all'})
-            except AttributeError as e:
-                print(f"[ERROR] Controller does not support topic '{topic}': {e}")
-            except Exception as e:
-                print(f"[ERROR] Error processing topic '{topic}': {e}")
-        
-        pub.sendMessage('send_message', message=message)
+    def _process_message(self, message):
+        """메시지 처리 (토픽 라우터로 핸들러 실행 후 send_message로 재전송)"""
+        topic = message.get('topic')
+        if topic is not None:
+            self.topic_router.dispatch(topic, message)
+        self._send_outbound(message, self._is_batched_topic(topic))
+
+    def register_topic_handler(self, topic, handler, prefix=False, is_async=False, priority=0):
+        """토픽 핸들러 등록 (handler(message), prefix=True면 topic으로 시작하는 모든 토픽)"""
+        return self.topic_router.register(topic, handler, prefix=prefix, is_async=is_async, priority=priority)
+
+    def _on_joy(self, message):
+        self._handle_joy_input(message['value'])
+
+    def _on_choreography(self, message):
+        name = message['value']
+        if name == 'cancel':
+            self.sub_controller.cancel_choreography()
+        elif name in self.choreographies:
+            self.sub_controller.run_choreography(self.choreographies[name], name)
+        else:
+            logger.warning(f"Unknown choreography: {name}")
+
+    def _on_callback_topic(self, message):
+        """등록된 핸들러가 없는 토픽: callback 응답 전송"""
+        topic = message['topic']
+        callback = {'topic': 'callback_' + topic, 'value': 'callback_' + message['value'], 'target': 'all'}
+        self._send_outbound(callback, self._is_batched_topic(topic))
+
+    def _is_batched_topic(self, topic):
+        """이 토픽의 callback/echo를 묶음 전송할지 여부"""
+        if not self.outbound_batcher or not self.outbound_batcher.is_running() or topic == '/joy':
+            return False
+        return self.outbound_batch_topics is None or topic in self.outbound_batch_topics
+
+    def _send_outbound(self, message, batched):
+        if batched:
+            self.outbound_batcher.add(message)
+        else:
+            self.send_message(message)
 
     def _handle_joy_input(self, joy_data):
         """Joy 입력 처리 - 딕셔너리 매핑 사용"""
-        command_executed = False
-        
         try:
-            # 모든 매핑을 확인
-            for (input_type, index, expected_value), (description, action) in self.joy_mapping.items():
-                try:
-                    if input_type == 'axes':
-                        if len(joy_data.get('axes', [])) > index and joy_data['axes'][index] == expected_value:
-                            print(f"[CONTROL] {description}")
-                            result = action()
-                            if result != 0 and result != -1:
-                                print(f"[INFO] Command result: {result}")
-                            command_executed = True
-                            break
-                    elif input_type == 'buttons':
-                        if len(joy_data.get('buttons', [])) > index and joy_data['buttons'][index] == expected_value:
-                            print(f"[CONTROL] {description}")
-                            result = action()
-                            if result != 0 and result != -1:
-                                print(f"[INFO] Command result: {result}")
-                            command_executed = True
-                            break
-                except (IndexError, KeyError, TypeError) as e:
-                    print(f"[WARNING] Error accessing joy input {input_type}[{index}]: {e}")
-                    continue
-            
-            # 아무 명령도 실행되지 않았으면 정지
-            if not command_executed:
-                print('[CONTROL] No mapping found - stopping robot')
+            recorder = self.sub_controller.flight_recorder if self.sub_controller else None
+            if recorder:
+                recorder.record_joy(joy_data)
+
+            matched_key = self._find_joy_mapping(joy_data)
+            is_motion = matched_key is None or matched_key in self.motion_directions
+
+            # 직전 프레임과 매핑이 달라졌는지 (엣지 검출)
+            key_changed = matched_key != self._last_joy_key
+            self._last_joy_key = matched_key
+            input_pressed = self._is_input_edge(matched_key, joy_data)
+
+            # 아날로그 모드: 스틱 값으로 목표 속도 갱신, 이동 외 매핑만 추가 실행
+            if self.analog_control:
+                self._update_analog_target(joy_data, matched_key)
+                if is_motion:
+                    return
+
+            # 스트리밍 모드: 이동은 목표 속도만 갱신 (RPC 없음)
+            elif self.velocity_streaming and is_motion:
+                self._update_velocity_target(matched_key)
+                return
+
+            # 엣지 트리거 매핑은 해당 입력이 새로 눌린 프레임에서만 실행
+            if matched_key not in self.level_triggered_keys and not input_pressed:
+                return
+
+            # 아무 명령도 매칭되지 않았으면 정지
+            if matched_key is None:
+                if key_changed:
+                    logger.control('No mapping found - stopping robot')
                 self.sub_controller.set_velocity(0, 0, 0, 0)
-                
+                return
+
+            description, action = self.joy_mapping[matched_key]
+            if key_changed:
+                logger.control(f"{description}")
+            result = action()
+            if result != 0 and result != -1:
+                logger.info(f"Command result: {result}")
+
         except Exception as e:
-            print(f"[ERROR] Joy input processing failed: {e}")
+            logger.error(f"Joy input processing failed: {e}")
             # 안전을 위해 정지
             try:
-                self.sub_controller.stop()
+                self.sub_controller.emergency_stop()
             except:
                 pass
 
+    def _is_input_edge(self, matched_key, joy_data):
+        """매칭된 키의 입력(버튼/축)이 직전 프레임에는 기대값이 아니었는지 (입력별 0→1 전이)"""
+        previous = self._last_joy_inputs
+        self._last_joy_inputs = {
+            'axes': tuple(joy_data.get('axes') or ()),
+            'buttons': tuple(joy_data.get('buttons') or ()),
+        }
+        if matched_key is None:
+            return False
+        input_type, index, expected_value = matched_key
+        values = previous.get(input_type, ())
+        return index >= len(values) or values[index] != expected_value
+
+    def _find_joy_mapping(self, joy_data):
+        """joy 입력과 일치하는 첫 번째 매핑 키 반환 (없으면 None)"""
+        return self.joy_dispatcher.resolve(joy_data)
+
+    def _analog_axis_indices(self):
+        """아날로그 제어에 쓰이는 축 (이산 매핑에서 제외)"""
+        return self.analog_mapper.axis_indices if self.analog_mapper else ()
+
+    def recompile_joy_mapping(self):
+        """joy_mapping 변경 후 디스패치 테이블 재생성"""
+        self.joy_dispatcher.compile(self.joy_mapping, self._analog_axis_indices())
+
+    def _update_velocity_target(self, matched_key):
+        """스트리밍 목표 속도 갱신"""
+        if matched_key is None:
+            self.sub_controller.set_velocity_target(0.0, 0.0, 0.0)
+            return
+
+        sx, sy, syaw = self.motion_directions[matched_key]
+        linear = self.sub_controller.default_velocity
+        angular = self.sub_controller.default_angular_velocity
+        self.sub_controller.set_velocity_target(sx * linear, sy * linear, syaw * angular)
+
+    def _update_analog_target(self, joy_data, matched_key):
+        """아날로그 스틱 값 (+ 회전 버튼)으로 목표 속도 갱신"""
+        vx, vy, vyaw = self.analog_mapper.map(joy_data.get('axes', []))
+        if matched_key in self.motion_directions:
+            sx, sy, syaw = self.motion_directions[matched_key]
+            vx += sx * self.sub_controller.default_velocity
+            vy += sy * self.sub_controller.default_velocity
+            vyaw += syaw * self.sub_controller.default_angular_velocity
+        self.sub_controller.set_velocity_target(vx, vy, vyaw)
+
     def send_message(self, message):
         """메시지 전송"""
         pub.sendMessage('send_message', message=message)
@@ -155,24 +344,42 @@ class G1BaseController:
         """연결 설정"""
         if self.sub_controller:
             self.sub_controller.connect()
+
+            if self.dispatch_queue:
+                self.dispatch_queue.start()
+            if self.outbound_batcher:
+                self.outbound_batcher.start()
+            self.topic_router.start()
+            if self.cmd_vel:
+                self.cmd_vel.start()
+
+            if self.velocity_streaming:
+                self.sub_controller.start_velocity_stream(self.stream_rate_hz, shaper=self.rate_limiter)
             
             # StatusManager 초기화
             try:
                 self.status_manager = StatusManager(self.robot_info, self.sub_controller)
-                print("[SUCCESS] StatusManager initialized")
+                logger.success("StatusManager initialized")
             except Exception as e:
-                print(f"[WARNING] StatusManager initialization failed: {e}")
-                print("[INFO] Continuing without StatusManager")
+                logger.warning(f"StatusManager initialization failed: {e}")
+                logger.info("Continuing without StatusManager")
             
-            print("[SUCCESS] G1BaseController connected")
+            logger.success("G1BaseController connected")
         else:
-            print("[ERROR] No sub_controller available for connection")
+            logger.error("No sub_controller available for connection")
 
     def disconnect(self):
         """연결 해제"""
+        if self.dispatch_queue:
+            self.dispatch_queue.stop()
+        if self.outbound_batcher:
+            self.outbound_batcher.stop()
+        self.topic_router.stop()
+        if self.cmd_vel:
+            self.cmd_vel.stop()
         if self.sub_controller:
             self.sub_controller.disconnect()
-            print("[SUCCESS] G1BaseController disconnected")
+            logger.success("G1BaseController disconnected")
 
     def get_robot_status(self):
         """로봇 상태 조회"""
@@ -181,20 +388,43 @@ class G1BaseController:
         return None
 
     def get_fsm_status(self):
-        """FSM 상태 조회"""
+        """FSM 상태 조회 (상태 캐시 사용, age: 값의 경과 시간 초)"""
         if self.sub_controller:
             code, fsm_id = self.sub_controller.get_fsm_id()
-            return {"code": code, "fsm_id": fsm_id}
-        return {"code": -1, "fsm_id": 0}
+            return {"code": code, "fsm_id": fsm_id, "age": self.sub_controller.get_state_age("fsm_id")}
+        return {"code": -1, "fsm_id": 0, "age": None}
 
     def emergency_stop(self):
-        """긴급 정지"""
+        """긴급 정지 (우선순위 레인)"""
         if self.sub_controller:
-            return self.sub_controller.stop()
+            return self.sub_controller.emergency_stop()
         return -1
 
+    def get_dispatch_stats(self):
+        """수신 메시지 디스패치 큐 통계"""
+        return self.dispatch_queue.get_stats() if self.dispatch_queue else None
+
+    def get_topic_stats(self):
+        """토픽별 핸들러 처리 수, 처리율, 지연 통계"""
+        return self.topic_router.get_stats()
+
+    def get_cmd_vel_stats(self):
+        """/cmd_vel 처리 통계"""
+        return self.cmd_vel.get_stats() if self.cmd_vel else None
+
+    def get_outbound_stats(self):
+        """송신 묶음 전송 통계"""
+        return self.outbound_batcher.get_stats() if self.outbound_batcher else None
+
+    def get_stop_metrics(self):
+        """정지 지연 시간 통계 조회"""
+        if self.sub_controller:
+            return self.sub_controller.get_stop_metrics()
+        return {}
+
     def print_key_mappings(self):
         """키 매핑 정보 출력 (디버깅용)"""
+        flush_logging()
         print("\n[INFO] Available Key Mappings:")
         print("=" * 50)
         for (input_type, index, value), (description, _) in self.joy_mapping.items():
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""G1 제어 경로 벤치마크
+
+사용법:
+    python3 g1_benchmark.py dispatch [--rates 100 250 500 1000] [--duration 5] [--json out.json]
+    python3 g1_benchmark.py e2e [--rates 10 50 100 250] [--duration 5] [--streaming] [--json out.json]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(sys.executable), "../..")))
+
+from g1_joy_dispatch import G1JoyDispatcher
+from g1_logger import configure_logging, flush_logging
+
+DEFAULT_RATES = (100, 250, 500, 1000)
+DEFAULT_E2E_RATES = (10, 50, 100, 250)
+
+
+def _percentile(sorted_values, pct):
+    """정렬된 리스트의 백분위수"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _load_joy_mapping():
+    """G1BaseController의 실제 joy_mapping 로드 (sub_controller 없이 생성)"""
+    from gerri.robot.examples.unitree_g1.g1_base_controller import G1BaseController
+    robot_info = {"id": "benchmark", "model": "unitree_g1", "category": "sample"}
+    joy_mapping = G1BaseController(robot_info).joy_mapping
+    flush_logging()
+    return joy_mapping
+
+
+def _make_joy_frames(rate_hz, duration, change_interval=0.1, seed=0):
+    """rate_hz로 들어오는 합성 /joy 스트림 (change_interval마다 입력 상태 변경)"""
+    rng = random.Random(seed)
+    states = [
+        ([0.0] * 4, [0] * 16),                         # 입력 없음
+        ([0.0, -1.0, 0.0, 0.0], [0] * 16),             # 전진
+        ([-1.0, 0.0, 0.0, 0.0], [0] * 16),             # 좌측 이동
+        ([0.0] * 4, [0, 1] + [0] * 14),                # 우회전
+        ([0.0] * 4, [0] * 8 + [1] + [0] * 7),          # FSM 500
+        ([0.0] * 4, [0] * 15 + [1]),                   # 하이파이브 (마지막 버튼)
+        ([0.0, 0.0, 0.0, -1.0], [0] * 16),             # X-ray (마지막 축)
+        ([0.3, -0.6, 0.0, 0.0], [0] * 16),             # 아날로그 기울기 (매핑 없음)
+    ]
+    frames = []
+    per_state = max(1, int(rate_hz * change_interval))
+    for _ in range(max(1, int(rate_hz * duration / per_state))):
+        axes, buttons = rng.choice(states)
+        for _ in range(per_state):
+            # 실제 /joy 메시지처럼 매번 새 리스트로 전달
+            frames.append({'axes': list(axes), 'buttons': list(buttons)})
+    return frames
+
+
+def legacy_find(joy_mapping, joy_data):
+    """기존 _handle_joy_input의 선형 탐색 (비교 기준)"""
+    for (input_type, index, expected_value), _ in joy_mapping.items():
+        try:
+            if input_type == 'axes':
+                if len(joy_data.get('axes', [])) > index and joy_data['axes'][index] == expected_value:
+                    return (input_type, index, expected_value)
+            elif input_type == 'buttons':
+                if len(joy_data.get('buttons', [])) > index and joy_data['buttons'][index] == expected_value:
+                    return (input_type, index, expected_value)
+        except (IndexError, KeyError, TypeError):
+            continue
+    return None
+
+
+def _time_per_message(resolve, frames):
+    """메시지당 처리 시간 (ns): 평균, p50, p99, max"""
+    perf = time.perf_counter_ns
+    samples = []
+    for frame in frames:
+        start = perf()
+        resolve(frame)
+        samples.append(perf() - start)
+    samples.sort()
+    return {
+        "mean_ns": sum(samples) / len(samples),
+        "p50_ns": _percentile(samples, 50),
+        "p99_ns": _percentile(samples, 99),
+        "max_ns": samples[-1],
+    }
+
+
+def bench_dispatch(args):
+    """joy 디스패치 비용: 기존 선형 탐색 vs 사전 컴파일 테이블"""
+    joy_mapping = _load_joy_mapping()
+    results = []
+
+    for rate in args.rates:
+        frames = _make_joy_frames(rate, args.duration)
+
+        # 결과 일치 확인
+        dispatcher = G1JoyDispatcher(joy_mapping)
+        for frame in frames:
+            assert dispatcher.resolve(frame) == legacy_find(joy_mapping, frame), frame
+
+        before = _time_per_message(lambda frame: legacy_find(joy_mapping, frame), frames)
+        dispatcher = G1JoyDispatcher(joy_mapping)
+        after = _time_per_message(dispatcher.resolve, frames)
+
+        result = {
+            "rate_hz": rate,
+            "messages": len(frames),
+            "before": before,
+            "after": after,
+            "speedup": before["mean_ns"] / after["mean_ns"] if after["mean_ns"] else 0.0,
+            # 1초 동안 디스패치에 쓰는 CPU 비율 (%)
+            "cpu_before_pct": before["mean_ns"] * rate / 1e7,
+            "cpu_after_pct": after["mean_ns"] * rate / 1e7,
+            "cache_hit_ratio": dispatcher.cache_hits / len(frames),
+        }
+        results.append(result)
+
+        print(f"{rate:5d} Hz | before {before['mean_ns']:8.0f} ns (p99 {before['p99_ns']:6.0f})"
+              f" | after {after['mean_ns']:8.0f} ns (p99 {after['p99_ns']:6.0f})"
+              f" | x{result['speedup']:.1f} | cache hit {result['cache_hit_ratio']:.0%}")
+
+    return {"benchmark": "dispatch", "mappings": len(joy_mapping), "results": results}
+
+
+class _LocoCallProbe:
+    """loco 명령 큐에 제출되는 명령에 /joy 메시지 번호를 붙여 SDK 호출 시각을 기록
+
+    제출 시점의 마지막 수신 메시지를 해당 명령의 원인으로 본다.
+    (직접 모드에서는 receive_message 안에서 제출되므로 정확히 그 메시지,
+    스트리밍 모드에서는 스트리머가 전송할 때 반영된 최신 메시지)
+    """
+
+    def __init__(self, loco_queue):
+        self.lock = threading.Lock()
+        self.last_seq = -1
+        self.receive_times = {}
+        self.calls = []  # (seq, receive→SDK 호출 ns, RPC 소요 ns, 반환 코드)
+
+        self._submit = loco_queue.submit
+        loco_queue.submit = self.submit
+
+    def mark_received(self, seq, timestamp_ns):
+        with self.lock:
+            self.receive_times[seq] = timestamp_ns
+            self.last_seq = seq
+
+    def submit(self, command_func, command_name, *args, **kwargs):
+        seq = self.last_seq
+
+        def probed():
+            start = time.perf_counter_ns()
+            result = command_func()
+            end = time.perf_counter_ns()
+            received = self.receive_times.get(seq)
+            if received is not None:
+                with self.lock:
+                    self.calls.append((seq, start - received, end - start, result))
+            return result
+
+        return self._submit(probed, command_name, *args, **kwargs)
+
+
+def _create_sim_controller(args):
+    """시뮬레이션 백엔드에 연결된 G1BaseController (FSM 500에서 시작)"""
+    from gerri.robot.examples.unitree_g1.g1_base_controller import G1BaseController
+    from gerri.robot.examples.unitree_g1.g1_sub_controller import G1SubController
+    from g1_sim_backend import G1SimBackend
+
+    sim = G1SimBackend()
+    sim.set_seed(0)
+    sim.configure(args.sim_latency_ms, args.sim_jitter_ms, 0.0)
+
+    robot_info = {"id": "benchmark", "model": "unitree_g1", "category": "sample"}
+    robot = G1BaseController(robot_info, sub_controller=G1SubController(backend="sim"),
+                             velocity_streaming=args.streaming, stream_rate_hz=args.stream_rate,
+                             dispatch_workers=args.dispatch_workers)
+    robot.connect()
+    sim.reset(500)
+    return robot, sim
+
+
+def _run_e2e_rate(robot, rate, duration, late_ms):
+    """rate Hz로 /joy 메시지를 보내고 메시지→SDK 호출 지연 측정"""
+    sub = robot.sub_controller
+    probe = _LocoCallProbe(sub.loco_queue)
+    stats_before = sub.get_loco_queue_stats()
+    dispatch_before = robot.get_dispatch_stats()
+    frames = _make_joy_frames(rate, duration)
+
+    period_ns = int(1e9 / rate)
+    perf = time.perf_counter_ns
+    handler_ns = []
+    max_send_lag_ns = 0
+
+    start = perf()
+    deadline = start
+    for seq, frame in enumerate(frames):
+        now = perf()
+        if deadline > now:
+            time.sleep((deadline - now) / 1e9)
+        sent = perf()
+        max_send_lag_ns = max(max_send_lag_ns, sent - deadline)
+
+        probe.mark_received(seq, sent)
+        robot.receive_message({'topic': '/joy', 'value': frame})
+        handler_ns.append(perf() - sent)
+        deadline += period_ns
+    elapsed = max(perf() - start, deadline - start) / 1e9
+
+    # 남은 명령 실행 대기 후 측정 해제
+    time.sleep(0.2)
+    sub.loco_queue.submit = probe._submit
+    stats_after = sub.get_loco_queue_stats()
+    dispatch_after = robot.get_dispatch_stats()
+    dispatch_dropped = dispatch_after["dropped"] - dispatch_before["dropped"] if dispatch_after else 0
+
+    latencies = sorted(call[1] / 1e6 for call in probe.calls)
+    rpc_times = sorted(call[2] / 1e6 for call in probe.calls)
+    handler_ms = sorted(value / 1e6 for value in handler_ns)
+    delta = {key: stats_after[key] - stats_before[key]
+             for key in ("submitted", "executed", "dropped", "rejected", "preempted")}
+
+    return {
+        "rate_hz": rate,
+        "messages": len(frames),
+        "throughput_hz": len(frames) / elapsed if elapsed else 0.0,
+        "max_send_lag_ms": max_send_lag_ns / 1e6,
+        "sdk_calls": len(probe.calls),
+        "latency_ms": {
+            "p50": _percentile(latencies, 50),
+            "p99": _percentile(latencies, 99),
+            "max": latencies[-1] if latencies else 0.0,
+        },
+        "rpc_ms": {"p50": _percentile(rpc_times, 50), "p99": _percentile(rpc_times, 99)},
+        "handler_ms": {"p50": _percentile(handler_ms, 50), "p99": _percentile(handler_ms, 99),
+                       "max": handler_ms[-1] if handler_ms else 0.0},
+        "commands": delta,
+        "dispatch_dropped": dispatch_dropped,
+        "dropped": delta["dropped"] + delta["rejected"] + delta["preempted"] + dispatch_dropped,
+        "late": sum(1 for value in latencies if value > late_ms),
+        "failed": sum(1 for call in probe.calls if call[3] != 0),
+    }
+
+
+def bench_e2e(args):
+    """/joy 메시지 → receive_message → G1SubController → G1LocoBridge 호출까지의 지연 (시뮬레이션 백엔드)"""
+    # 컨트롤러 로그는 측정 결과 출력과 섞이지 않도록 버림 (로그 큐 적재 비용은 측정에 포함)
+    with open(os.devnull, "w") as devnull:
+        configure_logging(stream=devnull)
+        try:
+            robot, sim = _create_sim_controller(args)
+            results = []
+            try:
+                for rate in args.rates:
+                    sim.reset(500)
+                    result = _run_e2e_rate(robot, rate, args.duration, args.late_ms)
+                    results.append(result)
+
+                    latency = result["latency_ms"]
+                    print(f"{rate:5d} Hz | {result['throughput_hz']:7.1f} msg/s"
+                          f" | p50 {latency['p50']:7.2f} ms | p99 {latency['p99']:7.2f} ms | max {latency['max']:7.2f} ms"
+                          f" | calls {result['sdk_calls']:5d} | dropped {result['dropped']:5d} | late {result['late']:5d}")
+            finally:
+                robot.sub_controller.disconnect()
+        finally:
+            flush_logging()
+            configure_logging(stream=sys.stdout)
+
+    return {
+        "benchmark": "e2e",
+        "mode": "streaming" if args.streaming else "direct",
+        "dispatch_workers": args.dispatch_workers,
+        "sim_latency_ms": args.sim_latency_ms,
+        "sim_jitter_ms": args.sim_jitter_ms,
+        "late_ms": args.late_ms,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="G1 control path benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    dispatch = subparsers.add_parser("dispatch", help="joy mapping dispatch cost per message")
+    dispatch.add_argument("--rates", type=int, nargs="+", default=list(DEFAULT_RATES))
+    dispatch.add_argument("--duration", type=float, default=5.0, help="synthetic stream length (s)")
+    dispatch.add_argument("--json", help="write results to this JSON file")
+    dispatch.set_defaults(func=bench_dispatch)
+
+    e2e = subparsers.add_parser("e2e", help="/joy message to SDK call latency against the simulated backend")
+    e2e.add_argument("--rates", type=int, nargs="+", default=list(DEFAULT_E2E_RATES))
+    e2e.add_argument("--duration", type=float, default=5.0, help="stream length per rate (s)")
+    e2e.add_argument("--streaming", action="store_true", help="enable velocity streaming mode")
+    e2e.add_argument("--stream-rate", type=float, default=50.0, help="velocity streaming rate (Hz)")
+    e2e.add_argument("--dispatch-workers", type=int, default=2,
+                     help="receive_message dispatch workers (0: synchronous)")
+    e2e.add_argument("--sim-latency-ms", type=float, default=2.0, help="simulated RPC latency")
+    e2e.add_argument("--sim-jitter-ms", type=float, default=0.5, help="simulated RPC jitter")
+    e2e.add_argument("--late-ms", type=float, default=20.0, help="latency above this counts as late")
+    e2e.add_argument("--json", help="write results to this JSON file")
+    e2e.set_defaults(func=bench_e2e)
+
+    args = parser.parse_args()
+    report = args.func(args)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"[INFO] Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Sequence
+
+from g1_analog_control import VELOCITY_AXES
+from g1_logger import get_logger
+
+logger = get_logger(__name__)
+
+# Arm action이 허용되는 FSM ID (SDK 에러 -8 조건)
+ARM_ACTION_FSM_IDS = (500, 501, 801)
+
+# 실행 결과 코드 (0 = 성공, 그 외 arm action 결과 코드는 그대로 전달)
+RESULT_INVALID_FSM = -8  # 사전 조건 실패 (RPC 호출 없이 거부)
+RESULT_CANCELLED = -9    # cancel()로 중단
+RESULT_BUSY = -10        # 다른 시퀀스 실행 중
+
+
+class ChoreographyStep:
+    """시퀀스 한 단계
+
+    - action: arm action 이름 (None이면 이동만)
+    - duration: 단계 최소 시간 (초), action이 먼저 끝나도 이 시간까지 유지, 0이면 완료 즉시 다음 단계
+    - motion: 단계 동안 유지할 속도 {"vx", "vy", "vyaw"} (None이면 정지 상태)
+    """
+    __slots__ = ("action", "duration", "motion")
+
+    def __init__(self, action: Optional[str] = None, duration: float = 0.0, motion: Optional[Dict] = None):
+        self.action = action
+        self.duration = float(duration)
+        self.motion = tuple(float((motion or {}).get(name, 0.0)) for name in VELOCITY_AXES)
+
+    @classmethod
+    def from_spec(cls, spec):
+        """"wave" 또는 {"action": "wave", "duration": 2.0, "motion": {"vx": 0.2}}"""
+        if isinstance(spec, ChoreographyStep):
+            return spec
+        if isinstance(spec, str):
+            return cls(action=spec)
+        return cls(spec.get('action'), spec.get('duration', 0.0), spec.get('motion'))
+
+    def __repr__(self):
+        return f"ChoreographyStep(action={self.action!r}, duration={self.duration}, motion={self.motion})"
+
+
+class G1ChoreographyEngine:
+    """Arm action 시퀀스 실행기
+
+    - 각 단계는 이전 단계가 끝나는 즉시 시작 (고정 sleep 없음): arm action Future의
+      완료 콜백에서 다음 단계를 제출하고, duration이 남았으면 그만큼만 타이머로 대기
+    - arm action 제출 전 캐시된 FSM 상태가 ARM_ACTION_FSM_IDS인지 확인, 아니면 RPC 없이 중단
+    - 단계의 motion은 arm action과 병렬로 속도 목표(set_velocity_target)로 적용
+    - run()은 즉시 Future 반환 (결과: 0 = 전체 성공, 실패한 단계의 코드)
+    """
+
+    def __init__(self, sub_controller, allowed_fsm_ids: Sequence[int] = ARM_ACTION_FSM_IDS,
+                 known_actions: Optional[Sequence[str]] = None):
+        self.sub_controller = sub_controller
+        self.allowed_fsm_ids = tuple(allowed_fsm_ids)
+        self.known_actions = set(known_actions) if known_actions is not None else None
+
+        self._lock = threading.Lock()
+        self._run = None  # 실행 중인 시퀀스 상태 dict
+        self._stats = {"runs": 0, "completed": 0, "failed": 0, "cancelled": 0,
+                       "precondition_failures": 0, "steps": 0, "max_gap_ms": 0.0}
+
+    def validate(self, steps) -> List[ChoreographyStep]:
+        """단계 정의를 ChoreographyStep 리스트로 변환 (알 수 없는 action이면 ValueError)"""
+        parsed = [ChoreographyStep.from_spec(spec) for spec in steps]
+        if not parsed:
+            raise ValueError("Choreography has no steps")
+        for step in parsed:
+            if step.action is None and step.duration <= 0:
+                raise ValueError(f"Step without action needs a duration: {step}")
+            if step.action is not None and not self._is_known_action(step.action):
+                raise ValueError(f"Unknown arm action: {step.action}")
+        return parsed
+
+    def _is_known_action(self, action_name: str) -> bool:
+        """연결된 arm bridge의 카탈로그로 확인 (연결 전이면 known_actions, 둘 다 없으면 허용)"""
+        arm_bridge = getattr(self.sub_controller, "arm_bridge", None)
+        if arm_bridge is not None:
+            return arm_bridge.resolve_action(action_name) is not None
+        return self.known_actions is None or action_name in self.known_actions
+
+    def run(self, steps, name: str = "choreography") -> Future:
+        """시퀀스 실행 시작 (즉시 반환)"""
+        result = Future()
+        parsed = self.validate(steps)
+
+        with self._lock:
+            if self._run is not None:
+                logger.warning(f"{name} rejected - '{self._run['name']}' is still running")
+                result.set_result(RESULT_BUSY)
+                return result
+            self._run = {"name": name, "steps": parsed, "index": -1, "future": result,
+                         "timer": None, "action_future": None, "moving": False, "step_end": None}
+            self._stats["runs"] += 1
+
+        logger.control(f"{name} started ({len(parsed)} steps)")
+        self._next_step(self._run)
+        return result
+
+    def cancel(self, reset_motion: bool = True) -> bool:
+        """실행 중인 시퀀스 중단 (대기 중인 arm action 취소, 이동 정지)
+
+        reset_motion=False: 속도 목표를 0으로 되돌리지 않음 (정지 명령이 직접 멈추는 우선순위 경로용)
+        """
+        with self._lock:
+            run = self._run
+        if run is None:
+            return False
+        self._finish(run, RESULT_CANCELLED, reset_motion)
+        return True
+
+    def is_running(self) -> bool:
+        return self._run is not None
+
+    def _next_step(self, run):
+        """다음 단계 시작 (마지막 단계였으면 종료)"""
+        with self._lock:
+            if self._run is not run:
+                return
+            if run["step_end"] is not None:
+                gap_ms = (time.monotonic() - run["step_end"]) * 1000.0
+                self._stats["max_gap_ms"] = max(self._stats["max_gap_ms"], gap_ms)
+            run["index"] += 1
+            index = run["index"]
+            if index >= len(run["steps"]):
+                step = None
+            else:
+                step = run["steps"][index]
+                self._stats["steps"] += 1
+        if step is None:
+            self._finish(run, 0)
+            return
+
+        # 사전 조건: arm action은 허용된 FSM에서만 (캐시된 상태로 확인, RPC 없음)
+        if step.action is not None:
+            code, fsm_id = self.sub_controller.get_fsm_id()
+            if code != 0 or fsm_id not in self.allowed_fsm_ids:
+                with self._lock:
+                    self._stats["precondition_failures"] += 1
+                logger.warning(f"{run['name']} step {index + 1} ({step.action}) skipped - FSM {fsm_id} "
+                               f"not in {self.allowed_fsm_ids}")
+                self._finish(run, RESULT_INVALID_FSM)
+                return
+
+        if step.motion != (0.0, 0.0, 0.0) or run["moving"]:
+            self.sub_controller.set_velocity_target(*step.motion)
+            run["moving"] = step.motion != (0.0, 0.0, 0.0)
+
+        started = time.monotonic()
+        pending = {"action": step.action is not None, "duration": step.duration > 0}
+
+        def part_done(part, code=0):
+            if code != 0:
+                self._finish(run, code)
+                return
+            with self._lock:
+                pending[part] = False
+                done = not any(pending.values())
+                if done:
+                    run["step_end"] = time.monotonic()
+            if done:
+                self._next_step(run)
+
+        if pending["duration"]:
+            timer = threading.Timer(step.duration, part_done, args=("duration",))
+            timer.daemon = True
+            run["timer"] = timer
+            timer.start()
+
+        if pending["action"]:
+            future = self.sub_controller.arm_action_async(step.action)
+            # 제출하는 사이 cancel()/_finish()로 종료됐으면 방금 제출한 action도 취소
+            with self._lock:
+                stale = self._run is not run
+                if not stale:
+                    run["action_future"] = future
+            if stale:
+                future.cancel()
+                return
+
+            def action_done(done_future):
+                if done_future.cancelled() or self._run is not run:
+                    return
+                code = done_future.result()
+                logger.control(f"{run['name']} step {index + 1} ({step.action}) -> {code} "
+                               f"[{time.monotonic() - started:.2f} s]")
+                part_done("action", code)
+
+            future.add_done_callback(action_done)
+
+    def _finish(self, run, code: int, reset_motion: bool = True):
+        with self._lock:
+            if self._run is not run:
+                return
+            self._run = None
+            if run["timer"]:
+                run["timer"].cancel()
+            # action_future는 lock 안에서만 설정되므로 여기서 놓치지 않음
+            if run["action_future"]:
+                run["action_future"].cancel()
+            key = "completed" if code == 0 else "cancelled" if code == RESULT_CANCELLED else "failed"
+            self._stats[key] += 1
+        if run["moving"] and reset_motion:
+            # 결과를 기다리지 않음 (진행 중인 loco RPC 뒤에서 호출 스레드를 막지 않도록)
+            self.sub_controller.set_velocity_target(0.0, 0.0, 0.0, wait=False)
+        if code == 0:
+            logger.success(f"{run['name']} completed")
+        else:
+            logger.warning(f"{run['name']} stopped at step {run['index'] + 1} (code {code})")
+        run["future"].set_result(code)
+
+    def get_stats(self):
+        """실행 통계 (max_gap_ms: 단계 완료부터 다음 단계 시작까지의 최대 지연)"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["running"] = self._run["name"] if self._run else None
+        return stats
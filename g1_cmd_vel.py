@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import math
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from g1_analog_control import VELOCITY_AXES
+from g1_logger import get_logger
+
+logger = get_logger(__name__)
+
+# 속도 성분 별칭 (ROS Twist 스타일 이름도 허용)
+_ALIASES = {"vx": ("vx", "linear_x", "x"), "vy": ("vy", "linear_y", "y"),
+            "vyaw": ("vyaw", "angular_z", "omega", "yaw")}
+
+
+class G1CmdVelHandler:
+    """/cmd_vel 토픽 처리 (숫자 속도 명령 → 속도 목표)
+
+    메시지 value 형식 (dict, dict 리스트, 또는 이를 담은 JSON 문자열):
+      {"vx": 0.3, "vy": 0.0, "vyaw": 0.5, "stamp": 1712.25}
+      [{"vx": 0.1, "stamp": 1.00}, {"vx": 0.2, "stamp": 1.02}, ...]
+    - 값이 숫자가 아니거나 유한하지 않으면 메시지 전체를 거부
+    - 성분별 limits로 클램프 (빠진 성분은 0, limits에 없는 성분은 제한 없음)
+    - 묶음 메시지는 stamp가 가장 늦은 샘플 하나만 적용 (stamp가 없으면 마지막 샘플)
+    - 이미 적용한 stamp 이하의 샘플은 순서가 뒤바뀐 것으로 보고 무시,
+      단 stamp_reset초보다 크게 뒤로 가면 publisher가 재시작한 것으로 보고 새 기준으로 수용
+      (timeout 동안 명령이 없어도 stamp 기준 초기화)
+    - 목표값은 set_target(vx, vy, vyaw)로 전달 (속도 스트리머/병합 큐의 최신값 버퍼)
+    - timeout 동안 새 명령이 없으면 목표 속도를 0으로 (통신 끊김 시 계속 걷지 않도록)
+    """
+
+    def __init__(self, set_target: Callable[[float, float, float], int],
+                 limits: Optional[Dict[str, float]] = None, timeout: float = 0.5, stamp_reset: float = 1.0):
+        limits = limits or {"vx": 0.6, "vy": 0.4, "vyaw": 1.0}
+        self._set_target = set_target
+        self._limits = tuple(float(limits.get(name, math.inf)) for name in VELOCITY_AXES)
+        self.timeout = timeout
+        self.stamp_reset = stamp_reset
+
+        self._lock = threading.Lock()
+        self._last_stamp = None
+        self._last_command_at = None
+        self._moving = False
+
+        self._running = False
+        self._thread = None
+
+        self._stats = {"received": 0, "applied": 0, "rejected": 0, "clamped": 0, "stale": 0, "timeouts": 0,
+                       "stamp_resets": 0}
+
+    def handle(self, message: dict):
+        """토픽 라우터 핸들러"""
+        with self._lock:
+            self._stats["received"] += 1
+        try:
+            sample = self._select(self._parse(message.get('value')))
+        except (TypeError, ValueError) as e:
+            with self._lock:
+                self._stats["rejected"] += 1
+            logger.warning(f"Rejected cmd_vel message: {e}")
+            return
+        if sample is None:
+            with self._lock:
+                self._stats["stale"] += 1
+            return
+
+        velocity, clamped = sample
+        with self._lock:
+            self._stats["applied"] += 1
+            self._stats["clamped"] += clamped
+            self._last_command_at = time.monotonic()
+            self._moving = velocity != (0.0, 0.0, 0.0)
+        self._set_target(*velocity)
+
+    @staticmethod
+    def _parse(value):
+        """value → 샘플 리스트 [(stamp, (vx, vy, vyaw))]"""
+        if isinstance(value, (str, bytes)):
+            value = json.loads(value)
+        samples = value if isinstance(value, list) else [value]
+        if not samples:
+            raise ValueError("empty batch")
+
+        parsed = []
+        for sample in samples:
+            if not isinstance(sample, dict):
+                raise TypeError(f"sample must be an object, got {type(sample).__name__}")
+            components = []
+            for name in VELOCITY_AXES:
+                raw = next((sample[key] for key in _ALIASES[name] if key in sample), 0.0)
+                if isinstance(raw, bool) or not isinstance(raw, (int, float)) or not math.isfinite(raw):
+                    raise ValueError(f"invalid {name}: {raw!r}")
+                components.append(float(raw))
+            stamp = sample.get('stamp')
+            if stamp is not None and (isinstance(stamp, bool) or not isinstance(stamp, (int, float))):
+                raise ValueError(f"invalid stamp: {stamp!r}")
+            parsed.append((stamp, tuple(components)))
+        return parsed
+
+    def _select(self, samples) -> Optional[Tuple[Tuple[float, float, float], bool]]:
+        """적용할 샘플 선택 및 클램프, 오래된 샘플뿐이면 None"""
+        stamped = [sample for sample in samples if sample[0] is not None]
+        if stamped:
+            stamp, velocity = max(stamped, key=lambda sample: sample[0])
+            with self._lock:
+                last_stamp = self._last_stamp
+                restarted = last_stamp is not None and last_stamp - stamp > self.stamp_reset
+                stale = last_stamp is not None and stamp <= last_stamp and not restarted
+                if not stale:
+                    self._last_stamp = stamp
+                    self._stats["stamp_resets"] += restarted
+            if stale:
+                logger.warning("Dropped out-of-order cmd_vel message (stamp not newer than last applied)")
+                return None
+            if restarted:
+                logger.info(f"cmd_vel stamp jumped back {last_stamp - stamp:.3f} s - assuming publisher restart")
+        else:
+            velocity = samples[-1][1]
+
+        limited = tuple(max(-limit, min(limit, value)) for value, limit in zip(velocity, self._limits))
+        return limited, limited != velocity
+
+    def start(self):
+        """명령 timeout 감시 스레드 시작"""
+        if self._running or not self.timeout or self.timeout <= 0:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._watchdog_loop, name="G1CmdVelWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        if not self._running:
+            return
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _watchdog_loop(self):
+        interval = self.timeout / 4.0
+        while self._running:
+            time.sleep(interval)
+            with self._lock:
+                idle = (self._last_command_at is not None
+                        and time.monotonic() - self._last_command_at > self.timeout)
+                if idle:
+                    # 명령이 끊겼으면 다음 stamp를 새 기준으로 (publisher 재시작 대비)
+                    self._last_stamp = None
+                expired = idle and self._moving
+                if expired:
+                    self._moving = False
+                    self._stats["timeouts"] += 1
+            if expired:
+                logger.warning(f"cmd_vel timeout ({self.timeout} s without commands) - stopping")
+                self._set_target(0.0, 0.0, 0.0)
+
+    def get_stats(self):
+        """처리 통계 (stale: 순서가 뒤바뀌어 무시한 메시지, timeouts: 명령 끊김으로 정지한 횟수,
+        stamp_resets: stamp가 크게 뒤로 가서 기준을 다시 잡은 횟수)"""
+        with self._lock:
+            return dict(self._stats)
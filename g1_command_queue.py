@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import itertools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Hashable, Optional
+
+from g1_logger import get_logger
+
+logger = get_logger(__name__)
+
+# coalesce 정책
+COALESCE_REPLACE = "replace"  # 대기 중인 같은 종류의 명령을 최신 명령으로 교체 (예: 속도)
+COALESCE_DEDUPE = "dedupe"    # 마지막 대기 명령과 동일하면 새 명령을 합침 (예: 같은 FSM ID 설정)
+
+
+class _PendingCommand:
+    __slots__ = ("command_func", "command_name", "futures")
+
+    def __init__(self, command_func, command_name, future):
+        self.command_func = command_func
+        self.command_name = command_name
+        self.futures = [future]
+
+
+class G1LocoCommandQueue:
+    """Loco 명령 큐 (단일 워커 스레드, 대기 중 명령 coalescing)
+
+    - coalesce_key가 같은 대기 명령은 하나로 합쳐진다.
+      * replace: 이전 명령은 버려지고 최신 명령이 큐 끝에서 실행된다.
+      * dedupe: 동일 명령이 큐의 마지막 대기 명령일 때만 새 명령은 버려지고 그 결과를 공유한다.
+        사이에 다른 명령이 있으면 (예: sit, stand_up, sit) 합치지 않고 순서대로 모두 실행한다.
+    - 합쳐진 명령의 Future는 실제로 실행된 명령의 결과를 받는다.
+    - 대기 명령 수가 max_pending을 넘으면 새 명령은 -1로 거부된다.
+    """
+
+    def __init__(self, max_pending: int = 32):
+        self.max_pending = max_pending
+        self._cond = threading.Condition()
+        self._pending = OrderedDict()
+        self._ids = itertools.count()
+        self._running = False
+        self._thread = None
+
+        self._stats = {"submitted": 0, "executed": 0, "coalesced": 0,
+                       "deduplicated": 0, "rejected": 0, "preempted": 0}
+
+    def start(self):
+        """워커 스레드 시작"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._worker_loop, name="G1LocoCommandQueue", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """워커 스레드 종료 (대기 중인 명령은 -1로 종료)"""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._cond.notify_all()
+        self.cancel_pending()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def submit(self, command_func: Callable[[], int], command_name: str,
+               coalesce_key: Optional[Hashable] = None, policy: str = COALESCE_REPLACE) -> Future:
+        """명령 제출 (즉시 반환), Future 결과는 명령 반환 코드"""
+        future = Future()
+
+        with self._cond:
+            self._stats["submitted"] += 1
+
+            if not self._running:
+                future.set_result(-1)
+                logger.error(f"Loco command queue not running - {command_name} ignored")
+                return future
+
+            key = coalesce_key if coalesce_key is not None else ("_unique", next(self._ids))
+            existing = self._pending.get(key)
+
+            if existing is not None and policy == COALESCE_DEDUPE:
+                if next(reversed(self._pending)) == key:
+                    existing.futures.append(future)
+                    self._stats["deduplicated"] += 1
+                    return future
+                # 뒤에 다른 명령이 대기 중: 합치면 실행 순서가 바뀌므로 별도 명령으로 추가
+                key = ("_unique", next(self._ids))
+                existing = None
+
+            if existing is not None:
+                # 이전 명령 대체: 대기 중이던 Future들은 새 명령의 결과를 받음
+                del self._pending[key]
+                entry = _PendingCommand(command_func, command_name, future)
+                entry.futures[:0] = existing.futures
+                self._stats["coalesced"] += 1
+            else:
+                if len(self._pending) >= self.max_pending:
+                    self._stats["rejected"] += 1
+                    future.set_result(-1)
+                    logger.warning(f"Loco command queue full - {command_name} rejected")
+                    return future
+                entry = _PendingCommand(command_func, command_name, future)
+
+            self._pending[key] = entry
+            self._cond.notify()
+
+        return future
+
+    def cancel_pending(self) -> int:
+        """대기 중인 명령을 모두 버리고 -1로 종료, 버린 명령 수 반환"""
+        with self._cond:
+            entries = list(self._pending.values())
+            self._pending.clear()
+            self._stats["preempted"] += len(entries)
+
+        for entry in entries:
+            for future in entry.futures:
+                future.set_result(-1)
+        return len(entries)
+
+    def get_stats(self):
+        """큐 통계 (coalesced + deduplicated = 합쳐져서 버려진 명령 수)"""
+        with self._cond:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._pending)
+        stats["dropped"] = stats["coalesced"] + stats["deduplicated"]
+        return stats
+
+    def _worker_loop(self):
+        """대기 명령을 순서대로 하나씩 실행"""
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                _, entry = self._pending.popitem(last=False)
+
+            try:
+                result = entry.command_func()
+            except Exception as e:
+                logger.error(f"{entry.command_name} failed: {e}")
+                result = -1
+
+            with self._cond:
+                self._stats["executed"] += 1
+            for future in entry.futures:
+                future.set_result(result)
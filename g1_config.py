@@ -20,6 +20,79 @@ AUDIO_INFO = {
     "audio": {"input": "default", "output": "default"},
 }
 
+### BACKEND
+# Robot connection settings passed to G1SubController
+
+BACKEND_INFO = {
+    "network_interface": "eth0",  # Network interface connected to the robot
+    "backend": "sdk",             # "sdk": real robot, "sim": simulated backend (libg1_sim_wrapper.so)
+    "flight_recorder_path": None, # e.g. "/tmp/g1_flight.bin": record SDK calls, /joy and state samples
+    "flight_recorder_capacity": 65536,  # Ring buffer size in records (96 bytes each)
+    "supervise": True,            # Health-check bridges and reconnect automatically
+    "supervisor_options": {
+        "probe_interval": 1.0,    # Seconds between loco health probes (get_fsm_id, skipped if state is fresh)
+        "failure_threshold": 3,   # Consecutive probe failures before tearing down and reconnecting
+        "backoff_initial": 0.5,   # First retry delay (s), doubled after each failed attempt
+        "backoff_max": 30.0,      # Retry delay cap (s)
+        "backoff_jitter": 0.2,    # +/- fraction of random jitter on each delay
+        "policy": "reject",       # During reconnect - "reject": fail commands, "queue": wait up to queue_timeout
+        "queue_timeout": 5.0,
+    },
+}
+
+### LOGGING
+# Non-blocking logger settings (g1_logger.configure_logging)
+
+LOG_INFO = {
+    "level": "INFO",              # DEBUG, INFO, CONTROL, SUCCESS, WARNING, ERROR
+    "rate_limit_interval": 1.0,   # Identical DEBUG/INFO/SUCCESS messages within this window (s) are collapsed
+    "fmt": "text",                # "text": [LEVEL] message, "json": one JSON object per line
+}
+
+### CONTROL
+# Teleop control settings passed to G1BaseController
+
+CONTROL_INFO = {
+    # Inbound message dispatch (receive_message returns immediately, workers execute commands)
+    "dispatch_workers": 2,             # 0: handle messages synchronously in the pubsub callback
+    "dispatch_max_pending": 64,        # Queued messages per worker
+    "dispatch_overflow": "drop_oldest",                    # drop_oldest, drop_newest, block
+    "dispatch_overflow_policies": {"/joy": "drop_oldest"}, # Per-topic overrides
+
+    # Outbound callback/echo batching for non-/joy topics
+    "outbound_batch_window": 0.05,     # Seconds to collect messages into one batch (0: disabled)
+    "outbound_batch_topics": None,     # Inbound topics to batch (None: every topic except /joy)
+    "outbound_dedupe": True,           # Merge identical messages in a window (adds "count")
+
+    # Numeric velocity topic (value: {"vx", "vy", "vyaw", "stamp"} or a list of them)
+    "cmd_vel_topic": "/cmd_vel",       # None: disabled
+    "cmd_vel_limits": {"vx": 0.6, "vy": 0.4, "vyaw": 1.0},  # Clamp limits
+    "cmd_vel_timeout": 0.5,            # Stop if no command arrives within this many seconds (0: off)
+    "cmd_vel_stamp_reset": 1.0,        # A stamp this many seconds older than the last is a publisher restart
+
+    # Arm action sequences started by name on the /choreography topic ("cancel" stops the running one)
+    # A step is an action name or {"action", "duration" (min seconds), "motion" {"vx", "vy", "vyaw"}}
+    "choreographies": {
+        "greeting": ["face_wave", {"action": "shake_hand", "duration": 2.0}, "release_arm"],
+        "celebrate": [{"action": "hands_up", "motion": {"vyaw": 0.5}}, "clap", "heart", "release_arm"],
+    },
+
+    # Topic router
+    "router_async_workers": 1,         # Worker threads for handlers registered with is_async=True
+
+    "velocity_streaming": False,  # True: joystick only updates target velocity, sent at fixed rate
+    "stream_rate_hz": 50.0,       # Velocity streaming rate (Hz)
+
+    # Proportional analog stick control (enables velocity streaming)
+    "analog_control": False,
+    "analog_axes": {"vx": (1, -1.0), "vy": (0, -1.0)},       # component: (axes index, sign)
+    "analog_deadzone": 0.1,                                   # |axis| below this is treated as 0
+    "analog_expo": 0.5,                                       # 0 = linear, 1 = cubic response
+    "analog_limits": {"vx": 0.6, "vy": 0.4, "vyaw": 1.0},     # Max velocity at full deflection
+    "accel_limits": {"vx": 1.0, "vy": 1.0, "vyaw": 2.0},      # Max acceleration (per s^2)
+    "jerk_limits": {"vx": 5.0, "vy": 5.0, "vyaw": 10.0},      # Max jerk (per s^3), None to disable
+}
+
 ### OPERATOR
 # Operator account credentials for system login
 
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+from g1_logger import get_logger
+
+logger = get_logger(__name__)
+
+# 재연결 중 명령 처리 정책
+POLICY_REJECT = "reject"  # 즉시 -1 반환 (기존 동작)
+POLICY_QUEUE = "queue"    # 재연결될 때까지 queue_timeout 동안 대기 후 실행
+
+POLICIES = (POLICY_REJECT, POLICY_QUEUE)
+
+# 브릿지 상태
+STATE_CONNECTED = "connected"
+STATE_RECONNECTING = "reconnecting"
+STATE_STOPPED = "stopped"
+
+BRIDGES = ("loco", "arm")
+
+
+class _BridgeHealth:
+    __slots__ = ("state", "failures", "attempts", "next_attempt", "reconnects", "last_error")
+
+    def __init__(self):
+        self.state = STATE_CONNECTED
+        self.failures = 0         # 연속 probe 실패 수
+        self.attempts = 0         # 연속 재연결 실패 수 (backoff 지수)
+        self.next_attempt = 0.0   # 다음 재연결 시도 시각 (monotonic)
+        self.reconnects = 0       # 성공한 재연결 수
+        self.last_error = None
+
+
+class G1ConnectionSupervisor:
+    """Loco/Arm 브릿지 연결 감시 및 자동 재연결
+
+    - probe_interval마다 loco 상태 확인: 상태 폴링이 받아 둔 fsm_id가 최근 값이면 그대로 사용하고,
+      아니면 get_fsm_id() 한 번 호출 (가벼운 probe)
+    - probe가 failure_threshold번 연속 실패하면 loco/arm 핸들을 정리하고 재연결 (DDS를 공유하므로 함께),
+      loco는 새 핸들로 probe가 성공해야 재연결 완료
+    - arm은 상태 조회 API가 없으므로 브릿지가 없을 때(연결 실패/정리됨)만 재연결
+    - 재연결 실패 시 backoff_initial × 2^n (최대 backoff_max) ± backoff_jitter 비율 후 재시도
+    - 재연결 중 명령은 policy에 따라 즉시 거부하거나 wait_connected()로 대기
+    """
+
+    def __init__(self, sub_controller, probe_interval: float = 1.0, failure_threshold: int = 3,
+                 backoff_initial: float = 0.5, backoff_max: float = 30.0, backoff_jitter: float = 0.2,
+                 policy: str = POLICY_REJECT, queue_timeout: float = 5.0, bridges=BRIDGES):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown reconnect policy: {policy} (available: {POLICIES})")
+        self.sub_controller = sub_controller
+        self.probe_interval = probe_interval
+        self.failure_threshold = failure_threshold
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.backoff_jitter = backoff_jitter
+        self.policy = policy
+        self.queue_timeout = queue_timeout
+        self.bridges = tuple(bridges)  # 감시 대상 (arm 라이브러리가 없으면 loco만)
+
+        self._cond = threading.Condition()
+        self._health: Dict[str, _BridgeHealth] = {name: _BridgeHealth() for name in self.bridges}
+        self._running = False
+        self._thread = None
+        self._rng = random.Random()
+        self._stats = {"probes": 0, "cached_probes": 0, "probe_failures": 0, "reconnect_attempts": 0}
+
+    def start(self):
+        """감시 스레드 시작 (현재 브릿지 상태로 초기화)"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            for name in self.bridges:
+                self._set_state(name, STATE_CONNECTED if self._bridge(name) else STATE_RECONNECTING)
+        self._thread = threading.Thread(target=self._supervise_loop, name="G1ConnectionSupervisor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """감시 스레드 종료 (대기 중인 명령은 깨워서 거부)"""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            for name in self.bridges:
+                self._health[name].state = STATE_STOPPED
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def _bridge(self, name):
+        return self.sub_controller.loco_bridge if name == "loco" else self.sub_controller.arm_bridge
+
+    def _set_state(self, name, state):
+        """상태 변경 (self._cond 보유 상태에서 호출)"""
+        health = self._health[name]
+        health.state = state
+        if state == STATE_CONNECTED:
+            health.failures = 0
+            health.attempts = 0
+        else:
+            health.next_attempt = time.monotonic()
+        self._cond.notify_all()
+
+    def is_reconnecting(self, name: str) -> bool:
+        health = self._health.get(name)
+        return health is not None and health.state == STATE_RECONNECTING
+
+    def should_queue(self, name: str) -> bool:
+        """재연결 중 이 브릿지의 명령을 대기시킬지 여부"""
+        return self._running and self.policy == POLICY_QUEUE and self.is_reconnecting(name)
+
+    def wait_connected(self, name: str, timeout: Optional[float] = None) -> bool:
+        """브릿지가 다시 연결될 때까지 대기 (queue 정책), 연결되면 True"""
+        timeout = self.queue_timeout if timeout is None else timeout
+        health = self._health.get(name)
+        if health is None:
+            return False
+        with self._cond:
+            return self._cond.wait_for(lambda: health.state != STATE_RECONNECTING, timeout) \
+                and health.state == STATE_CONNECTED
+
+    def _supervise_loop(self):
+        while True:
+            with self._cond:
+                if not self._running:
+                    return
+                self._cond.wait(self._next_wakeup())
+                if not self._running:
+                    return
+            try:
+                for name in self.bridges:
+                    self._check(name)
+            except Exception as e:
+                logger.warning(f"Connection supervisor error: {e}")
+
+    def _next_wakeup(self) -> float:
+        """다음 probe 또는 재연결 시도까지의 시간"""
+        now = time.monotonic()
+        delay = self.probe_interval
+        for health in self._health.values():
+            if health.state == STATE_RECONNECTING:
+                delay = min(delay, max(0.0, health.next_attempt - now))
+        return delay
+
+    def _check(self, name):
+        health = self._health[name]
+        if health.state == STATE_RECONNECTING:
+            if time.monotonic() >= health.next_attempt:
+                self._reconnect(name)
+            return
+
+        if self._bridge(name) is None:
+            self._mark_failed(name, "bridge not connected")
+            return
+        if name == "loco" and not self._probe_loco():
+            health.failures += 1
+            with self._cond:
+                self._stats["probe_failures"] += 1
+            if health.failures >= self.failure_threshold:
+                self._mark_failed(name, f"{health.failures} consecutive probe failures")
+
+    def _probe_loco(self) -> bool:
+        """loco 상태 확인 (최근 상태 폴링 결과가 있으면 RPC 없이 판단)"""
+        sub = self.sub_controller
+        cached = sub.state_cache.get("fsm_id", max_age=self.probe_interval)
+        with self._cond:
+            self._stats["probes"] += 1
+            if cached is not None and cached[0] == 0:
+                self._stats["cached_probes"] += 1
+                self._health["loco"].failures = 0
+                return True
+
+        bridge = sub.loco_bridge
+        if bridge is None:
+            return False
+        try:
+            code, _ = bridge.get_fsm_id()
+        except Exception as e:
+            self._health["loco"].last_error = str(e)
+            return False
+        if code != 0:
+            self._health["loco"].last_error = f"get_fsm_id returned {code}"
+            return False
+        self._health["loco"].failures = 0
+        return True
+
+    def _mark_failed(self, name, reason):
+        """브릿지 정리 후 재연결 대기 상태로 (loco가 끊기면 arm도 함께 재연결)"""
+        names = self.bridges if name == "loco" else (name,)
+        logger.warning(f"{'/'.join(names)} connection lost ({reason}) - reconnecting")
+        with self._cond:
+            for bridge_name in names:
+                self._health[bridge_name].last_error = reason
+                self._set_state(bridge_name, STATE_RECONNECTING)
+        self.sub_controller._teardown_bridges(arm_only=name == "arm")
+
+    def _reconnect(self, name):
+        """재연결 시도, 실패 시 backoff 후 재시도 예약"""
+        health = self._health[name]
+        loco = self._health["loco"]
+        if name == "arm" and loco.state != STATE_CONNECTED:
+            # arm은 loco(ChannelFactory) 이후에, loco 재시도 시각까지 대기
+            health.next_attempt = max(health.next_attempt, loco.next_attempt)
+            return
+
+        with self._cond:
+            self._stats["reconnect_attempts"] += 1
+        connect = self.sub_controller._connect_loco_bridge if name == "loco" else \
+            self.sub_controller._connect_arm_bridge
+        try:
+            connected = connect()
+            # SDK 클라이언트 생성은 통신 없이도 성공하므로 loco는 probe까지 통과해야 재연결로 인정
+            if connected and name == "loco" and not self._probe_loco():
+                self.sub_controller._teardown_bridges()
+                connected = False
+        except Exception as e:
+            health.last_error = str(e)
+            connected = False
+
+        with self._cond:
+            if not self._running:
+                return
+            if connected:
+                health.reconnects += 1
+                self._set_state(name, STATE_CONNECTED)
+            else:
+                delay = min(self.backoff_max, self.backoff_initial * (2 ** health.attempts))
+                delay *= 1.0 + self._rng.uniform(-self.backoff_jitter, self.backoff_jitter)
+                health.attempts += 1
+                health.next_attempt = time.monotonic() + delay
+        if connected:
+            logger.success(f"{name} bridge reconnected")
+        else:
+            logger.warning(f"{name} reconnect attempt {health.attempts} failed - retrying in {delay:.1f} s")
+
+    def get_stats(self):
+        """감시 통계 (bridges: 브릿지별 상태, 연속 실패 수, 재연결 수, 다음 시도까지 시간)"""
+        now = time.monotonic()
+        with self._cond:
+            stats = dict(self._stats)
+            stats["policy"] = self.policy
+            stats["bridges"] = {
+                name: {
+                    "state": health.state,
+                    "failures": health.failures,
+                    "attempts": health.attempts,
+                    "reconnects": health.reconnects,
+                    "retry_in": max(0.0, health.next_attempt - now) if health.state == STATE_RECONNECTING else None,
+                    "last_error": health.last_error,
+                }
+                for name, health in self._health.items()
+            }
+        return stats
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+from g1_logger import get_logger
+
+logger = get_logger(__name__)
+
+# 큐가 가득 찼을 때 정책
+OVERFLOW_DROP_OLDEST = "drop_oldest"  # 가장 오래된 대기 메시지를 버리고 새 메시지 추가 (최신 입력 우선, 예: /joy)
+OVERFLOW_DROP_NEWEST = "drop_newest"  # 새 메시지를 버림 (이미 대기 중인 명령 우선)
+OVERFLOW_BLOCK = "block"              # 자리가 날 때까지 block_timeout 동안 대기, 이후 새 메시지를 버림
+
+OVERFLOW_POLICIES = (OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_NEWEST, OVERFLOW_BLOCK)
+
+_NO_KEY = object()
+
+
+class _DispatchWorker:
+    __slots__ = ("index", "pending", "cond", "thread")
+
+    def __init__(self, index):
+        self.index = index
+        self.pending = deque()
+        self.cond = threading.Condition()
+        self.thread = None
+
+
+class G1DispatchQueue:
+    """수신 메시지 디스패치 큐 (bounded, 토픽별 순서 보장)
+
+    - submit()은 메시지를 워커 큐에 넣고 즉시 반환 (네트워크 콜백 스레드를 막지 않음)
+    - 같은 토픽은 항상 같은 워커가 처리하므로 토픽 안에서의 처리 순서가 유지됨
+    - 워커별 대기 메시지가 max_pending을 넘으면 토픽별 overflow 정책 적용
+    - edge_keys {topic: key(message)}: 직전 메시지와 key가 다른 메시지(예: 버튼 입력이 바뀐 /joy)는
+      엣지로 표시되어 drop_oldest에서 버리지 않음 - 엣지가 아닌 가장 오래된 메시지를 대신 버리고,
+      대기 중인 메시지가 모두 엣지면 (엣지가 아닌) 새 메시지를 버림
+    """
+
+    def __init__(self, handler: Callable[[dict], None], workers: int = 2, max_pending: int = 64,
+                 overflow: str = OVERFLOW_DROP_OLDEST, overflow_policies: Optional[Dict[str, str]] = None,
+                 block_timeout: float = 0.1, edge_keys: Optional[Dict[str, Callable[[dict], object]]] = None):
+        for policy in [overflow] + list((overflow_policies or {}).values()):
+            if policy not in OVERFLOW_POLICIES:
+                raise ValueError(f"Unknown overflow policy: {policy} (available: {OVERFLOW_POLICIES})")
+
+        self.handler = handler
+        self.max_pending = max_pending
+        self.overflow = overflow
+        self.overflow_policies = dict(overflow_policies or {})
+        self.block_timeout = block_timeout
+        self.edge_keys = dict(edge_keys or {})
+        self._last_keys: Dict[str, object] = {}  # 토픽별 직전 메시지의 key (해당 워커의 cond로 보호)
+
+        self._workers = [_DispatchWorker(index) for index in range(max(1, workers))]
+        self._running = False
+        self._stats_lock = threading.Lock()
+        self._stats = {"submitted": 0, "processed": 0, "dropped": 0, "errors": 0, "max_depth": 0,
+                       "max_wait_ms": 0.0, "edge_drops": 0}
+        self._dropped_by_topic: Dict[str, int] = {}
+
+    def start(self):
+        """워커 스레드 시작"""
+        if self._running:
+            return
+        self._running = True
+        for worker in self._workers:
+            worker.thread = threading.Thread(target=self._worker_loop, args=(worker,),
+                                             name=f"G1Dispatch-{worker.index}", daemon=True)
+            worker.thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """워커 스레드 종료 (대기 중인 메시지는 버림)"""
+        if not self._running:
+            return
+        self._running = False
+        for worker in self._workers:
+            with worker.cond:
+                worker.pending.clear()
+                worker.cond.notify_all()
+        for worker in self._workers:
+            if worker.thread:
+                worker.thread.join(timeout)
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def _worker_for(self, topic) -> _DispatchWorker:
+        return self._workers[hash(topic) % len(self._workers)]
+
+    def submit(self, topic, message: dict) -> bool:
+        """메시지 추가 (즉시 반환), 버려졌으면 False"""
+        worker = self._worker_for(topic)
+        policy = self.overflow_policies.get(topic, self.overflow)
+        accepted = True
+
+        key = _NO_KEY
+        key_func = self.edge_keys.get(topic)
+        if key_func:
+            try:
+                key = key_func(message)
+            except Exception:
+                key = object()  # 판단할 수 없는 메시지는 엣지로 취급 (버리지 않음)
+
+        with worker.cond:
+            is_edge = key is not _NO_KEY and key != self._last_keys.get(topic, _NO_KEY)
+            if key is not _NO_KEY:
+                self._last_keys[topic] = key
+
+            if len(worker.pending) >= self.max_pending:
+                if policy == OVERFLOW_DROP_OLDEST:
+                    accepted = self._drop_oldest(worker, is_edge)
+                elif policy == OVERFLOW_BLOCK:
+                    worker.cond.wait_for(lambda: len(worker.pending) < self.max_pending or not self._running,
+                                         self.block_timeout)
+                    accepted = len(worker.pending) < self.max_pending
+                else:
+                    accepted = False
+
+            if accepted:
+                worker.pending.append((topic, message, time.monotonic(), is_edge))
+                depth = len(worker.pending)
+                worker.cond.notify_all()
+
+        with self._stats_lock:
+            self._stats["submitted"] += 1
+            if accepted and depth > self._stats["max_depth"]:
+                self._stats["max_depth"] = depth
+        if not accepted:
+            self._count_drop(topic)
+            logger.warning(f"Dispatch queue full - message on '{topic}' dropped")
+        return accepted
+
+    def _drop_oldest(self, worker: _DispatchWorker, is_edge: bool) -> bool:
+        """drop_oldest: 엣지가 아닌 가장 오래된 메시지를 버림, 새 메시지를 넣을 수 있으면 True
+
+        (worker.cond 보유 상태에서 호출)
+        """
+        for index, entry in enumerate(worker.pending):
+            if not entry[3]:
+                del worker.pending[index]
+                self._count_drop(entry[0])
+                return True
+        if not is_edge:
+            return False  # 대기 중인 엣지를 지키고 새 메시지(직전과 같은 입력)를 버림
+
+        # 대기 중인 메시지가 모두 엣지이고 새 메시지도 엣지: 가장 오래된 엣지를 버림
+        dropped_topic = worker.pending.popleft()[0]
+        self._count_drop(dropped_topic)
+        with self._stats_lock:
+            self._stats["edge_drops"] += 1
+        logger.warning(f"Dispatch queue full of input edges - oldest '{dropped_topic}' edge dropped")
+        return True
+
+    def _count_drop(self, topic):
+        with self._stats_lock:
+            self._stats["dropped"] += 1
+            self._dropped_by_topic[topic] = self._dropped_by_topic.get(topic, 0) + 1
+
+    def _worker_loop(self, worker: _DispatchWorker):
+        while True:
+            with worker.cond:
+                while self._running and not worker.pending:
+                    worker.cond.wait()
+                if not self._running:
+                    return
+                topic, message, enqueued_at, _ = worker.pending.popleft()
+                worker.cond.notify_all()  # block 정책으로 대기 중인 submit 깨움
+            wait_ms = (time.monotonic() - enqueued_at) * 1000.0
+
+            try:
+                self.handler(message)
+            except Exception as e:
+                with self._stats_lock:
+                    self._stats["errors"] += 1
+                logger.error(f"Dispatch handler failed for '{topic}': {e}")
+
+            with self._stats_lock:
+                self._stats["processed"] += 1
+                if wait_ms > self._stats["max_wait_ms"]:
+                    self._stats["max_wait_ms"] = wait_ms
+
+    def pending_count(self) -> int:
+        """전체 대기 메시지 수"""
+        return sum(len(worker.pending) for worker in self._workers)
+
+    def get_stats(self):
+        """디스패치 통계 (dropped_by_topic: 토픽별 버려진 메시지 수, edge_drops: 버려진 엣지 메시지 수)"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+            stats["dropped_by_topic"] = dict(self._dropped_by_topic)
+        stats["pending"] = self.pending_count()
+        return stats
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import mmap
+import struct
+import threading
+import time
+from collections import namedtuple
+from typing import Iterable, List, Optional
+
+# 레코드 종류
+KIND_JOY = 1    # /joy 입력 (values: axes, buttons: 버튼 비트마스크)
+KIND_CALL = 2   # SDK 명령 호출 (name: 함수명, code: 반환 코드, values: 인자)
+KIND_STATE = 3  # 상태 샘플 (code: fsm_id, values: fsm_mode, balance_mode, swing_height, stand_height)
+
+KIND_NAMES = {KIND_JOY: "joy", KIND_CALL: "call", KIND_STATE: "state"}
+
+# 파일 헤더: magic, version, record_size, capacity, 누적 기록 수
+HEADER = struct.Struct("<4sHHIQ")
+HEADER_SIZE = 64
+MAGIC = b"G1FR"
+VERSION = 1
+
+# 고정 크기 레코드 (96 bytes)
+#   timestamp(d) seq(Q) kind(B) flags(B) aux(H) code(i) duration_us(I) name(32s) values(8f) buttons(I)
+RECORD = struct.Struct("<dQBBHiI32s8fI")
+NAME_SIZE = 32
+VALUE_COUNT = 8
+
+FlightRecord = namedtuple("FlightRecord", [
+    "timestamp", "seq", "kind", "flags", "aux", "code", "duration_us", "name", "values", "buttons"
+])
+
+_ZERO_VALUES = (0.0,) * VALUE_COUNT
+
+
+class G1FlightRecorder:
+    """명령/텔레메트리 플라이트 레코더 (메모리 맵 파일 링 버퍼)
+
+    - 파일 크기는 생성 시 고정 (헤더 + capacity × 96 bytes), 가장 오래된 레코드부터 덮어씀
+    - 기록은 미리 할당된 mmap 영역에 pack_into로 직접 기록 (레코드별 버퍼 할당 없음)
+    - 프로세스가 비정상 종료되어도 OS가 페이지를 파일에 반영하므로 기록이 남음
+    """
+
+    def __init__(self, path: str, capacity: int = 65536, record_getters: bool = False):
+        self.path = path
+        self.capacity = capacity
+        self.record_getters = record_getters  # False면 get_* SDK 호출은 기록하지 않음 (상태 샘플로 대체)
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._names = {}  # 함수명 → 인코딩된 bytes 캐시
+
+        size = HEADER_SIZE + capacity * RECORD.size
+        with open(path, "wb") as f:
+            f.truncate(size)
+        self._file = open(path, "r+b")
+        self._mm = mmap.mmap(self._file.fileno(), size)
+        HEADER.pack_into(self._mm, 0, MAGIC, VERSION, RECORD.size, capacity, 0)
+
+    def _encode_name(self, name: str) -> bytes:
+        encoded = self._names.get(name)
+        if encoded is None:
+            encoded = self._names.setdefault(name, name.encode("utf-8")[:NAME_SIZE])
+        return encoded
+
+    def _write(self, kind, flags, aux, code, duration_us, name, values, buttons):
+        if len(values) < VALUE_COUNT:
+            values = tuple(values) + _ZERO_VALUES[len(values):]
+        with self._lock:
+            if self._mm is None:
+                return
+            seq = self._seq
+            self._seq = seq + 1
+            offset = HEADER_SIZE + (seq % self.capacity) * RECORD.size
+            RECORD.pack_into(self._mm, offset, time.time(), seq, kind, flags, aux, code, duration_us,
+                             name, *values[:VALUE_COUNT], buttons)
+            HEADER.pack_into(self._mm, 0, MAGIC, VERSION, RECORD.size, self.capacity, seq + 1)
+
+    def record_joy(self, joy_data: dict):
+        """/joy 입력 기록 (axes 최대 8개, buttons 최대 32개)"""
+        axes = joy_data.get('axes', ())
+        buttons = joy_data.get('buttons', ())
+        mask = 0
+        for index, pressed in enumerate(buttons[:32]):
+            if pressed:
+                mask |= 1 << index
+        self._write(KIND_JOY, min(len(axes), VALUE_COUNT), min(len(buttons), 32), 0, 0,
+                    b"joy", axes[:VALUE_COUNT], mask)
+
+    def record_call(self, name: str, args: Iterable, code: Optional[int], duration_us: int):
+        """SDK 호출 기록 (InstrumentedLibrary 훅, 첫 번째 인자인 핸들은 제외)"""
+        if not self.record_getters and name.startswith("get_"):
+            return
+        values = [float(arg) for arg in list(args)[1:VALUE_COUNT + 1] if isinstance(arg, (int, float))]
+        self._write(KIND_CALL, len(values), 0, 0 if code is None else code, duration_us,
+                    self._encode_name(name), values, 0)
+
+    def record_state(self, state: dict):
+        """상태 샘플 기록 (get_state() 결과 {field: (code, value)})"""
+        ok_mask = 0
+        values = []
+        for index, field in enumerate(("fsm_mode", "balance_mode", "swing_height", "stand_height")):
+            code, value = state.get(field, (-1, 0))
+            if code == 0:
+                ok_mask |= 1 << index
+            values.append(float(value))
+        fsm_code, fsm_id = state.get("fsm_id", (-1, 0))
+        self._write(KIND_STATE, ok_mask, 0 if fsm_code == 0 else 1, int(fsm_id), 0,
+                    b"state", values, 0)
+
+    def get_count(self) -> int:
+        """누적 기록 수 (capacity를 넘으면 오래된 레코드는 덮어써짐)"""
+        return self._seq
+
+    def close(self):
+        with self._lock:
+            if self._mm is None:
+                return
+            self._mm.flush()
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+
+def read_records(path: str) -> List[FlightRecord]:
+    """기록 파일을 읽어 오래된 순서로 레코드 반환"""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    magic, version, record_size, capacity, count = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or record_size != RECORD.size:
+        raise ValueError(f"Not a G1 flight recorder file (version {version}): {path}")
+
+    records = []
+    for seq in range(max(0, count - capacity), count):
+        fields = RECORD.unpack_from(data, HEADER_SIZE + (seq % capacity) * RECORD.size)
+        timestamp, record_seq, kind, flags, aux, code, duration_us, name = fields[:8]
+        if record_seq != seq:
+            continue  # 기록 도중 종료된 슬롯
+        records.append(FlightRecord(timestamp, record_seq, kind, flags, aux, code, duration_us,
+                                    name.rstrip(b"\0").decode("utf-8", "replace"),
+                                    fields[8:8 + VALUE_COUNT], fields[-1]))
+    return records
+
+
+def joy_from_record(record: FlightRecord) -> dict:
+    """KIND_JOY 레코드를 /joy 메시지 값으로 복원"""
+    axes = [float(value) for value in record.values[:record.flags]]
+    buttons = [(record.buttons >> index) & 1 for index in range(record.aux)]
+    return {'axes': axes, 'buttons': buttons}
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from typing import Dict, Iterable, Optional, Tuple
+
+JOY_INPUT_TYPES = ('axes', 'buttons')
+
+
+class G1JoyDispatcher:
+    """joy_mapping 사전 컴파일 디스패처
+
+    매핑 키 (input_type, index, expected_value)를 시작 시 한 번만
+    입력 타입별 인덱스 테이블 {index: {expected_value: (순서, 키)}}로 변환한다.
+    메시지마다 전체 매핑을 순회하는 대신 사용되는 인덱스마다 dict 조회 한 번으로
+    매칭하며, 직전 프레임과 동일한 입력은 캐시된 결과를 그대로 반환한다.
+
+    여러 매핑이 동시에 일치하면 joy_mapping에 먼저 정의된 매핑이 우선한다
+    (기존 선형 탐색과 동일한 결과).
+    """
+
+    def __init__(self, mapping_keys: Iterable[Tuple[str, int, object]], excluded_axes: Iterable[int] = ()):
+        self._tables: Dict[str, Tuple[Tuple[int, dict], ...]] = {}
+        self._last = (None, None)  # (직전 프레임, 매칭 결과)
+        self.cache_hits = 0
+        self.compile(mapping_keys, excluded_axes)
+
+    def compile(self, mapping_keys: Iterable[Tuple[str, int, object]], excluded_axes: Iterable[int] = ()):
+        """매핑 키를 입력 타입별 인덱스 테이블로 컴파일"""
+        excluded_axes = set(excluded_axes)
+        tables = {input_type: {} for input_type in JOY_INPUT_TYPES}
+
+        for order, key in enumerate(mapping_keys):
+            input_type, index, expected_value = key
+            if input_type not in tables:
+                continue
+            if input_type == 'axes' and index in excluded_axes:
+                continue
+            # 같은 (index, value)가 중복되면 먼저 정의된 매핑 유지
+            tables[input_type].setdefault(index, {}).setdefault(expected_value, (order, key))
+
+        # 인덱스 오름차순 정렬 → 입력 길이를 넘는 인덱스에서 조기 종료 가능
+        self._tables = {input_type: tuple(sorted(table.items())) for input_type, table in tables.items()}
+        self._last = (None, None)
+
+    def resolve(self, joy_data: dict) -> Optional[Tuple[str, int, object]]:
+        """joy 입력과 일치하는 매핑 키 반환 (없으면 None)"""
+        axes = joy_data.get('axes') or ()
+        buttons = joy_data.get('buttons') or ()
+        frame = (tuple(axes), tuple(buttons))
+
+        last_frame, last_key = self._last
+        if frame == last_frame:
+            self.cache_hits += 1
+            return last_key
+
+        best = None
+        for values, table in zip(frame, (self._tables['axes'], self._tables['buttons'])):
+            count = len(values)
+            for index, expected in table:
+                if index >= count:
+                    break
+                try:
+                    hit = expected.get(values[index])
+                except TypeError:  # 해시 불가능한 값 (잘못된 입력)
+                    continue
+                if hit is not None and (best is None or hit[0] < best[0]):
+                    best = hit
+
+        key = best[1] if best else None
+        self._last = (frame, key)
+        return key
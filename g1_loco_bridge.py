@@ -6,7 +6,13 @@ import sys
 import ctypes
 from ctypes import Structure, POINTER, c_void_p, c_int, c_float, c_char_p
 import threading
-from typing import List, Tuple, Optional
+from contextlib import contextmanager
+from typing import Dict, List, Tuple, Optional
+
+from g1_metrics import InstrumentedLibrary, format_prometheus
+from g1_logger import get_logger
+
+logger = get_logger(__name__)
 
 # 구조체 정의 (C++ 헤더와 동일)
 class IntResult(Structure):
@@ -15,45 +21,80 @@ class IntResult(Structure):
 class FloatResult(Structure):
     _fields_ = [("code", c_int), ("value", c_float)]
 
+class LocoState(Structure):
+    _fields_ = [
+        ("fsm_id_code", c_int), ("fsm_id", c_int),
+        ("fsm_mode_code", c_int), ("fsm_mode", c_int),
+        ("balance_mode_code", c_int), ("balance_mode", c_int),
+        ("swing_height_code", c_int), ("swing_height", c_float),
+        ("stand_height_code", c_int), ("stand_height", c_float),
+    ]
+
+# get_state()가 반환하는 상태 필드
+LOCO_STATE_FIELDS = ("fsm_id", "fsm_mode", "balance_mode", "swing_height", "stand_height")
+
 class G1LocoBridge:
     """G1 LocoClient C++ Wrapper Bridge for Python"""
     
-    def __init__(self, network_interface: str = "eth0"):
+    # 백엔드별 공유 라이브러리 (sim: SDK 없이 동작하는 시뮬레이션 백엔드)
+    LIBRARY_NAMES = {
+        "sdk": "libg1_loco_wrapper.so",
+        "sim": "libg1_sim_wrapper.so",
+    }
+
+    def __init__(self, network_interface: str = "eth0", backend: str = "sdk", session=None):
+        if backend not in self.LIBRARY_NAMES:
+            raise ValueError(f"Unknown backend: {backend} (available: {list(self.LIBRARY_NAMES)})")
         self.network_interface = network_interface
+        self.backend = backend
+        self.session = session  # G1Session: 통합 라이브러리 공유 (None이면 개별 라이브러리 로드)
         self.handle = None
+        self.priority_handle = None  # 비상 정지 전용 핸들 (일반 명령과 분리)
+        self.priority_timeout = 1.0
         self.lib = None
         self._lock = threading.Lock()
+        # 핸들 사용 중인 호출 수 (해제는 진행 중인 호출이 모두 끝난 뒤에)
+        self._handle_cond = threading.Condition()
+        self._active_calls = 0
+        self._closing = False
         self._load_library()
     
     def _load_library(self):
         """C++ 공유 라이브러리 로드"""
         try:
-            # 라이브러리 경로 찾기
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            lib_paths = [
-                os.path.join(current_dir, "libg1_loco_wrapper.so"),
-                os.path.join(current_dir, "cpp_wrapper", "libg1_loco_wrapper.so"),
-                "./libg1_loco_wrapper.so"
-            ]
-
-            for lib_path in lib_paths:
-                if os.path.exists(lib_path):
-                    try:
-                        print(f"[INFO] Loading C++ library: {lib_path}")
-                        self.lib = ctypes.CDLL(lib_path)
-                        print(f"[SUCCESS] Loaded C++ library: {lib_path}")
-                        break
-                    except OSError as e:
-                        print(f"[ERROR] Failed to load {lib_path}: {e}")
-                        continue
-
-            if not self.lib:
-                raise RuntimeError(f"Could not find or load libg1_loco_wrapper.so in paths: {lib_paths}")
+            if self.session:
+                # 통합 라이브러리 공유 (SDK/DDS 한 벌, ChannelFactory는 세션이 초기화)
+                self.lib = self.session.lib
+            else:
+                # 라이브러리 경로 찾기
+                current_dir = os.path.dirname(os.path.abspath(__file__))
+                lib_name = self.LIBRARY_NAMES[self.backend]
+                lib_paths = [
+                    os.path.join(current_dir, lib_name),
+                    os.path.join(current_dir, "cpp_wrapper", lib_name),
+                    f"./{lib_name}"
+                ]
+
+                for lib_path in lib_paths:
+                    if os.path.exists(lib_path):
+                        try:
+                            logger.info(f"Loading C++ library: {lib_path}")
+                            self.lib = ctypes.CDLL(lib_path)
+                            logger.success(f"Loaded C++ library: {lib_path}")
+                            break
+                        except OSError as e:
+                            logger.error(f"Failed to load {lib_path}: {e}")
+                            continue
+
+                if not self.lib:
+                    raise RuntimeError(f"Could not find or load {lib_name} in paths: {lib_paths}")
 
             self._setup_function_signatures()
+            # 모든 SDK 호출의 지연/반환 코드 계측
+            self.lib = InstrumentedLibrary(self.lib, "loco")
 
         except Exception as e:
-            print(f"[ERROR] Library loading failed: {e}")
+            logger.error(f"Library loading failed: {e}")
             raise
     
     def _setup_function_signatures(self):
@@ -62,6 +103,11 @@ class G1LocoBridge:
         # 초기화/해제 함수들
         self.lib.create_loco_client.argtypes = [c_char_p]
         self.lib.create_loco_client.restype = c_void_p
+
+        # 구버전 라이브러리에는 없을 수 있음 (없으면 우선순위 명령도 기본 핸들 사용)
+        if hasattr(self.lib, 'create_loco_client_shared'):
+            self.lib.create_loco_client_shared.argtypes = []
+            self.lib.create_loco_client_shared.restype = c_void_p
         
         self.lib.destroy_loco_client.argtypes = [c_void_p]
         self.lib.destroy_loco_client.restype = None
@@ -87,6 +133,11 @@ class G1LocoBridge:
         
         self.lib.get_stand_height.argtypes = [c_void_p]
         self.lib.get_stand_height.restype = FloatResult
+
+        # 구버전 라이브러리에는 없을 수 있음 (없으면 get_state()가 개별 GET으로 대체)
+        if hasattr(self.lib, 'get_loco_state'):
+            self.lib.get_loco_state.argtypes = [c_void_p]
+            self.lib.get_loco_state.restype = LocoState
         
         # SET 함수들
         self.lib.set_fsm_id.argtypes = [c_void_p, c_int]
@@ -142,11 +193,11 @@ class G1LocoBridge:
         """로봇에 연결"""
         with self._lock:
             if self.handle:
-                print("[WARNING] Already connected")
+                logger.warning("Already connected")
                 return True
 
             try:
-                print(f"[INFO] Connecting to G1 robot via {self.network_interface}")
+                logger.info(f"Connecting to G1 robot via {self.network_interface}")
                 interface_bytes = self.network_interface.encode('utf-8')
 
                 self.handle = self.lib.create_loco_client(interface_bytes)
@@ -160,33 +211,81 @@ class G1LocoBridge:
 
                 self.lib.set_timeout(self.handle, 3.0)
 
-                print(f"[SUCCESS] Connected to G1 robot via {self.network_interface}")
+                self._create_priority_handle()
+
+                logger.success(f"Connected to G1 robot via {self.network_interface}")
                 return True
 
             except Exception as e:
-                print(f"[ERROR] Connection failed: {e}")
+                logger.error(f"Connection failed: {e}")
                 self._cleanup()
                 return False
 
+    def _create_priority_handle(self):
+        """비상 정지 전용 LocoClient 생성 (실패 시 기본 핸들로 대체)"""
+        if not hasattr(self.lib, 'create_loco_client_shared'):
+            logger.warning("create_loco_client_shared not available - stop shares the command handle")
+            return
+
+        try:
+            handle = self.lib.create_loco_client_shared()
+            if not handle:
+                raise RuntimeError("Failed to create priority loco client")
+
+            result = self.lib.init_loco_client(handle)
+            if result != 0:
+                self.lib.destroy_loco_client(handle)
+                raise RuntimeError(f"Priority client initialization failed - Code: {result}")
+
+            self.lib.set_timeout(handle, self.priority_timeout)
+            self.priority_handle = handle
+            logger.success("Priority loco client ready")
+        except Exception as e:
+            logger.warning(f"Priority loco client unavailable, using command handle: {e}")
+            self.priority_handle = None
+
     def _cleanup(self):
-        """정리"""
+        """정리 (새 호출은 거부하고 진행 중인 호출이 끝나면 핸들 해제)"""
+        with self._handle_cond:
+            self._closing = True
+            self._handle_cond.wait_for(lambda: self._active_calls == 0)
         try:
+            if self.priority_handle:
+                self.lib.destroy_loco_client(self.priority_handle)
+                self.priority_handle = None
             if self.handle:
                 self.lib.destroy_loco_client(self.handle)
                 self.handle = None
         except Exception as e:
-            print(f"[WARNING] Cleanup error: {e}")
+            logger.warning(f"Cleanup error: {e}")
+        finally:
+            with self._handle_cond:
+                self._closing = False
     
     def disconnect(self):
         """로봇 연결 해제"""
         with self._lock:
             self._cleanup()
-            print("[SUCCESS] Disconnected from G1 robot")
+            logger.success("Disconnected from G1 robot")
     
-    def _check_connection(self):
-        """연결 상태 확인"""
-        if not self.handle:
-            raise RuntimeError("Not connected to robot. Call connect() first.")
+    @contextmanager
+    def _use_handle(self, priority: bool = False):
+        """연결 확인 후 핸들 사용 (사용 중에는 _cleanup이 핸들을 해제하지 않음)
+
+        priority=True면 비상 정지 전용 핸들 (없으면 기본 핸들)
+        """
+        with self._handle_cond:
+            handle = (self.priority_handle or self.handle) if priority else self.handle
+            if not handle or self._closing:
+                raise RuntimeError("Not connected to robot. Call connect() first.")
+            self._active_calls += 1
+        try:
+            yield handle
+        finally:
+            with self._handle_cond:
+                self._active_calls -= 1
+                if self._active_calls == 0:
+                    self._handle_cond.notify_all()
     
     def _get_error_message(self, error_code: int) -> str:
         """오류 코드를 사람이 읽을 수 있는 메시지로 변환"""
@@ -208,150 +307,188 @@ class G1LocoBridge:
     # ========== GET 메소드들 ==========
     def get_fsm_id(self) -> Tuple[int, int]:
         """FSM ID 조회"""
-        self._check_connection()
-        try:
-            result = self.lib.get_fsm_id(self.handle)
-            return result.code, result.value
-        except Exception as e:
-            print(f"[ERROR] Exception in get_fsm_id: {e}")
-            raise
+        with self._use_handle() as handle:
+            try:
+                result = self.lib.get_fsm_id(handle)
+                return result.code, result.value
+            except Exception as e:
+                logger.error(f"Exception in get_fsm_id: {e}")
+                raise
     
     def get_fsm_mode(self) -> Tuple[int, int]:
         """FSM 모드 조회"""
-        self._check_connection()
-        result = self.lib.get_fsm_mode(self.handle)
+        with self._use_handle() as handle:
+            result = self.lib.get_fsm_mode(handle)
         return result.code, result.value
     
     def get_balance_mode(self) -> Tuple[int, int]:
         """밸런스 모드 조회"""
-        self._check_connection()
-        result = self.lib.get_balance_mode(self.handle)
+        with self._use_handle() as handle:
+            result = self.lib.get_balance_mode(handle)
         return result.code, result.value
     
     def get_swing_height(self) -> Tuple[int, float]:
         """스윙 높이 조회"""
-        self._check_connection()
-        result = self.lib.get_swing_height(self.handle)
+        with self._use_handle() as handle:
+            result = self.lib.get_swing_height(handle)
         return result.code, result.value
     
     def get_stand_height(self) -> Tuple[int, float]:
         """서있는 높이 조회"""
-        self._check_connection()
-        result = self.lib.get_stand_height(self.handle)
+        with self._use_handle() as handle:
+            result = self.lib.get_stand_height(handle)
         return result.code, result.value
     
+    def get_state(self) -> Dict[str, Tuple[int, float]]:
+        """전체 상태 조회 (FFI 호출 1회)
+
+        Returns:
+            {"fsm_id": (code, value), "fsm_mode": ..., "balance_mode": ...,
+             "swing_height": ..., "stand_height": ...}
+        """
+        if not hasattr(self.lib, 'get_loco_state'):
+            return {field: getattr(self, f"get_{field}")() for field in LOCO_STATE_FIELDS}
+
+        with self._use_handle() as handle:
+            state = self.lib.get_loco_state(handle)
+        return {field: (getattr(state, f"{field}_code"), getattr(state, field)) for field in LOCO_STATE_FIELDS}
+
     # ========== SET 메소드들 ==========
     def set_fsm_id(self, fsm_id: int) -> int:
         """FSM ID 설정"""
-        self._check_connection()
-        return self.lib.set_fsm_id(self.handle, fsm_id)
+        with self._use_handle() as handle:
+            return self.lib.set_fsm_id(handle, fsm_id)
     
     def set_balance_mode(self, balance_mode: int) -> int:
         """밸런스 모드 설정"""
-        self._check_connection()
-        return self.lib.set_balance_mode(self.handle, balance_mode)
+        with self._use_handle() as handle:
+            return self.lib.set_balance_mode(handle, balance_mode)
     
     def set_swing_height(self, swing_height: float) -> int:
         """스윙 높이 설정"""
-        self._check_connection()
-        return self.lib.set_swing_height(self.handle, swing_height)
+        with self._use_handle() as handle:
+            return self.lib.set_swing_height(handle, swing_height)
     
     def set_stand_height(self, stand_height: float) -> int:
         """서있는 높이 설정"""
-        self._check_connection()
-        return self.lib.set_stand_height(self.handle, stand_height)
+        with self._use_handle() as handle:
+            return self.lib.set_stand_height(handle, stand_height)
     
     def set_velocity(self, vx: float, vy: float, omega: float, duration: float = 1.0) -> int:
         """속도 설정"""
-        self._check_connection()
-        return self.lib.set_velocity(self.handle, vx, vy, omega, duration)
+        with self._use_handle() as handle:
+            return self.lib.set_velocity(handle, vx, vy, omega, duration)
     
     def set_task_id(self, task_id: int) -> int:
         """태스크 ID 설정"""
-        self._check_connection()
-        return self.lib.set_task_id(self.handle, task_id)
+        with self._use_handle() as handle:
+            return self.lib.set_task_id(handle, task_id)
     
     def set_speed_mode(self, speed_mode: int) -> int:
         """속도 모드 설정"""
-        self._check_connection()
-        return self.lib.set_speed_mode(self.handle, speed_mode)
+        with self._use_handle() as handle:
+            return self.lib.set_speed_mode(handle, speed_mode)
     
     # ========== 고수준 동작 메소드들 ==========
     def damp(self) -> int:
         """댐핑 모드"""
-        self._check_connection()
-        return self.lib.damp(self.handle)
+        with self._use_handle() as handle:
+            return self.lib.damp(handle)
     
     def start_robot(self) -> int:
         """로봇 시작"""
-        self._check_connection()
-        return self.lib.start_robot(self.handle)
+        with self._use_handle() as handle:
+            return self.lib.start_robot(handle)
     
     def stand_up(self) -> int:
         """일어서기"""
-        self._check_connection()
-        return self.lib.stand_up(self.handle)
+        with self._use_handle() as handle:
+            return self.lib.stand_up(handle)
     
     def squat(self) -> int:
         """쪼그려 앉기"""
-        self._check_connection()
-        return self.lib.squat(self.handle)
+        with self._use_handle() as handle:
+            return self.lib.squat(handle)
     
     def sit(self) -> int:
         """앉기"""
-        self._check_connection()
-        return self.lib.sit(self.handle)
+        with self._use_handle() as handle:
+            return self.lib.sit(handle)
     
     def zero_torque(self) -> int:
         """제로 토크"""
-        self._check_connection()
-        return self.lib.zero_torque(self.handle)
+        with self._use_handle() as handle:
+            return self.lib.zero_torque(handle)
     
     def stop_move(self) -> int:
         """이동 정지"""
-        self._check_connection()
-        return self.lib.stop_move(self.handle)
+        with self._use_handle() as handle:
+            return self.lib.stop_move(handle)
     
     def high_stand(self) -> int:
         """높은 자세로 서기"""
-        self._check_connection()
-        return self.lib.high_stand(self.handle)
+        with self._use_handle() as handle:
+            return self.lib.high_stand(handle)
     
     def low_stand(self) -> int:
         """낮은 자세로 서기"""
-        self._check_connection()
-        return self.lib.low_stand(self.handle)
+        with self._use_handle() as handle:
+            return self.lib.low_stand(handle)
     
     def balance_stand(self) -> int:
         """밸런스 서기"""
-        self._check_connection()
-        return self.lib.balance_stand(self.handle)
+        with self._use_handle() as handle:
+            return self.lib.balance_stand(handle)
     
     def continuous_gait(self, flag: bool) -> int:
         """연속 보행 설정"""
-        self._check_connection()
-        return self.lib.continuous_gait(self.handle, 1 if flag else 0)
+        with self._use_handle() as handle:
+            return self.lib.continuous_gait(handle, 1 if flag else 0)
     
     def switch_move_mode(self, flag: bool) -> int:
         """이동 모드 전환"""
-        self._check_connection()
-        return self.lib.switch_move_mode(self.handle, 1 if flag else 0)
+        with self._use_handle() as handle:
+            return self.lib.switch_move_mode(handle, 1 if flag else 0)
     
     def move_robot(self, vx: float, vy: float, vyaw: float) -> int:
         """로봇 이동"""
-        self._check_connection()
-        return self.lib.move_robot(self.handle, vx, vy, vyaw)
-    
+        with self._use_handle() as handle:
+            return self.lib.move_robot(handle, vx, vy, vyaw)
+    
+    # ========== 우선순위 명령 (락 없음, 전용 핸들 사용) ==========
+    def priority_stop_move(self) -> int:
+        """비상 정지 - 일반 명령 처리 중에도 전용 핸들로 즉시 전송"""
+        with self._use_handle(priority=True) as handle:
+            return self.lib.stop_move(handle)
+
+    def priority_damp(self) -> int:
+        """비상 댐핑 - 일반 명령 처리 중에도 전용 핸들로 즉시 전송"""
+        with self._use_handle(priority=True) as handle:
+            return self.lib.damp(handle)
+
     def wave_hand(self, turn_flag: bool = False) -> int:
         """손 흔들기"""
-        self._check_connection()
-        return self.lib.wave_hand(self.handle, 1 if turn_flag else 0)
+        with self._use_handle() as handle:
+            return self.lib.wave_hand(handle, 1 if turn_flag else 0)
     
     def shake_hand(self, stage: int = -1) -> int:
         """악수 동작"""
-        self._check_connection()
-        return self.lib.shake_hand(self.handle, stage)
+        with self._use_handle() as handle:
+            return self.lib.shake_hand(handle, stage)
     
+    # ========== 계측 ==========
+    def get_metrics(self) -> Dict[str, dict]:
+        """SDK 함수별 호출 수, 반환 코드 분포, 지연(µs) 통계"""
+        return self.lib.get_metrics()
+
+    def get_metrics_text(self) -> str:
+        """Prometheus 텍스트 형식 메트릭"""
+        return format_prometheus({"loco": self.get_metrics()})
+
+    def reset_metrics(self):
+        """메트릭 초기화"""
+        self.lib.reset_metrics()
+
     def __del__(self):
         """소멸자"""
         self.disconnect()
\ No newline at end of file
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import atexit
+import json
+import queue
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, Optional
+
+# 로그 레벨 (기존 출력 태그와 동일한 이름)
+DEBUG = 10
+INFO = 20
+CONTROL = 22
+SUCCESS = 25
+WARNING = 30
+ERROR = 40
+
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", CONTROL: "CONTROL", SUCCESS: "SUCCESS",
+               WARNING: "WARNING", ERROR: "ERROR"}
+LEVELS = {name: level for level, name in LEVEL_NAMES.items()}
+
+# 반복 억제 대상 레벨 (CONTROL과 WARNING 이상은 명령/오류 추적을 위해 항상 출력)
+RATE_LIMITED_LEVELS = frozenset((DEBUG, INFO, SUCCESS))
+
+
+class _LogWriter:
+    """로그 레코드 큐 + 백그라운드 출력 스레드 (모든 로거가 공유)
+
+    - 호출 스레드는 레코드를 큐에 넣기만 하고 즉시 반환 (stdout이 막혀도 제어 경로는 대기하지 않음)
+    - 큐가 가득 차면 레코드를 버리고 dropped로 집계
+    - 같은 메시지(DEBUG/INFO/SUCCESS)가 rate_limit_interval 안에 반복되면 출력하지 않고
+      다음 출력에 반복 횟수 표시, 다시 나오지 않으면 구간이 끝난 뒤(또는 flush 시) 억제 횟수만 출력
+    """
+
+    def __init__(self, level: int = INFO, rate_limit_interval: float = 1.0,
+                 max_queue: int = 10000, fmt: str = "text", stream=None):
+        self.level = level
+        self.rate_limit_interval = rate_limit_interval
+        self.fmt = fmt
+        self.stream = stream  # None이면 출력 시점의 sys.stdout
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._last_emit: Dict[tuple, list] = {}  # (level, message) → [마지막 출력 시각, 억제 횟수, 로거 이름]
+        self._thread = None
+        self._next_expiry_check = 0.0  # 다음 억제 구간 만료 확인 시각 (writer 스레드 전용)
+
+        self._stats = {"written": 0, "dropped": 0, "suppressed": 0}
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._writer_loop, name="G1LogWriter", daemon=True)
+                    self._thread.start()
+
+    def log(self, name: str, level: int, message: str, fields: Optional[dict] = None):
+        if level < self.level:
+            return
+
+        now = time.monotonic()
+        repeated = 0
+        summaries = ()
+        if self.rate_limit_interval > 0 and level in RATE_LIMITED_LEVELS:
+            key = (level, message)
+            with self._lock:
+                entry = self._last_emit.get(key)
+                if entry is not None and now - entry[0] < self.rate_limit_interval:
+                    entry[1] += 1
+                    self._stats["suppressed"] += 1
+                    return
+                if entry is not None:
+                    repeated = entry[1]
+                if len(self._last_emit) > 1024:
+                    # 버리기 전에 남은 억제 횟수를 출력
+                    summaries = self._take_suppressed()
+                    self._last_emit.clear()
+                self._last_emit[key] = [now, 0, name]
+
+        self._ensure_thread()
+        for record in summaries:
+            self._enqueue(record)
+        self._enqueue((time.time(), name, level, message, fields, repeated, False))
+
+    def _enqueue(self, record):
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self._stats["dropped"] += 1
+
+    def _take_suppressed(self, expired_before: Optional[float] = None):
+        """억제 횟수가 남은 메시지의 요약 레코드 (lock 안에서 호출)
+
+        expired_before가 주어지면 그 시각 이전에 출력된(억제 구간이 끝난) 메시지만 요약하고 항목 제거
+        """
+        records = []
+        for key, entry in list(self._last_emit.items()):
+            if expired_before is not None:
+                if entry[0] >= expired_before:
+                    continue
+                del self._last_emit[key]
+            if entry[1]:
+                level, message = key
+                records.append((time.time(), entry[2], level, message, None, entry[1], True))
+                entry[1] = 0
+        return records
+
+    def _format(self, record) -> str:
+        timestamp, name, level, message, fields, repeated, summary = record
+        if self.fmt == "json":
+            data = {"ts": timestamp, "level": LEVEL_NAMES.get(level, str(level)), "logger": name, "msg": message}
+            if fields:
+                data.update(fields)
+            if repeated:
+                data["suppressed" if summary else "repeated"] = repeated
+            return json.dumps(data, default=str)
+
+        line = f"[{LEVEL_NAMES.get(level, level)}] {message}"
+        if fields:
+            line += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        if summary:
+            line += f" (suppressed {repeated} repeats)"
+        elif repeated:
+            line += f" (repeated {repeated} times)"
+        return line
+
+    def _flush_expired(self):
+        """억제 구간이 끝났는데 다시 나오지 않은 메시지의 억제 횟수 출력"""
+        interval = self.rate_limit_interval
+        now = time.monotonic()
+        if interval <= 0 or now < self._next_expiry_check:
+            return
+        self._next_expiry_check = now + interval
+        with self._lock:
+            records = self._take_suppressed(expired_before=now - interval)
+        for record in records:
+            self._enqueue(record)
+
+    def _writer_loop(self):
+        while True:
+            try:
+                record = self._queue.get(timeout=max(self.rate_limit_interval, 0.1))
+            except queue.Empty:
+                self._flush_expired()
+                continue
+            try:
+                stream = self.stream or sys.stdout
+                stream.write(self._format(record) + "\n")
+                # 큐가 비었을 때만 flush (연속 기록은 한 번에)
+                if self._queue.empty():
+                    stream.flush()
+                with self._lock:
+                    self._stats["written"] += 1
+            except Exception:
+                pass
+            finally:
+                self._queue.task_done()
+            self._flush_expired()
+
+    def flush(self, timeout: float = 1.0):
+        """억제 횟수를 포함해 큐에 쌓인 로그가 출력될 때까지 대기 (최대 timeout초)"""
+        if self._thread is None:
+            return
+        with self._lock:
+            records = self._take_suppressed()
+        for record in records:
+            self._enqueue(record)
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["queued"] = self._queue.qsize()
+        return stats
+
+
+_writer = _LogWriter()
+atexit.register(_writer.flush)
+
+
+class G1Logger:
+    """모듈별 로거 (출력은 공유 백그라운드 writer가 담당)
+
+    사용법:
+        logger = get_logger(__name__)
+        logger.info("Connected")                      # [INFO] Connected
+        logger.control("Move Forward", vx=0.3)        # [CONTROL] Move Forward vx=0.3
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def log(self, level: int, message: str, **fields):
+        _writer.log(self.name, level, message, fields or None)
+
+    def debug(self, message: str, **fields):
+        _writer.log(self.name, DEBUG, message, fields or None)
+
+    def info(self, message: str, **fields):
+        _writer.log(self.name, INFO, message, fields or None)
+
+    def control(self, message: str, **fields):
+        _writer.log(self.name, CONTROL, message, fields or None)
+
+    def success(self, message: str, **fields):
+        _writer.log(self.name, SUCCESS, message, fields or None)
+
+    def warning(self, message: str, **fields):
+        _writer.log(self.name, WARNING, message, fields or None)
+
+    def error(self, message: str, exc_info: bool = False, **fields):
+        if exc_info:
+            message = f"{message}\n{traceback.format_exc().rstrip()}"
+        _writer.log(self.name, ERROR, message, fields or None)
+
+
+_loggers: Dict[str, G1Logger] = {}
+
+
+def get_logger(name: str) -> G1Logger:
+    """이름별 로거 (같은 이름이면 같은 객체)"""
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers.setdefault(name, G1Logger(name))
+    return logger
+
+
+def configure_logging(level=None, rate_limit_interval: Optional[float] = None,
+                      fmt: Optional[str] = None, stream=None):
+    """로그 설정 (level: 이름 또는 숫자, fmt: "text" | "json", stream: 출력 대상)"""
+    if level is not None:
+        _writer.level = LEVELS[level.upper()] if isinstance(level, str) else level
+    if rate_limit_interval is not None:
+        _writer.rate_limit_interval = rate_limit_interval
+    if fmt is not None:
+        _writer.fmt = fmt
+    if stream is not None:
+        _writer.stream = stream
+
+
+def flush_logging(timeout: float = 1.0):
+    """대기 중인 로그 출력 (종료 전, 콘솔 출력 직전 등)"""
+    _writer.flush(timeout)
+
+
+def get_logging_stats() -> Dict[str, int]:
+    """로거 통계 (written, dropped, suppressed, queued)"""
+    return _writer.get_stats()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import ctypes
+import threading
+import time
+from operator import attrgetter
+from typing import Dict, Optional
+
+
+class LatencyHistogram:
+    """고정 메모리 로그 버킷 지연 히스토그램 (HDR 방식, 단위 µs)
+
+    - 0~31 µs는 1 µs 단위, 이후 2배 구간마다 16개 버킷 (상대 오차 6.25% 이내)
+    - 버킷 수가 고정되어 기록 횟수와 무관하게 메모리 일정
+    """
+
+    SUB_BUCKETS = 16
+    LINEAR_LIMIT = 2 * SUB_BUCKETS  # 이 값 미만은 1 µs 단위 버킷
+    MAX_EXPONENT = 32               # 최대 약 2^37 µs (~38시간), 초과 값은 마지막 버킷
+
+    def __init__(self):
+        self.size = self.LINEAR_LIMIT + self.MAX_EXPONENT * self.SUB_BUCKETS
+        self.counts = [0] * self.size
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        if value < self.LINEAR_LIMIT:
+            return value
+        exponent = value.bit_length() - 5
+        index = self.LINEAR_LIMIT + (exponent - 1) * self.SUB_BUCKETS + (value >> exponent) - self.SUB_BUCKETS
+        return min(index, self.size - 1)
+
+    def _bucket_value(self, index: int) -> int:
+        """버킷의 대표값 (버킷 상한)"""
+        if index < self.LINEAR_LIMIT:
+            return index
+        exponent = (index - self.LINEAR_LIMIT) // self.SUB_BUCKETS + 1
+        mantissa = (index - self.LINEAR_LIMIT) % self.SUB_BUCKETS + self.SUB_BUCKETS
+        return ((mantissa + 1) << exponent) - 1
+
+    def record(self, value_us: int):
+        """지연 기록 (µs, 0 이상의 정수)"""
+        if value_us < self.LINEAR_LIMIT:
+            self.counts[value_us] += 1
+        else:
+            self.counts[self._index(value_us)] += 1
+        self.count += 1
+        self.total += value_us
+        if self.min is None or value_us < self.min:
+            self.min = value_us
+        if value_us > self.max:
+            self.max = value_us
+
+    def percentile(self, pct: float) -> int:
+        """백분위 지연 (µs, 버킷 정밀도), 기록이 없으면 0"""
+        if self.count == 0:
+            return 0
+        target = max(1, int(round(pct / 100.0 * self.count)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(self._bucket_value(index), self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, float]:
+        """요약 통계 (µs)"""
+        return {
+            "count": self.count,
+            "mean_us": self.total / self.count if self.count else 0.0,
+            "min_us": self.min or 0,
+            "p50_us": self.percentile(50),
+            "p90_us": self.percentile(90),
+            "p99_us": self.percentile(99),
+            "max_us": self.max,
+        }
+
+    def reset(self):
+        self.counts = [0] * self.size
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+
+def _code_getter(restype):
+    """함수 반환 타입에서 반환 코드를 꺼내는 함수 (코드가 없으면 None)"""
+    if restype is None:
+        return None
+    if restype is ctypes.c_int:
+        return lambda result: result
+    if isinstance(restype, type) and issubclass(restype, ctypes.Structure):
+        names = [field[0] for field in restype._fields_]
+        if "code" in names:
+            return attrgetter("code")
+        code_fields = [name for name in names if name.endswith("_code")]
+        if code_fields:
+            # 여러 필드 결과 (LocoState): 첫 번째 실패 코드, 모두 성공이면 0
+            def first_error(result):
+                for name in code_fields:
+                    code = getattr(result, name)
+                    if code != 0:
+                        return code
+                return 0
+            return first_error
+    return None
+
+
+class _FunctionMetrics:
+    __slots__ = ("calls", "errors", "exceptions", "codes", "histogram")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.exceptions = 0
+        self.codes = {}
+        self.histogram = LatencyHistogram()
+
+
+class InstrumentedLibrary:
+    """ctypes 라이브러리 래퍼: 함수별 호출 수, 반환 코드 분포, 지연 히스토그램 기록
+
+    함수 시그니처(argtypes/restype) 설정이 끝난 라이브러리를 감싸서 사용한다.
+    속성 접근은 원본 라이브러리로 위임되고, 호출 가능한 함수는 계측 래퍼로 캐시된다.
+    call_recorder가 설정되면 각 호출을 record_call(name, args, code, duration_us)로 전달한다.
+    """
+
+    def __init__(self, lib, name: str):
+        self._lib = lib
+        self.name = name
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _FunctionMetrics] = {}
+        self._wrappers = {}
+        self.call_recorder = None  # 플라이트 레코더 (선택)
+
+    def __getattr__(self, function_name):
+        wrapper = self._wrappers.get(function_name)
+        if wrapper is None:
+            wrapper = self._wrap(function_name, getattr(self._lib, function_name))
+            self._wrappers[function_name] = wrapper
+        return wrapper
+
+    def _wrap(self, function_name, func):
+        metrics = self._metrics.setdefault(function_name, _FunctionMetrics())
+        get_code = _code_getter(getattr(func, "restype", None))
+        histogram = metrics.histogram
+        perf = time.perf_counter_ns
+        lock = self._lock
+        owner = self
+
+        def instrumented(*args):
+            start = perf()
+            try:
+                result = func(*args)
+            except Exception:
+                with lock:
+                    metrics.calls += 1
+                    metrics.exceptions += 1
+                    histogram.record((perf() - start) // 1000)
+                raise
+            elapsed_us = (perf() - start) // 1000
+            code = get_code(result) if get_code else None
+
+            with lock:
+                metrics.calls += 1
+                histogram.record(elapsed_us)
+                if code is not None:
+                    metrics.codes[code] = metrics.codes.get(code, 0) + 1
+                    if code != 0:
+                        metrics.errors += 1
+
+            recorder = owner.call_recorder
+            if recorder is not None:
+                recorder.record_call(function_name, args, code, elapsed_us)
+            return result
+
+        instrumented.__name__ = function_name
+        return instrumented
+
+    def get_metrics(self) -> Dict[str, dict]:
+        """함수별 메트릭 {function: {calls, errors, exceptions, codes, latency}}"""
+        with self._lock:
+            return {
+                function_name: {
+                    "calls": metrics.calls,
+                    "errors": metrics.errors,
+                    "exceptions": metrics.exceptions,
+                    "codes": dict(metrics.codes),
+                    "latency": metrics.histogram.snapshot(),
+                }
+                for function_name, metrics in self._metrics.items()
+                if metrics.calls
+            }
+
+    def reset_metrics(self):
+        with self._lock:
+            for metrics in self._metrics.values():
+                metrics.calls = metrics.errors = metrics.exceptions = 0
+                metrics.codes.clear()
+                metrics.histogram.reset()
+
+
+def format_prometheus(metrics_by_bridge: Dict[str, Optional[Dict[str, dict]]]) -> str:
+    """브릿지별 get_metrics() 결과를 Prometheus 텍스트 형식으로 변환"""
+    lines = [
+        "# HELP g1_bridge_calls_total SDK wrapper calls by return code",
+        "# TYPE g1_bridge_calls_total counter",
+    ]
+    latency_lines = [
+        "# HELP g1_bridge_call_latency_seconds SDK wrapper call latency",
+        "# TYPE g1_bridge_call_latency_seconds summary",
+    ]
+    exception_lines = [
+        "# HELP g1_bridge_exceptions_total SDK wrapper calls that raised",
+        "# TYPE g1_bridge_exceptions_total counter",
+    ]
+
+    for bridge, functions in sorted(metrics_by_bridge.items()):
+        for function_name, metrics in sorted((functions or {}).items()):
+            labels = f'bridge="{bridge}",function="{function_name}"'
+            codes = metrics["codes"] or {"none": metrics["calls"] - metrics["exceptions"]}
+            for code, count in sorted(codes.items(), key=lambda item: str(item[0])):
+                lines.append(f'g1_bridge_calls_total{{{labels},code="{code}"}} {count}')
+
+            latency = metrics["latency"]
+            for quantile, key in (("0.5", "p50_us"), ("0.9", "p90_us"), ("0.99", "p99_us")):
+                latency_lines.append(
+                    f'g1_bridge_call_latency_seconds{{{labels},quantile="{quantile}"}} {latency[key] / 1e6:.6f}')
+            latency_lines.append(
+                f'g1_bridge_call_latency_seconds_sum{{{labels}}} {latency["mean_us"] * latency["count"] / 1e6:.6f}')
+            latency_lines.append(f'g1_bridge_call_latency_seconds_count{{{labels}}} {latency["count"]}')
+
+            exception_lines.append(f'g1_bridge_exceptions_total{{{labels}}} {metrics["exceptions"]}')
+
+    return "\n".join(lines + latency_lines + exception_lines) + "\n"
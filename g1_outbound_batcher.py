@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from g1_logger import get_logger
+
+logger = get_logger(__name__)
+
+# 여러 메시지를 묶어 보낼 때의 토픽 (value: 메시지 리스트)
+BATCH_TOPIC = "batch"
+
+
+def _dedupe_key(message: dict):
+    value = message.get('value')
+    try:
+        hash(value)
+    except TypeError:
+        value = repr(value)
+    return message.get('topic'), value, message.get('target')
+
+
+class G1OutboundBatcher:
+    """송신 메시지(callback/echo) 묶음 전송
+
+    - 첫 메시지가 들어온 뒤 window 초 동안 모인 메시지를 하나의 batch 메시지로 전송
+      {'topic': 'batch', 'value': [message, ...], 'target': 'all'}
+    - 모인 메시지가 하나뿐이면 묶지 않고 원래 메시지 그대로 전송 (저속 입력에서는 기존과 동일)
+    - 같은 window 안의 동일한 메시지(topic, value, target)는 하나로 합치고 'count'에 반복 횟수 기록
+    - max_batch개가 모이면 window를 기다리지 않고 바로 전송
+    """
+
+    def __init__(self, publish: Callable[[dict], None], window: float = 0.05, max_batch: int = 64,
+                 dedupe: bool = True):
+        self.publish = publish
+        self.window = window
+        self.max_batch = max_batch
+        self.dedupe = dedupe
+
+        self._cond = threading.Condition()
+        self._pending = OrderedDict()
+        self._first_at = None
+        self._running = False
+        self._thread = None
+        self._ids = 0
+
+        self._stats = {"received": 0, "published": 0, "batches": 0, "deduplicated": 0}
+
+    def start(self):
+        """전송 스레드 시작"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._flush_loop, name="G1OutboundBatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """전송 스레드 종료 (남은 메시지는 전송)"""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+        self._flush()
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def add(self, message: dict):
+        """송신 메시지 추가 (즉시 반환)"""
+        with self._cond:
+            self._stats["received"] += 1
+            if self.dedupe:
+                key = _dedupe_key(message)
+            else:
+                key = self._ids
+                self._ids += 1
+
+            entry = self._pending.get(key)
+            if entry is not None:
+                entry[1] += 1
+                self._stats["deduplicated"] += 1
+                return
+
+            self._pending[key] = [message, 1]
+            if self._first_at is None:
+                self._first_at = time.monotonic()
+            self._cond.notify()
+
+    def _flush_loop(self):
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                # window가 끝나거나 max_batch가 찰 때까지 모음
+                while self._running and len(self._pending) < self.max_batch:
+                    remaining = self._first_at + self.window - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+            self._flush()
+
+    def _flush(self):
+        """모인 메시지 전송"""
+        with self._cond:
+            entries = list(self._pending.values())
+            self._pending.clear()
+            self._first_at = None
+        if not entries:
+            return
+
+        messages = []
+        for message, count in entries:
+            if count > 1:
+                message = dict(message, count=count)
+            messages.append(message)
+
+        if len(messages) == 1:
+            outbound = messages[0]
+        else:
+            outbound = {'topic': BATCH_TOPIC, 'value': messages, 'target': 'all'}
+
+        with self._cond:
+            self._stats["published"] += 1
+            self._stats["batches"] += 1 if len(messages) > 1 else 0
+        try:
+            self.publish(outbound)
+        except Exception as e:
+            logger.error(f"Outbound publish failed: {e}")
+
+    def get_stats(self):
+        """전송 통계 (received: 추가된 메시지 수, published: 실제 전송한 메시지 수)"""
+        with self._cond:
+            stats = dict(self._stats)
+            stats["pending"] = len(self._pending)
+        return stats
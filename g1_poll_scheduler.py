@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+
+
+class G1AdaptivePollScheduler:
+    """상태 폴링 주기 적응형 스케줄러
+
+    - 명령 실행이나 FSM 전환 직후 fast_window 동안은 fast_interval로 빠르게 폴링
+    - 이후 활동이 없으면 backoff 배율로 주기를 늘려 idle_interval까지 감소
+    - 작업 시간과 무관하게 deadline 기준으로 대기 (sleep-after-work 드리프트 없음)
+    - 대기 중 notify_activity()가 호출되면 즉시 깨어나 빠른 폴링으로 복귀
+    """
+
+    def __init__(self, fast_interval: float = 0.05, idle_interval: float = 1.0,
+                 fast_window: float = 2.0, backoff: float = 1.5):
+        self.fast_interval = fast_interval
+        self.idle_interval = idle_interval
+        self.fast_window = fast_window
+        self.backoff = backoff
+
+        self.interval = fast_interval
+        self._last_activity = time.monotonic()
+        self._next_deadline = time.monotonic()
+        self._wakeup = threading.Event()
+        self._stopped = False
+
+    def notify_activity(self):
+        """명령 실행/FSM 전환 알림 → 빠른 폴링으로 전환"""
+        self._last_activity = time.monotonic()
+        if self.interval > self.fast_interval:
+            self.interval = self.fast_interval
+            self._wakeup.set()
+
+    def stop(self):
+        """대기 중인 wait()를 깨우고 이후 wait()는 False 반환"""
+        self._stopped = True
+        self._wakeup.set()
+
+    def wait(self) -> bool:
+        """다음 폴링 시각까지 대기, 스케줄러가 중지되었으면 False"""
+        now = time.monotonic()
+        if now - self._last_activity > self.fast_window:
+            self.interval = min(self.idle_interval, self.interval * self.backoff)
+
+        self._next_deadline += self.interval
+        if self._next_deadline < now:
+            # 한 주기 이상 밀렸으면 따라잡지 않고 기준 시각 재설정
+            self._next_deadline = now
+
+        delay = self._next_deadline - now
+        if delay > 0 and self._wakeup.wait(delay):
+            # 활동 알림으로 깨어남 → 바로 폴링
+            self._wakeup.clear()
+            self._next_deadline = time.monotonic()
+
+        return not self._stopped
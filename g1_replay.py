@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""G1 플라이트 레코더 기록 조회/재생
+
+사용법:
+    python3 g1_replay.py dump recording.bin [--kind joy call state] [--limit 100]
+    python3 g1_replay.py replay recording.bin [--speed 1.0] [--fsm-id 500] [--record replay.bin]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(sys.executable), "../..")))
+
+from g1_flight_recorder import (KIND_CALL, KIND_JOY, KIND_NAMES, KIND_STATE,
+                                joy_from_record, read_records)
+from g1_logger import flush_logging
+
+KINDS = {name: kind for kind, name in KIND_NAMES.items()}
+
+
+def _format_record(record):
+    """레코드 한 줄 요약"""
+    timestamp = datetime.fromtimestamp(record.timestamp).strftime("%H:%M:%S.%f")[:-3]
+    kind = KIND_NAMES.get(record.kind, str(record.kind))
+
+    if record.kind == KIND_JOY:
+        joy = joy_from_record(record)
+        pressed = [index for index, value in enumerate(joy['buttons']) if value]
+        detail = f"axes={[round(value, 3) for value in joy['axes']]} buttons={pressed}"
+    elif record.kind == KIND_CALL:
+        args = ", ".join(f"{value:.3f}" for value in record.values[:record.flags])
+        detail = f"{record.name}({args}) -> {record.code} [{record.duration_us} us]"
+    elif record.kind == KIND_STATE:
+        fsm_mode, balance_mode, swing_height, stand_height = record.values[:4]
+        detail = (f"fsm_id={record.code} fsm_mode={fsm_mode:.0f} balance_mode={balance_mode:.0f}"
+                  f" swing_height={swing_height:.3f} stand_height={stand_height:.3f}")
+    else:
+        detail = record.name
+
+    return f"{record.seq:8d} {timestamp} {kind:5s} {detail}"
+
+
+def dump(args):
+    """기록 내용 출력"""
+    records = read_records(args.path)
+    kinds = {KINDS[name] for name in args.kind} if args.kind else None
+    selected = [record for record in records if kinds is None or record.kind in kinds]
+    if args.limit:
+        selected = selected[-args.limit:]
+
+    for record in selected:
+        print(_format_record(record))
+
+    counts = Counter(KIND_NAMES.get(record.kind, record.kind) for record in records)
+    print(f"\n{len(records)} records ({', '.join(f'{k}: {v}' for k, v in sorted(counts.items()))})")
+
+
+def replay(args):
+    """기록된 /joy 입력을 G1BaseController.receive_message로 재생 (시뮬레이션 백엔드)"""
+    from gerri.robot.examples.unitree_g1.g1_base_controller import G1BaseController
+    from gerri.robot.examples.unitree_g1.g1_sub_controller import G1SubController
+    from g1_sim_backend import G1SimBackend
+
+    records = read_records(args.path)
+    joy_records = [record for record in records if record.kind == KIND_JOY]
+    if not joy_records:
+        print("No /joy records to replay")
+        return
+
+    # 재생 시작 FSM: 지정값, 없으면 첫 /joy 이전의 마지막 상태 샘플
+    fsm_id = args.fsm_id
+    if fsm_id is None:
+        fsm_id = 0
+        for record in records:
+            if record.seq > joy_records[0].seq:
+                break
+            if record.kind == KIND_STATE and record.aux == 0:
+                fsm_id = record.code
+
+    sim = G1SimBackend()
+    sim.set_seed(0)
+    sim.configure(args.sim_latency_ms, 0.0, 0.0)
+
+    robot_info = {"id": "replay", "model": "unitree_g1", "category": "sample"}
+    sub_controller = G1SubController(backend="sim", flight_recorder_path=args.record)
+    robot = G1BaseController(robot_info, sub_controller=sub_controller)
+    robot.connect()
+    sim.reset(fsm_id)
+
+    print(f"[INFO] Replaying {len(joy_records)} /joy messages at x{args.speed} (start FSM {fsm_id})")
+    start = time.monotonic()
+    origin = joy_records[0].timestamp
+    for record in joy_records:
+        # 원본 간격을 speed 배율로 압축해서 전송
+        delay = (record.timestamp - origin) / args.speed - (time.monotonic() - start)
+        if delay > 0:
+            time.sleep(delay)
+        robot.receive_message({'topic': '/joy', 'value': joy_from_record(record)})
+    elapsed = time.monotonic() - start
+    time.sleep(0.2)
+
+    replayed = Counter()
+    for bridge_metrics in sub_controller.get_bridge_metrics().values():
+        for name, metrics in bridge_metrics.items():
+            if not name.startswith("get_"):
+                replayed[name] += metrics["calls"]
+    sub_controller.disconnect()
+    flush_logging()
+
+    # 원본 기록과 재생 결과의 SDK 명령 호출 수 비교
+    recorded = Counter(record.name for record in records if record.kind == KIND_CALL)
+    print(f"\nReplayed in {elapsed:.2f} s (original {joy_records[-1].timestamp - origin:.2f} s)")
+    print(f"{'SDK call':24s} {'recorded':>9s} {'replayed':>9s}")
+    for name in sorted(set(recorded) | set(replayed)):
+        print(f"{name:24s} {recorded[name]:9d} {replayed[name]:9d}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="G1 flight recorder tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    dump_parser = subparsers.add_parser("dump", help="print recorded records")
+    dump_parser.add_argument("path")
+    dump_parser.add_argument("--kind", nargs="+", choices=sorted(KINDS), help="record kinds to show")
+    dump_parser.add_argument("--limit", type=int, default=0, help="show only the last N records")
+    dump_parser.set_defaults(func=dump)
+
+    replay_parser = subparsers.add_parser("replay", help="replay /joy records against the simulated backend")
+    replay_parser.add_argument("path")
+    replay_parser.add_argument("--speed", type=float, default=1.0, help="playback speed factor")
+    replay_parser.add_argument("--fsm-id", type=int, help="initial FSM ID (default: last recorded state)")
+    replay_parser.add_argument("--sim-latency-ms", type=float, default=2.0, help="simulated RPC latency")
+    replay_parser.add_argument("--record", help="record the replay session to this file")
+    replay_parser.set_defaults(func=replay)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,10 @@ import time
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(sys.executable), "../..")))
 
 from _and_.and_robot import AdaptiveNetworkDaemon
-from g1_config import ROBOT_INFO, VIDEO_INFO, AUDIO_INFO
+from g1_config import ROBOT_INFO, VIDEO_INFO, AUDIO_INFO, BACKEND_INFO, CONTROL_INFO, LOG_INFO
+from g1_logger import configure_logging
+
+configure_logging(**LOG_INFO)
 
 # Initialize communication module (AND)
 daemon = AdaptiveNetworkDaemon(
@@ -24,7 +27,7 @@ daemon.connect()
 from gerri.robot.examples.unitree_g1.g1_base_controller import G1BaseController
 from gerri.robot.examples.unitree_g1.g1_sub_controller import G1SubController
 
-robot = G1BaseController(ROBOT_INFO, sub_controller=G1SubController())
+robot = G1BaseController(ROBOT_INFO, sub_controller=G1SubController(**BACKEND_INFO), **CONTROL_INFO)
 robot.connect()
 
 # Keep process alive
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import ctypes
+import os
+import time
+from contextlib import contextmanager
+from ctypes import c_char_p, c_double, c_int
+from typing import Dict
+
+from g1_logger import get_logger
+
+logger = get_logger(__name__)
+
+# g1_session.h와 동일
+SESSION_ERR_INTERFACE_MISMATCH = -2
+
+
+class G1Session:
+    """SDK 세션 (통합 라이브러리 libg1_wrapper.so 하나를 loco/arm 브릿지가 공유)
+
+    - 라이브러리는 한 번만 로드되므로 SDK/DDS도 프로세스에 한 벌만 올라감
+    - ChannelFactory 초기화는 g1_session_init에서 한 번만 수행 (여러 번 호출해도 안전),
+      따라서 loco/arm 클라이언트 생성 순서와 무관
+    - 단계별 시작 시간(ms) 기록: load_library, channel_factory_init, 그리고 phase()로 감싼 단계
+    """
+
+    LIBRARY_NAMES = {
+        "sdk": "libg1_wrapper.so",
+        "sim": "libg1_sim_wrapper.so",
+    }
+
+    def __init__(self, network_interface: str = "eth0", backend: str = "sdk"):
+        if backend not in self.LIBRARY_NAMES:
+            raise ValueError(f"Unknown backend: {backend} (available: {list(self.LIBRARY_NAMES)})")
+        self.network_interface = network_interface
+        self.backend = backend
+        self.lib = None
+        self._timings: Dict[str, float] = {}
+
+        with self.phase("load_library"):
+            self._load_library()
+
+    def _load_library(self):
+        """통합 공유 라이브러리 로드"""
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        lib_name = self.LIBRARY_NAMES[self.backend]
+        lib_paths = [
+            os.path.join(current_dir, lib_name),
+            os.path.join(current_dir, "cpp_wrapper", lib_name),
+            f"./{lib_name}"
+        ]
+
+        for lib_path in lib_paths:
+            if os.path.exists(lib_path):
+                try:
+                    logger.info(f"Loading C++ library: {lib_path}")
+                    self.lib = ctypes.CDLL(lib_path)
+                    logger.success(f"Loaded C++ library: {lib_path}")
+                    break
+                except OSError as e:
+                    logger.error(f"Failed to load {lib_path}: {e}")
+                    continue
+
+        if not self.lib:
+            raise RuntimeError(f"Could not find or load {lib_name} in paths: {lib_paths}")
+        if not hasattr(self.lib, "g1_session_init"):
+            raise RuntimeError(f"{lib_name} does not provide the session API")
+
+        self.lib.g1_session_init.argtypes = [c_char_p]
+        self.lib.g1_session_init.restype = c_int
+        self.lib.g1_session_is_initialized.argtypes = []
+        self.lib.g1_session_is_initialized.restype = c_int
+        self.lib.g1_session_init_ms.argtypes = []
+        self.lib.g1_session_init_ms.restype = c_double
+
+    def initialize(self) -> bool:
+        """ChannelFactory 초기화 (이미 초기화되었으면 즉시 성공)"""
+        start = time.perf_counter()
+        result = self.lib.g1_session_init(self.network_interface.encode('utf-8'))
+        self._timings["session_init"] = (time.perf_counter() - start) * 1000.0
+
+        if result == SESSION_ERR_INTERFACE_MISMATCH:
+            logger.error(f"ChannelFactory already initialized with a different interface than {self.network_interface}")
+            return False
+        if result != 0:
+            logger.error(f"ChannelFactory initialization failed - Code: {result}")
+            return False
+
+        self._timings["channel_factory_init"] = self.lib.g1_session_init_ms()
+        logger.success(f"SDK session ready on {self.network_interface} "
+                       f"(ChannelFactory {self._timings['channel_factory_init']:.1f} ms)")
+        return True
+
+    def is_initialized(self) -> bool:
+        return self.lib.g1_session_is_initialized() == 1
+
+    @contextmanager
+    def phase(self, name: str):
+        """시작 단계 시간 측정: with session.phase("loco_connect"): ..."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._timings[name] = (time.perf_counter() - start) * 1000.0
+
+    def get_timings(self) -> Dict[str, float]:
+        """단계별 시작 시간 (ms)"""
+        return dict(self._timings)
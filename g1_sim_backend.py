@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import ctypes
+from ctypes import c_char_p, c_float, c_int, c_uint
+
+SIM_LIBRARY_NAME = "libg1_sim_wrapper.so"
+
+
+class G1SimBackend:
+    """시뮬레이션 백엔드 설정 (libg1_sim_wrapper.so)
+
+    G1LocoBridge/G1ArmBridge를 backend="sim"으로 생성하면 같은 라이브러리를 로드하므로
+    여기서 설정한 지연/에러 주입/FSM 상태가 두 브릿지에 그대로 적용된다.
+    """
+
+    def __init__(self, lib_path: str = None):
+        self.lib = ctypes.CDLL(lib_path or self._find_library())
+        self._setup_function_signatures()
+
+    @staticmethod
+    def _find_library() -> str:
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        lib_paths = [
+            os.path.join(current_dir, SIM_LIBRARY_NAME),
+            os.path.join(current_dir, "cpp_wrapper", SIM_LIBRARY_NAME),
+            f"./{SIM_LIBRARY_NAME}"
+        ]
+        for lib_path in lib_paths:
+            if os.path.exists(lib_path):
+                return lib_path
+        raise RuntimeError(f"Could not find {SIM_LIBRARY_NAME} in paths: {lib_paths}")
+
+    def _setup_function_signatures(self):
+        """함수 시그니처 설정"""
+        self.lib.sim_configure.argtypes = [c_float, c_float, c_float]
+        self.lib.sim_configure.restype = None
+
+        self.lib.sim_set_error.argtypes = [c_char_p, c_int, c_float]
+        self.lib.sim_set_error.restype = None
+
+        self.lib.sim_reset.argtypes = [c_int]
+        self.lib.sim_reset.restype = None
+
+        self.lib.sim_set_seed.argtypes = [c_uint]
+        self.lib.sim_set_seed.restype = None
+
+        self.lib.sim_get_call_count.argtypes = [c_char_p]
+        self.lib.sim_get_call_count.restype = c_int
+
+    def configure(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, arm_action_ms: float = 0.0):
+        """호출 지연 설정 (모든 RPC에 latency ± jitter, arm action은 arm_action_ms 추가)"""
+        self.lib.sim_configure(latency_ms, jitter_ms, arm_action_ms)
+
+    def inject_error(self, function_name: str, error_code: int, error_rate: float = 1.0):
+        """function_name 호출 시 error_rate 확률로 error_code 반환 ("*"는 모든 함수)"""
+        self.lib.sim_set_error(function_name.encode('utf-8'), error_code, error_rate)
+
+    def clear_error(self, function_name: str = "*"):
+        """에러 주입 해제"""
+        self.lib.sim_set_error(function_name.encode('utf-8'), 0, 0.0)
+
+    def reset(self, fsm_id: int = 0):
+        """상태 초기화 (FSM ID 지정, 에러 주입/호출 수 초기화)"""
+        self.lib.sim_reset(fsm_id)
+
+    def set_seed(self, seed: int):
+        """지터/에러 주입 난수 시드 (재현 가능한 실행용)"""
+        self.lib.sim_set_seed(seed)
+
+    def get_call_count(self, function_name: str = "*") -> int:
+        """누적 호출 수 ("*"는 전체)"""
+        return self.lib.sim_get_call_count(function_name.encode('utf-8'))
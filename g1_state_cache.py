@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class G1StateCache:
+    """로봇 상태 캐시 (필드별 값 + 반환 코드 + 갱신 시각)
+
+    상태 업데이트 루프가 주기적으로 채우고, 상태 조회는 캐시에서 바로 응답한다.
+    max_age보다 오래된 값은 stale로 간주하여 get()이 None을 반환한다.
+    """
+
+    def __init__(self, max_age: float = 0.5):
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[int, object, float]] = {}
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+
+    def update(self, field: str, code: int, value, timestamp: Optional[float] = None):
+        """필드 갱신 (code != 0이면 저장하지 않음)"""
+        if code != 0:
+            return
+        timestamp = time.monotonic() if timestamp is None else timestamp
+        with self._lock:
+            self._entries[field] = (code, value, timestamp)
+
+    def update_many(self, state: Dict[str, Tuple[int, object]]):
+        """get_state() 결과 {field: (code, value)}로 여러 필드 갱신"""
+        timestamp = time.monotonic()
+        with self._lock:
+            for field, (code, value) in state.items():
+                if code == 0:
+                    self._entries[field] = (code, value, timestamp)
+
+    def get(self, field: str, max_age: Optional[float] = None) -> Optional[Tuple[int, object]]:
+        """신선한 캐시 값 (code, value) 반환, 없거나 stale이면 None"""
+        max_age = self.max_age if max_age is None else max_age
+        with self._lock:
+            entry = self._entries.get(field)
+        if entry is None or time.monotonic() - entry[2] > max_age:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0], entry[1]
+
+    def get_age(self, field: str) -> Optional[float]:
+        """마지막 갱신 이후 경과 시간 (초), 값이 없으면 None"""
+        with self._lock:
+            entry = self._entries.get(field)
+        return None if entry is None else time.monotonic() - entry[2]
+
+    def invalidate(self, *fields: str):
+        """필드 무효화 (인자가 없으면 전체)"""
+        with self._lock:
+            if not fields:
+                self._entries.clear()
+                return
+            for field in fields:
+                self._entries.pop(field, None)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """전체 캐시 내용 {field: {"code", "value", "age"}}"""
+        now = time.monotonic()
+        with self._lock:
+            entries = dict(self._entries)
+        return {field: {"code": code, "value": value, "age": now - timestamp}
+                for field, (code, value, timestamp) in entries.items()}
@@ -13,45 +13,114 @@ class RobotStatus:
 
 import threading
 import time
-import traceback
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from g1_logger import get_logger
+
+logger = get_logger(__name__)
 
 # C++ Bridge 로드
 try:
-    print("[INFO] Loading C++ Bridges...")
+    logger.info("Loading C++ Bridges...")
     from g1_loco_bridge import G1LocoBridge
+    from g1_velocity_streamer import G1VelocityStreamer
     LOCO_BRIDGE_AVAILABLE = True
-    print("[SUCCESS] Loco Bridge loaded successfully")
+    logger.success("Loco Bridge loaded successfully")
 except Exception as e:
-    print(f"[ERROR] Loco Bridge failed: {e}")
-    print("[ERROR] Cannot operate without Loco Bridge")
+    logger.error(f"Loco Bridge failed: {e}")
+    logger.error("Cannot operate without Loco Bridge")
     LOCO_BRIDGE_AVAILABLE = False
 
 try:
     from g1_arm_bridge import G1ArmBridge
+    from g1_arm_executor import G1ArmExecutor
     ARM_BRIDGE_AVAILABLE = True
-    print("[SUCCESS] Arm Bridge loaded successfully")
+    logger.success("Arm Bridge loaded successfully")
 except Exception as e:
-    print(f"[WARNING] Arm Bridge failed: {e}")
-    print("[INFO] Continuing without Arm control")
+    logger.warning(f"Arm Bridge failed: {e}")
+    logger.info("Continuing without Arm control")
     ARM_BRIDGE_AVAILABLE = False
 
+from g1_state_cache import G1StateCache
+from g1_poll_scheduler import G1AdaptivePollScheduler
+from g1_metrics import format_prometheus
+from g1_flight_recorder import G1FlightRecorder
+from g1_command_queue import G1LocoCommandQueue, COALESCE_REPLACE, COALESCE_DEDUPE
+from g1_choreography import G1ChoreographyEngine
+from g1_session import G1Session
+from g1_connection_supervisor import G1ConnectionSupervisor
+
+# FSM 전환을 일으키는 명령 이후 무효화할 상태 캐시 필드
+FSM_STATE_FIELDS = ("fsm_id", "fsm_mode")
+
+# 속도 명령 coalesce 키 - 대기 중인 속도 명령은 최신 값 하나만 남김
+VELOCITY_COMMAND_KEY = "velocity"
+
 
 class G1SubController:
-    def __init__(self):
+    def __init__(self, network_interface: str = "eth0", backend: str = "sdk", state_max_age: float = 0.5,
+                 flight_recorder_path: str = None, flight_recorder_capacity: int = 65536,
+                 use_session: bool = True, supervise: bool = True, supervisor_options: dict = None):
         self.robot_controller = None
         self.base_controller = None
         self.status = None
-        self._lock = threading.Lock()
+        self._lock = threading.Lock()       # 상태(status) 보호용
+        self._loco_lock = threading.Lock()  # loco 명령 직렬화용 (arm과 독립)
 
         # Robot control clients
+        self.network_interface = network_interface  # 실제 로봇 연결을 위한 네트워크 인터페이스
+        self.backend = backend  # "sdk": 실제 로봇, "sim": 시뮬레이션 백엔드 (SDK 불필요)
         self.loco_bridge = None  # 하체 제어 (이동, 자세)
         self.arm_bridge = None   # 상체 제어 (팔 동작)
+        self.arm_executor = None  # arm action 비동기 실행기
+
+        # SDK 세션: 통합 라이브러리로 ChannelFactory를 한 번만 초기화하고 두 브릿지가 공유
+        # (통합 라이브러리가 없으면 loco → arm 순서로 개별 라이브러리 사용)
+        self.use_session = use_session
+        self.session = None
+        self.startup_timings = {}  # 연결 단계별 시간 (ms)
+
+        # 연결 감시 (health probe, 끊기면 backoff 재연결, 재연결 중 명령 거부/대기)
+        self.supervise = supervise
+        self.supervisor_options = supervisor_options or {}
+        self.supervisor = None
+
+        # 상태 캐시 (_update_loop가 채우고 get_* 조회는 캐시에서 응답)
+        self.state_cache = G1StateCache(max_age=state_max_age)
+
+        # 상태 폴링 스케줄러 (명령/FSM 전환 직후 빠르게, idle 시 느리게)
+        self.poll_scheduler = G1AdaptivePollScheduler()
+        self._last_fsm_id = None
+
+        # Loco 명령 큐 (단일 워커, 대기 중인 중복/대체 명령 coalescing)
+        self.loco_queue = G1LocoCommandQueue()
+        self.loco_queue.start()
+        self.loco_command_timeout = 10.0  # 큐 대기 + RPC 최대 대기 시간 (초)
+
+        # 고정 주기 속도 스트리밍 (조이스틱 텔레옵용, start_velocity_stream()으로 활성화)
+        self.velocity_streamer = None
+
+        # 비상 정지 우선순위 레인
+        self._stop_generation = 0  # 정지 요청마다 증가 (대기 중인 loco 명령 무효화)
+        self._stop_metrics_lock = threading.Lock()
+        self._stop_metrics = {"count": 0, "last_ms": 0.0, "max_ms": 0.0, "total_ms": 0.0,
+                              "last_rpc_ms": 0.0, "max_rpc_ms": 0.0}
+
+        # 플라이트 레코더 (명령/joy/상태 바이너리 링 버퍼, 경로를 지정하면 활성화)
+        self.flight_recorder = None
+        if flight_recorder_path:
+            self.start_flight_recorder(flight_recorder_path, flight_recorder_capacity)
+
+        # Arm action 시퀀스 실행기 (FSM 사전 확인, 완료 즉시 다음 단계)
+        # action 검증은 연결된 arm bridge 카탈로그 우선, 연결 전에는 내장 ACTION_MAP
+        self.choreography = G1ChoreographyEngine(
+            self, known_actions=G1ArmBridge.ACTION_MAP if ARM_BRIDGE_AVAILABLE else None)
 
         # Movement parameters
         self.default_velocity = 0.3  # m/s
         self.default_angular_velocity = 0.5  # rad/s
 
-        print("[INFO] G1SubController initialized")
+        logger.info("G1SubController initialized")
 
     def connect(self):
         """로봇 연결 및 초기화"""
@@ -67,126 +136,359 @@ class G1SubController:
             
             # 로봇 클라이언트 초기화
             self._initialize_robot_client()
+
+            # 연결 감시 시작 (초기 연결에 실패한 브릿지도 backoff로 재시도)
+            if self.supervise and LOCO_BRIDGE_AVAILABLE:
+                bridges = ("loco", "arm") if ARM_BRIDGE_AVAILABLE else ("loco",)
+                self.supervisor = G1ConnectionSupervisor(self, bridges=bridges, **self.supervisor_options)
+                self.supervisor.start()
             
             # 상태 업데이트 스레드 시작
+            self.poll_scheduler = G1AdaptivePollScheduler()
             threading.Thread(target=self._update_loop, daemon=True).start()
+            self.loco_queue.start()
             
-            print("[SUCCESS] G1SubController connected successfully")
+            logger.success("G1SubController connected successfully")
             
         except Exception as e:
-            print(f"[ERROR] Failed to connect G1SubController: {e}")
-            traceback.print_exc()
+            logger.error(f"Failed to connect G1SubController: {e}", exc_info=True)
 
     def _initialize_robot_client(self):
-        """로봇 클라이언트 초기화 (Loco + Arm Bridge)"""
-        network_interface = "eth0"  # 실제 로봇 연결을 위한 네트워크 인터페이스
+        """로봇 클라이언트 초기화 (SDK 세션 + Loco + Arm Bridge)"""
+        network_interface = self.network_interface
+        self.startup_timings = {}
+        started = time.perf_counter()
 
-        # 1. Loco Bridge 초기화 (반드시 먼저! ChannelFactory 초기화)
+        # 0. SDK 세션 (ChannelFactory 한 번만 초기화, 이후 클라이언트 생성 순서 무관)
+        if self.use_session:
+            try:
+                self.session = G1Session(network_interface, backend=self.backend)
+                if not self.session.initialize():
+                    raise RuntimeError("session initialization failed")
+            except Exception as e:
+                logger.warning(f"SDK session unavailable ({e}) - loading separate loco/arm libraries")
+                self.session = None
+
+        # 1. Loco Bridge 초기화 (세션이 없으면 반드시 먼저! ChannelFactory 초기화)
         if not LOCO_BRIDGE_AVAILABLE:
-            print("[ERROR] Loco Bridge not available - robot control disabled")
+            logger.error("Loco Bridge not available - robot control disabled")
             return
 
-        try:
-            print("[INFO] Initializing Loco Bridge...")
-            self.loco_bridge = G1LocoBridge(network_interface)
-
-            if self.loco_bridge.connect():
-                print("[SUCCESS] Loco Bridge connected")
-
-                # 기본 기능 테스트
-                code, fsm_id = self.loco_bridge.get_fsm_id()
-                if code == 0:
-                    print(f"[SUCCESS] Loco Bridge working - FSM ID: {fsm_id}")
-                else:
-                    print(f"[WARNING] FSM test returned code {code}, but continuing")
-            else:
-                raise RuntimeError("Loco connection failed")
-
-        except Exception as e:
-            print(f"[ERROR] Loco Bridge initialization failed: {e}")
-            self.loco_bridge = None
+        phase_start = time.perf_counter()
+        if not self._connect_loco_bridge():
             return
+        self.startup_timings["loco_connect"] = (time.perf_counter() - phase_start) * 1000.0
 
-        # 2. Arm Bridge 초기화 (선택사항, loco 이후에)
+        # 2. Arm Bridge 초기화 (선택사항, 세션이 없으면 loco 이후에)
         if not ARM_BRIDGE_AVAILABLE:
-            print("[INFO] Arm Bridge not available - continuing without arm control")
+            logger.info("Arm Bridge not available - continuing without arm control")
             return
 
+        phase_start = time.perf_counter()
+        if self._connect_arm_bridge():
+            self.startup_timings["arm_connect"] = (time.perf_counter() - phase_start) * 1000.0
+
+        if self.session:
+            self.startup_timings = dict(self.session.get_timings(), **self.startup_timings)
+        self.startup_timings["total"] = (time.perf_counter() - started) * 1000.0
+        logger.info("Startup timings: " + ", ".join(f"{name} {ms:.1f} ms" for name, ms in self.startup_timings.items()))
+
+    def _connect_loco_bridge(self) -> bool:
+        """Loco Bridge 생성 및 연결 (초기 연결, 재연결 공용), 성공 시 True"""
         try:
-            print("[INFO] Initializing Arm Bridge...")
-            self.arm_bridge = G1ArmBridge(network_interface)
+            logger.info("Initializing Loco Bridge...")
+            loco_bridge = G1LocoBridge(self.network_interface, backend=self.backend, session=self.session)
+            if not loco_bridge.connect():
+                raise RuntimeError("Loco connection failed")
+            logger.success("Loco Bridge connected")
 
-            if self.arm_bridge.connect():
-                print("[SUCCESS] Arm Bridge connected")
+            # 기본 기능 테스트
+            code, fsm_id = loco_bridge.get_fsm_id()
+            if code == 0:
+                logger.success(f"Loco Bridge working - FSM ID: {fsm_id}")
             else:
-                print("[WARNING] Arm connection failed, continuing without arm control")
-                self.arm_bridge = None
+                logger.warning(f"FSM test returned code {code}, but continuing")
 
         except Exception as e:
-            print(f"[WARNING] Arm Bridge initialization failed: {e}")
-            self.arm_bridge = None
+            logger.error(f"Loco Bridge initialization failed: {e}")
+            return False
+
+        self.loco_bridge = loco_bridge
+        self._attach_flight_recorder()
+        self.poll_scheduler.notify_activity()
+        return True
+
+    def _connect_arm_bridge(self) -> bool:
+        """Arm Bridge 생성 및 연결 (초기 연결, 재연결 공용), 성공 시 True
+
+        arm executor는 한 번만 만들고 재연결 후에도 그대로 사용 (브릿지는 getter로 조회)
+        """
+        try:
+            logger.info("Initializing Arm Bridge...")
+            arm_bridge = G1ArmBridge(self.network_interface, backend=self.backend, session=self.session)
+            if not arm_bridge.connect():
+                logger.warning("Arm connection failed, continuing without arm control")
+                return False
+            logger.success("Arm Bridge connected")
+
+        except Exception as e:
+            logger.warning(f"Arm Bridge initialization failed: {e}")
+            return False
+
+        self.arm_bridge = arm_bridge
+        self._attach_flight_recorder()
+        if not self.arm_executor:
+            self.arm_executor = G1ArmExecutor(lambda: self.arm_bridge, bridge_wait=self._wait_arm_bridge)
+            self.arm_executor.start()
+        return True
+
+    def _teardown_bridges(self, arm_only: bool = False):
+        """연결이 끊긴 브릿지 핸들 정리 (재연결 전, 연결 감시에서 호출)
+
+        새 명령이 옛 핸들을 쓰지 않도록 속성을 먼저 비운 뒤 해제한다. 이미 브릿지를 읽어 간
+        호출(우선순위 정지, 상태 폴링 등)이 있으면 disconnect()가 그 호출이 끝날 때까지 기다린 뒤
+        핸들을 해제한다. arm executor는 유지한다.
+        """
+        bridges = []
+        arm_bridge, self.arm_bridge = self.arm_bridge, None
+        bridges.append(("Arm", arm_bridge))
+        if not arm_only:
+            with self._loco_lock:
+                loco_bridge, self.loco_bridge = self.loco_bridge, None
+            bridges.append(("Loco", loco_bridge))
+            self.state_cache.invalidate()
+
+        for name, bridge in bridges:
+            if bridge:
+                try:
+                    bridge.disconnect()
+                except Exception as e:
+                    logger.warning(f"{name} Bridge teardown error: {e}")
+
+    def _wait_arm_bridge(self) -> bool:
+        """재연결 중이고 queue 정책이면 arm 재연결까지 대기 (arm executor에서 호출)"""
+        supervisor = self.supervisor
+        return bool(supervisor and supervisor.should_queue("arm") and supervisor.wait_connected("arm"))
+
+    def get_connection_stats(self):
+        """연결 감시 통계 (감시하지 않으면 None)"""
+        return self.supervisor.get_stats() if self.supervisor else None
+
+    def get_startup_timings(self):
+        """연결 단계별 시간 (ms): load_library, session_init, channel_factory_init, loco_connect, arm_connect, total"""
+        return dict(self.startup_timings)
 
     def _update_loop(self):
-        """상태 업데이트 루프"""
+        """상태 업데이트 루프 (적응형 주기, deadline 기반)"""
         while True:
             try:
-                with self._lock:
-                    if self.status:
-                        # 상태 업데이트 로직 (실제 센서 데이터)
-                        self._update_robot_status()
-                    
-                time.sleep(0.1)  # 10Hz 업데이트
-                
+                if self.status:
+                    # 상태 업데이트 로직 (실제 센서 데이터)
+                    self._update_robot_status()
+
             except Exception as e:
-                print(f"[WARNING] Status update error: {e}")
+                logger.warning(f"Status update error: {e}")
                 time.sleep(1.0)
 
+            if not self.poll_scheduler.wait():
+                break
+
     def _update_robot_status(self):
-        """로봇 상태 업데이트"""
+        """로봇 상태 업데이트 (RPC는 락 없이 수행, status 갱신만 락 보호)"""
         try:
-            if self.loco_bridge:
-                # Loco Bridge를 통한 실제 상태 조회
-                code, fsm_id = self.loco_bridge.get_fsm_id()
+            loco_bridge = self.loco_bridge  # 재연결로 바뀔 수 있으므로 한 번만 읽음
+            if loco_bridge:
+                # Loco Bridge를 통한 실제 상태 조회 (전체 상태를 한 번에 읽어 캐시에 저장)
+                state = loco_bridge.get_state()
+                self.state_cache.update_many(state)
+                if self.flight_recorder:
+                    self.flight_recorder.record_state(state)
+                code, fsm_id = state["fsm_id"]
                 if code == 0:
-                    self.status.motion_state = f"fsm_id_{fsm_id}"
+                    motion_state = f"fsm_id_{fsm_id}"
+                    # FSM 전환 감지 → 한동안 빠르게 폴링
+                    if fsm_id != self._last_fsm_id:
+                        self._last_fsm_id = fsm_id
+                        self.poll_scheduler.notify_activity()
                 else:
-                    self.status.motion_state = "unknown"
+                    motion_state = "unknown"
             else:
                 # Loco Bridge 없음
-                self.status.motion_state = "disconnected"
+                motion_state = "disconnected"
 
         except Exception as e:
-            print(f"[WARNING] Failed to update status: {e}")
-            self.status.motion_state = "error"
+            logger.warning(f"Failed to update status: {e}")
+            motion_state = "error"
 
-    def _execute_loco_command(self, command_func, command_name):
-        """Loco 명령 실행 헬퍼 메소드"""
+        with self._lock:
+            self.status.motion_state = motion_state
+
+    def _execute_loco_command(self, command_func, command_name, verbose=True, invalidates=(),
+                              coalesce_key=None, policy=COALESCE_REPLACE, wait=True):
+        """Loco 명령 실행 헬퍼 메소드
+
+        명령 큐를 거쳐 실행하고 결과를 기다린다. 대기 중 같은 coalesce_key의 명령이
+        들어오면 합쳐지며, 이때 반환값은 실제로 실행된 명령의 결과이다.
+        (invalidates: 성공 시 무효화할 상태 캐시 필드, wait=False: 큐에 넣고 바로 0 반환)
+        """
+        generation = self._stop_generation
+        future = self.loco_queue.submit(
+            lambda: self._run_loco_command(command_func, command_name, verbose, invalidates, generation),
+            command_name, coalesce_key, policy
+        )
+        if not wait:
+            return 0
         try:
-            with self._lock:
+            return future.result(timeout=self.loco_command_timeout)
+        except FutureTimeoutError:
+            logger.warning(f"{command_name} timed out in loco command queue")
+            return -1
+
+    def _run_loco_command(self, command_func, command_name, verbose, invalidates, generation):
+        """명령 큐 워커에서 실제 명령 실행"""
+        try:
+            # 재연결 중이고 queue 정책이면 재연결될 때까지 대기 후 실행
+            if not self.loco_bridge and self.supervisor and self.supervisor.should_queue("loco"):
+                self.supervisor.wait_connected("loco")
+            with self._loco_lock:
+                # 큐 대기 중에 정지 요청이 들어왔으면 오래된 명령은 버림
+                if generation != self._stop_generation:
+                    logger.control(f"{command_name} preempted by stop")
+                    return -1
                 if self.loco_bridge:
                     result = command_func()
-                    print(f"[CONTROL] {command_name} executed - result: {result}")
+                    if invalidates and result == 0:
+                        self.state_cache.invalidate(*invalidates)
+                    # 실행된 모든 loco 명령 (이동 포함, 실패 포함) → 한동안 빠르게 폴링
+                    self.poll_scheduler.notify_activity()
+                    if verbose:
+                        logger.control(f"{command_name} executed - result: {result}")
                     return result
                 else:
-                    print(f"[ERROR] No Loco Bridge connection - {command_name} ignored")
+                    logger.error(f"No Loco Bridge connection - {command_name} ignored")
                     return -1
         except Exception as e:
-            print(f"[ERROR] {command_name} failed: {e}")
+            logger.error(f"{command_name} failed: {e}")
             return -1
 
+    def get_loco_queue_stats(self):
+        """Loco 명령 큐 통계 (dropped: coalescing으로 버려진 명령 수)"""
+        return self.loco_queue.get_stats()
+
+    def _execute_priority_command(self, command_func, command_name, invalidates=()):
+        """우선순위 명령 실행 (loco 락을 거치지 않음)
+
+        대기 중인 loco/arm 명령을 모두 무효화한 뒤 전용 핸들로 즉시 전송하고
+        요청 시점부터 전송 완료까지의 지연 시간을 기록한다.
+        (command_func(loco_bridge): 재연결 중에도 같은 브릿지를 쓰도록 한 번 읽은 브릿지를 전달)
+        """
+        requested_at = time.perf_counter()
+        self._stop_generation += 1
+
+        self.choreography.cancel(reset_motion=False)  # 정지 명령이 이동도 멈추므로 속도 초기화 생략
+        self.loco_queue.cancel_pending()
+        if self.arm_executor:
+            self.arm_executor.cancel_pending()
+        if self.velocity_streamer:
+            self.velocity_streamer.reset()
+
+        try:
+            loco_bridge = self.loco_bridge
+            if not loco_bridge:
+                logger.error(f"No Loco Bridge connection - {command_name} ignored")
+                return -1
+
+            sent_at = time.perf_counter()
+            result = command_func(loco_bridge)
+            done_at = time.perf_counter()
+            self._record_stop_latency((done_at - requested_at) * 1000.0, (done_at - sent_at) * 1000.0)
+            if invalidates and result == 0:
+                self.state_cache.invalidate(*invalidates)
+            self.poll_scheduler.notify_activity()
+            logger.control(f"{command_name} executed - result: {result}")
+            return result
+        except Exception as e:
+            logger.error(f"{command_name} failed: {e}")
+            return -1
+
+    def _record_stop_latency(self, total_ms, rpc_ms):
+        """정지 지연 시간 기록"""
+        with self._stop_metrics_lock:
+            metrics = self._stop_metrics
+            metrics["count"] += 1
+            metrics["last_ms"] = total_ms
+            metrics["max_ms"] = max(metrics["max_ms"], total_ms)
+            metrics["total_ms"] += total_ms
+            metrics["last_rpc_ms"] = rpc_ms
+            metrics["max_rpc_ms"] = max(metrics["max_rpc_ms"], rpc_ms)
+
+    def get_stop_metrics(self):
+        """정지 요청 → 전송 완료 지연 시간 통계 (ms)"""
+        with self._stop_metrics_lock:
+            metrics = dict(self._stop_metrics)
+        metrics["mean_ms"] = metrics.pop("total_ms") / metrics["count"] if metrics["count"] else 0.0
+        return metrics
+
+    def get_bridge_metrics(self):
+        """브릿지별 SDK 호출 메트릭 {"loco": {...}, "arm": {...}}"""
+        metrics = {}
+        if self.loco_bridge:
+            metrics["loco"] = self.loco_bridge.get_metrics()
+        if self.arm_bridge:
+            metrics["arm"] = self.arm_bridge.get_metrics()
+        return metrics
+
+    def get_bridge_metrics_text(self):
+        """브릿지 메트릭 Prometheus 텍스트 덤프"""
+        return format_prometheus(self.get_bridge_metrics())
+
+    # ========== 플라이트 레코더 ==========
+    def start_flight_recorder(self, path: str, capacity: int = 65536):
+        """플라이트 레코더 시작 (SDK 호출, /joy 입력, 상태 샘플을 path에 기록)"""
+        self.stop_flight_recorder()
+        self.flight_recorder = G1FlightRecorder(path, capacity)
+        self._attach_flight_recorder()
+        logger.info(f"Flight recorder started: {path} ({capacity} records)")
+
+    def stop_flight_recorder(self):
+        """플라이트 레코더 종료 (기록 파일은 유지)"""
+        recorder = self.flight_recorder
+        if not recorder:
+            return
+        self.flight_recorder = None
+        self._attach_flight_recorder()
+        recorder.close()
+        logger.info(f"Flight recorder stopped: {recorder.path} ({recorder.get_count()} records)")
+
+    def _attach_flight_recorder(self):
+        """브릿지의 SDK 호출 계측에 레코더 연결 (레코더가 없으면 해제)"""
+        for bridge in (self.loco_bridge, self.arm_bridge):
+            if bridge:
+                bridge.lib.call_recorder = self.flight_recorder
+
+    def _submit_arm_command(self, action_name, command_name):
+        """Arm 명령을 arm executor에 제출하고 Future 반환"""
+        queued = self.arm_executor and self.supervisor and self.supervisor.should_queue("arm")
+        if not (self.arm_bridge or queued) or not self.arm_executor:
+            logger.error(f"No Arm Bridge connection - {command_name} ignored")
+            future = Future()
+            future.set_result(-1)
+            return future
+        return self.arm_executor.submit(action_name, command_name)
+
     def _execute_arm_command(self, action_name, command_name):
-        """Arm 명령 실행 헬퍼 메소드"""
+        """Arm 명령 실행 헬퍼 메소드 (즉시 반환: 0 = 접수됨, -1 = 거부됨)
+
+        실제 실행 결과는 arm_action_async()가 반환하는 Future로 확인한다.
+        """
         try:
-            with self._lock:
-                if self.arm_bridge:
-                    success, msg = self.arm_bridge.execute_action_by_name(action_name)
-                    print(f"[CONTROL] {command_name} - {msg}")
-                    return 0 if success else -1
-                else:
-                    print(f"[ERROR] No Arm Bridge connection - {command_name} ignored")
-                    return -1
+            future = self._submit_arm_command(action_name, command_name)
+            if future.done() and not future.cancelled() and future.result() != 0:
+                return -1
+            logger.control(f"{command_name} queued")
+            return 0
         except Exception as e:
-            print(f"[ERROR] {command_name} failed: {e}")
+            logger.error(f"{command_name} failed: {e}")
             return -1
 
     # ========== 기본 이동 제어 메소드들 ==========
@@ -194,113 +496,186 @@ class G1SubController:
         """전진"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.move_robot(self.default_velocity, 0, 0),
-            "move_forward"
+            "move_forward",
+            coalesce_key=VELOCITY_COMMAND_KEY
         )
 
     def move_backward(self):
         """후진"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.move_robot(-self.default_velocity, 0, 0),
-            "move_backward"
+            "move_backward",
+            coalesce_key=VELOCITY_COMMAND_KEY
         )
 
     def move_left(self):
         """좌측 이동"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.move_robot(0, self.default_velocity, 0),
-            "move_left"
+            "move_left",
+            coalesce_key=VELOCITY_COMMAND_KEY
         )
 
     def move_right(self):
         """우측 이동"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.move_robot(0, -self.default_velocity, 0),
-            "move_right"
+            "move_right",
+            coalesce_key=VELOCITY_COMMAND_KEY
         )
 
     def turn_left(self):
         """좌회전"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.move_robot(0, 0, self.default_angular_velocity),
-            "turn_left"
+            "turn_left",
+            coalesce_key=VELOCITY_COMMAND_KEY
         )
 
     def turn_right(self):
         """우회전"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.move_robot(0, 0, -self.default_angular_velocity),
-            "turn_right"
+            "turn_right",
+            coalesce_key=VELOCITY_COMMAND_KEY
         )
 
     def stop(self):
-        """정지"""
-        return self._execute_loco_command(
-            lambda: self.loco_bridge.stop_move(),
+        """정지 (우선순위 레인)"""
+        return self._execute_priority_command(
+            lambda loco_bridge: loco_bridge.priority_stop_move(),
             "stop"
         )
 
+    def emergency_stop(self):
+        """긴급 정지 - 대기 중인 모든 명령을 취소하고 즉시 정지"""
+        return self._execute_priority_command(
+            lambda loco_bridge: loco_bridge.priority_stop_move(),
+            "emergency_stop"
+        )
+
+    # ========== 속도 스트리밍 ==========
+    def start_velocity_stream(self, rate_hz: float = 50.0, shaper=None):
+        """고정 주기 속도 스트리밍 시작 (shaper: 가속도 제한기 등, 선택)"""
+        if self.velocity_streamer and self.velocity_streamer.is_running():
+            return
+        self.velocity_streamer = G1VelocityStreamer(self._stream_move, rate_hz=rate_hz, shaper=shaper)
+        self.velocity_streamer.start()
+
+    def stop_velocity_stream(self):
+        """속도 스트리밍 종료"""
+        if self.velocity_streamer:
+            self.velocity_streamer.stop()
+            self.velocity_streamer = None
+
+    def set_velocity_target(self, vx: float, vy: float, vyaw: float, wait: bool = True):
+        """스트리밍 목표 속도 갱신 (스트리밍 비활성 시 즉시 move 실행, wait=False면 결과를 기다리지 않음)"""
+        if self.velocity_streamer and self.velocity_streamer.is_running():
+            self.velocity_streamer.set_target(vx, vy, vyaw)
+            return 0
+        return self._execute_loco_command(
+            lambda: self.loco_bridge.move_robot(vx, vy, vyaw),
+            f"move(vx={vx}, vy={vy}, vyaw={vyaw})",
+            coalesce_key=VELOCITY_COMMAND_KEY,
+            wait=wait
+        )
+
+    def _stream_move(self, vx, vy, vyaw):
+        """스트리머 전송 함수"""
+        return self._execute_loco_command(
+            lambda: self.loco_bridge.move_robot(vx, vy, vyaw),
+            "stream_move",
+            verbose=False,
+            coalesce_key=VELOCITY_COMMAND_KEY
+        )
+
     # ========== 자세 제어 메소드들 ==========
     def stand_up(self):
         """일어서기"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.stand_up(),
-            "stand_up"
+            "stand_up",
+            invalidates=FSM_STATE_FIELDS,
+            coalesce_key=("stand_up",),
+            policy=COALESCE_DEDUPE
         )
 
     def sit_down(self):
         """앉기"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.sit(),
-            "sit_down"
+            "sit_down",
+            invalidates=FSM_STATE_FIELDS,
+            coalesce_key=("sit",),
+            policy=COALESCE_DEDUPE
         )
 
     def enable_motion(self):
         """모션 활성화 (로봇 시작)"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.start_robot(),
-            "enable_motion"
+            "enable_motion",
+            invalidates=FSM_STATE_FIELDS,
+            coalesce_key=("start_robot",),
+            policy=COALESCE_DEDUPE
         )
 
     def squat(self):
         """쪼그려 앉기"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.squat(),
-            "squat"
+            "squat",
+            invalidates=FSM_STATE_FIELDS,
+            coalesce_key=("squat",),
+            policy=COALESCE_DEDUPE
         )
 
     def balance_stand(self):
         """밸런스 스탠드"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.balance_stand(),
-            "balance_stand"
+            "balance_stand",
+            invalidates=("balance_mode",),
+            coalesce_key=("balance_stand",),
+            policy=COALESCE_DEDUPE
         )
 
     def damp(self):
-        """댐핑 모드"""
-        return self._execute_loco_command(
-            lambda: self.loco_bridge.damp(),
-            "damp"
+        """댐핑 모드 (우선순위 레인)"""
+        return self._execute_priority_command(
+            lambda loco_bridge: loco_bridge.priority_damp(),
+            "damp",
+            invalidates=FSM_STATE_FIELDS
         )
 
     def zero_torque(self):
         """제로 토크"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.zero_torque(),
-            "zero_torque"
+            "zero_torque",
+            invalidates=FSM_STATE_FIELDS,
+            coalesce_key=("zero_torque",),
+            policy=COALESCE_DEDUPE
         )
 
     def high_stand(self):
         """높은 자세로 서기"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.high_stand(),
-            "high_stand"
+            "high_stand",
+            invalidates=("stand_height",),
+            coalesce_key=("high_stand",),
+            policy=COALESCE_DEDUPE
         )
 
     def low_stand(self):
         """낮은 자세로 서기"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.low_stand(),
-            "low_stand"
+            "low_stand",
+            invalidates=("stand_height",),
+            coalesce_key=("low_stand",),
+            policy=COALESCE_DEDUPE
         )
 
     # ========== 손 제어 메소드들 ==========
@@ -323,35 +698,47 @@ class G1SubController:
         """FSM ID 설정"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.set_fsm_id(fsm_id),
-            f"set_fsm_id({fsm_id})"
+            f"set_fsm_id({fsm_id})",
+            invalidates=FSM_STATE_FIELDS,
+            coalesce_key=("set_fsm_id", fsm_id),
+            policy=COALESCE_DEDUPE
         )
 
     def set_balance_mode(self, balance_mode: int):
         """밸런스 모드 설정"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.set_balance_mode(balance_mode),
-            f"set_balance_mode({balance_mode})"
+            f"set_balance_mode({balance_mode})",
+            invalidates=("balance_mode",),
+            coalesce_key=("set_balance_mode", balance_mode),
+            policy=COALESCE_DEDUPE
         )
 
     def set_speed_mode(self, speed_mode: int):
         """속도 모드 설정"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.set_speed_mode(speed_mode),
-            f"set_speed_mode({speed_mode})"
+            f"set_speed_mode({speed_mode})",
+            coalesce_key=("set_speed_mode", speed_mode),
+            policy=COALESCE_DEDUPE
         )
 
     def continuous_gait(self, flag: bool):
         """연속 보행 설정"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.continuous_gait(flag),
-            f"continuous_gait({flag})"
+            f"continuous_gait({flag})",
+            coalesce_key=("continuous_gait", flag),
+            policy=COALESCE_DEDUPE
         )
 
     def switch_move_mode(self, flag: bool):
         """이동 모드 전환"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.switch_move_mode(flag),
-            f"switch_move_mode({flag})"
+            f"switch_move_mode({flag})",
+            coalesce_key=("switch_move_mode", flag),
+            policy=COALESCE_DEDUPE
         )
 
     # ========== 고급 제어 메소드들 ==========
@@ -359,28 +746,37 @@ class G1SubController:
         """속도 설정"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.set_velocity(vx, vy, omega, duration),
-            f"set_velocity(vx={vx}, vy={vy}, omega={omega}, duration={duration})"
+            f"set_velocity(vx={vx}, vy={vy}, omega={omega}, duration={duration})",
+            coalesce_key=VELOCITY_COMMAND_KEY
         )
 
     def set_swing_height(self, height: float):
         """스윙 높이 설정"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.set_swing_height(height),
-            f"set_swing_height({height})"
+            f"set_swing_height({height})",
+            invalidates=("swing_height",),
+            coalesce_key=("set_swing_height", height),
+            policy=COALESCE_DEDUPE
         )
 
     def set_stand_height(self, height: float):
         """서기 높이 설정"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.set_stand_height(height),
-            f"set_stand_height({height})"
+            f"set_stand_height({height})",
+            invalidates=("stand_height",),
+            coalesce_key=("set_stand_height", height),
+            policy=COALESCE_DEDUPE
         )
 
     def set_task_id(self, task_id: int):
         """태스크 ID 설정"""
         return self._execute_loco_command(
             lambda: self.loco_bridge.set_task_id(task_id),
-            f"set_task_id({task_id})"
+            f"set_task_id({task_id})",
+            coalesce_key=("set_task_id", task_id),
+            policy=COALESCE_DEDUPE
         )
 
     # ========== 상태 조회 메소드들 ==========
@@ -389,59 +785,91 @@ class G1SubController:
         with self._lock:
             return self.status
 
-    def get_fsm_id(self):
+    def _get_cached_state(self, field, default, max_age=None):
+        """상태 캐시 조회, stale이면 로봇에서 직접 읽어 캐시 갱신"""
+        cached = self.state_cache.get(field, max_age)
+        if cached is not None:
+            return cached
+
+        loco_bridge = self.loco_bridge
+        if not loco_bridge:
+            return -1, default
+
+        code, value = getattr(loco_bridge, f"get_{field}")()
+        self.state_cache.update(field, code, value)
+        return code, value
+
+    def get_fsm_id(self, max_age=None):
         """FSM ID 조회"""
         try:
-            if self.loco_bridge:
-                return self.loco_bridge.get_fsm_id()
-            else:
-                return -1, 0
+            return self._get_cached_state("fsm_id", 0, max_age)
+        except Exception as e:
+            logger.error(f"Get FSM ID failed: {e}")
+            return -1, 0
+
+    def get_fsm_mode(self, max_age=None):
+        """FSM 모드 조회"""
+        try:
+            return self._get_cached_state("fsm_mode", 0, max_age)
         except Exception as e:
-            print(f"[ERROR] Get FSM ID failed: {e}")
+            logger.error(f"Get FSM mode failed: {e}")
             return -1, 0
 
-    def get_balance_mode(self):
+    def get_balance_mode(self, max_age=None):
         """밸런스 모드 조회"""
         try:
-            if self.loco_bridge:
-                return self.loco_bridge.get_balance_mode()
-            else:
-                return -1, 0
+            return self._get_cached_state("balance_mode", 0, max_age)
         except Exception as e:
-            print(f"[ERROR] Get balance mode failed: {e}")
+            logger.error(f"Get balance mode failed: {e}")
             return -1, 0
 
-    def get_swing_height(self):
+    def get_swing_height(self, max_age=None):
         """스윙 높이 조회"""
         try:
-            if self.loco_bridge:
-                return self.loco_bridge.get_swing_height()
-            else:
-                return -1, 0.0
+            return self._get_cached_state("swing_height", 0.0, max_age)
         except Exception as e:
-            print(f"[ERROR] Get swing height failed: {e}")
+            logger.error(f"Get swing height failed: {e}")
             return -1, 0.0
 
-    def get_stand_height(self):
+    def get_stand_height(self, max_age=None):
         """서기 높이 조회"""
         try:
-            if self.loco_bridge:
-                return self.loco_bridge.get_stand_height()
-            else:
-                return -1, 0.0
+            return self._get_cached_state("stand_height", 0.0, max_age)
         except Exception as e:
-            print(f"[ERROR] Get stand height failed: {e}")
+            logger.error(f"Get stand height failed: {e}")
             return -1, 0.0
 
+    def get_state_age(self, field):
+        """상태 필드의 캐시 경과 시간 (초), 캐시에 없으면 None"""
+        return self.state_cache.get_age(field)
+
+    def get_state_snapshot(self):
+        """캐시된 전체 상태 {field: {"code", "value", "age"}}"""
+        return self.state_cache.snapshot()
+
     def disconnect(self):
         """연결 해제"""
         try:
+            if self.supervisor:
+                self.supervisor.stop()
+                self.supervisor = None
+            self.poll_scheduler.stop()
+            self.choreography.cancel()
+            self.stop_velocity_stream()
+            self.loco_queue.stop()
+            if self.arm_executor:
+                self.arm_executor.stop()
+                self.arm_executor = None
+            if self.arm_bridge:
+                self.arm_bridge.disconnect()
+                self.arm_bridge = None
             if self.loco_bridge:
                 self.loco_bridge.disconnect()
                 self.loco_bridge = None
-            print("[SUCCESS] G1SubController disconnected")
+            self.stop_flight_recorder()
+            logger.success("G1SubController disconnected")
         except Exception as e:
-            print(f"[WARNING] Disconnect error: {e}")
+            logger.warning(f"Disconnect error: {e}")
     # ========== ARM 제어 메소드들 (상체 동작) ==========
     def arm_wave(self):
         """손 높이 흔들기"""
@@ -479,6 +907,30 @@ class G1SubController:
         """일반 arm action 실행"""
         return self._execute_arm_command(action_name, f"arm_action({action_name})")
 
+    def arm_action_async(self, action_name: str) -> Future:
+        """Arm action 실행 요청 후 Future 반환 (결과: 0 = 성공, -1 = 실패)"""
+        return self._submit_arm_command(action_name, f"arm_action({action_name})")
+
+    def run_choreography(self, steps, name: str = "choreography") -> Future:
+        """Arm action 시퀀스 실행 (즉시 Future 반환, 결과: 0 = 성공)
+
+        steps 예: ["hands_up", {"action": "clap", "duration": 2.0},
+                   {"duration": 1.5, "motion": {"vyaw": 0.5}}, {"action": "face_wave", "motion": {"vx": 0.2}}]
+        """
+        return self.choreography.run(steps, name)
+
+    def cancel_choreography(self):
+        """실행 중인 시퀀스 중단"""
+        return self.choreography.cancel()
+
+    def get_choreography_stats(self):
+        """시퀀스 실행 통계"""
+        return self.choreography.get_stats()
+
+    def get_arm_pending_count(self):
+        """대기 중인 arm action 개수"""
+        return self.arm_executor.pending_count() if self.arm_executor else 0
+
     def arm_release(self):
         """팔 해제"""
         return self._execute_arm_command("release_arm", "arm_release")
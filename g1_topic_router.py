@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from g1_logger import get_logger
+from g1_metrics import LatencyHistogram
+
+logger = get_logger(__name__)
+
+# 통계 토픽 수가 max_routes를 넘으면 나머지 토픽은 이 키로 합산
+OTHER_TOPICS_KEY = "(other)"
+
+
+class TopicHandler:
+    """등록된 토픽 핸들러 (handler(message) 형태로 호출)"""
+    __slots__ = ("pattern", "handler", "prefix", "is_async", "priority", "order")
+
+    def __init__(self, pattern, handler, prefix, is_async, priority, order):
+        self.pattern = pattern
+        self.handler = handler
+        self.prefix = prefix
+        self.is_async = is_async  # True면 라우터의 비동기 워커에서 실행 (dispatch는 즉시 반환)
+        self.priority = priority  # 높을수록 먼저 실행 (같은 토픽의 핸들러 순서, 비동기 대기열 순서)
+        self.order = order        # 같은 priority 안에서는 등록 순서
+
+
+class _TopicStats:
+    __slots__ = ("calls", "errors", "first_at", "last_at", "latency", "lock")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.first_at = None
+        self.last_at = None
+        self.latency = LatencyHistogram()
+        self.lock = threading.Lock()
+
+
+class G1TopicRouter:
+    """토픽 → 핸들러 라우터
+
+    - 핸들러는 정확한 토픽 또는 prefix로 등록 (register)
+    - 토픽별로 실행할 핸들러 목록을 미리 계산해 두어 dispatch는 dict 조회 한 번
+      (처음 보는 토픽만 등록 테이블에서 계산 후 캐시, 등록이 바뀌면 캐시 초기화)
+    - 토픽 이름은 원격에서 오므로 캐시는 등록된 핸들러와 일치한 토픽만, 최대 max_routes개
+      (토픽별 통계도 max_routes개까지, 이후 토픽은 OTHER_TOPICS_KEY로 합산)
+    - 일치하는 핸들러가 없으면 default 핸들러 실행 (토픽별로 캐시하지 않음)
+    - 동기 핸들러는 dispatch 스레드에서 priority 순으로 실행, 비동기 핸들러는 워커 스레드의
+      priority 대기열로 넘김
+    - 토픽별 처리 수, 처리율, 핸들러 지연(µs) 히스토그램 집계
+    """
+
+    def __init__(self, async_workers: int = 1, max_routes: int = 1024):
+        self.async_workers = max(1, async_workers)
+        self.max_routes = max_routes
+        self._exact: Dict[str, list] = {}
+        self._prefixes: Dict[str, list] = {}
+        self._default: Optional[TopicHandler] = None
+        self._default_route: tuple = ()
+        self._routes: Dict[str, tuple] = {}
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+
+        self._stats: Dict[str, _TopicStats] = {}
+
+        self._queue = []  # (-priority, seq, entry, topic, message)
+        self._queue_cond = threading.Condition()
+        self._queue_seq = itertools.count()
+        self._threads = []
+        self._running = False
+
+    def register(self, topic: str, handler: Callable[[dict], None], prefix: bool = False,
+                 is_async: bool = False, priority: int = 0) -> TopicHandler:
+        """핸들러 등록 (prefix=True면 topic으로 시작하는 모든 토픽에 적용)"""
+        entry = TopicHandler(topic, handler, prefix, is_async, priority, next(self._order))
+        with self._lock:
+            table = self._prefixes if prefix else self._exact
+            table.setdefault(topic, []).append(entry)
+            self._routes = {}
+        return entry
+
+    def unregister(self, entry: TopicHandler):
+        """register()가 반환한 핸들러 등록 해제"""
+        with self._lock:
+            table = self._prefixes if entry.prefix else self._exact
+            handlers = table.get(entry.pattern, [])
+            if entry in handlers:
+                handlers.remove(entry)
+                if not handlers:
+                    del table[entry.pattern]
+            self._routes = {}
+
+    def set_default(self, handler: Optional[Callable[[dict], None]], is_async: bool = False, priority: int = 0):
+        """일치하는 핸들러가 없는 토픽의 처리 핸들러 (None이면 무시)"""
+        with self._lock:
+            self._default = None if handler is None else \
+                TopicHandler(None, handler, False, is_async, priority, next(self._order))
+            self._default_route = (self._default,) if self._default else ()
+            self._routes = {}
+
+    def resolve(self, topic: str) -> tuple:
+        """토픽에 적용될 핸들러 목록 (priority 높은 순)"""
+        routes = self._routes
+        handlers = routes.get(topic)
+        if handlers is None:
+            with self._lock:
+                matched = list(self._exact.get(topic, ()))
+                for pattern, entries in self._prefixes.items():
+                    if topic.startswith(pattern):
+                        matched.extend(entries)
+                if not matched:
+                    return self._default_route
+                matched.sort(key=lambda entry: (-entry.priority, entry.order))
+                handlers = tuple(matched)
+                if len(self._routes) < self.max_routes:
+                    self._routes[topic] = handlers
+        return handlers
+
+    def dispatch(self, topic: str, message: dict) -> int:
+        """메시지를 토픽 핸들러로 전달, 실행(또는 대기열 추가)한 핸들러 수 반환"""
+        handlers = self.resolve(topic)
+        for entry in handlers:
+            if entry.is_async and self._running:
+                with self._queue_cond:
+                    heapq.heappush(self._queue, (-entry.priority, next(self._queue_seq), entry, topic, message))
+                    self._queue_cond.notify()
+            else:
+                self._run(entry, topic, message)
+        return len(handlers)
+
+    def _run(self, entry: TopicHandler, topic: str, message: dict):
+        start = time.perf_counter()
+        error = False
+        try:
+            entry.handler(message)
+        except AttributeError as e:
+            error = True
+            logger.error(f"Controller does not support topic '{topic}': {e}")
+        except Exception as e:
+            error = True
+            logger.error(f"Error processing topic '{topic}': {e}")
+        now = time.perf_counter()
+
+        stats = self._stats.get(topic)
+        if stats is None:
+            key = topic if len(self._stats) < self.max_routes else OTHER_TOPICS_KEY
+            stats = self._stats.setdefault(key, _TopicStats())
+        with stats.lock:
+            stats.calls += 1
+            stats.errors += error
+            if stats.first_at is None:
+                stats.first_at = start
+            stats.last_at = now
+            stats.latency.record(int((now - start) * 1e6))
+
+    def start(self):
+        """비동기 핸들러 워커 시작 (시작 전에는 비동기 핸들러도 dispatch 스레드에서 실행)"""
+        with self._queue_cond:
+            if self._running:
+                return
+            self._running = True
+        self._threads = [threading.Thread(target=self._worker_loop, name=f"G1TopicRouter-{index}", daemon=True)
+                         for index in range(self.async_workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float = 1.0):
+        """워커 종료 (대기 중인 비동기 핸들러는 실행하지 않음)"""
+        with self._queue_cond:
+            if not self._running:
+                return
+            self._running = False
+            self._queue.clear()
+            self._queue_cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def _worker_loop(self):
+        while True:
+            with self._queue_cond:
+                while self._running and not self._queue:
+                    self._queue_cond.wait()
+                if not self._running:
+                    return
+                _, _, entry, topic, message = heapq.heappop(self._queue)
+            self._run(entry, topic, message)
+
+    def get_stats(self) -> Dict[str, dict]:
+        """토픽별 처리 통계 (calls: 핸들러 실행 수, rate: 첫 처리부터 마지막 처리까지의 초당 처리 수, 지연 단위 µs)"""
+        result = {}
+        for topic, stats in list(self._stats.items()):
+            with stats.lock:
+                elapsed = (stats.last_at - stats.first_at) if stats.first_at is not None else 0.0
+                entry = {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "rate": (stats.calls - 1) / elapsed if elapsed > 0 else 0.0,
+                }
+                entry.update(stats.latency.snapshot())
+            result[topic] = entry
+        return result
+
+    def pending_count(self) -> int:
+        """실행 대기 중인 비동기 핸들러 수"""
+        return len(self._queue)
+
+    def reset_stats(self):
+        self._stats = {}
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+from typing import Callable, Tuple
+
+from g1_logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class G1VelocityStreamer:
+    """고정 주기 속도 스트리밍
+
+    입력 측은 set_target()으로 최신 목표 속도(vx, vy, vyaw)만 갱신하고,
+    전용 제어 스레드가 고정 주기로 send_func를 호출한다.
+    주기 사이에 들어온 중간 목표값은 합쳐지며(최신값만 전송),
+    목표값이 바뀌지 않았으면 전송을 건너뛴다.
+
+    SDK의 Move()는 continuous 모드가 아니면 일정 시간 후 자동 정지하므로,
+    0이 아닌 목표값은 keepalive_interval마다 다시 전송한다.
+
+    shaper가 주어지면 (예: G1RateLimiter) 매 주기 shaper.step(target, dt)의
+    출력을 전송한다.
+    """
+
+    def __init__(self, send_func: Callable[[float, float, float], int],
+                 rate_hz: float = 50.0, keepalive_interval: float = 0.5, shaper=None):
+        self._send = send_func
+        self.rate_hz = rate_hz
+        self.keepalive_interval = keepalive_interval
+        self.shaper = shaper
+        self._last_tick = None
+
+        self._lock = threading.Lock()
+        self._target = (0.0, 0.0, 0.0)
+        self._last_sent = (0.0, 0.0, 0.0)
+        self._last_sent_time = 0.0
+
+        self._running = False
+        self._thread = None
+
+        # 통계
+        self.updates = 0   # set_target 호출 횟수
+        self.sent = 0      # 실제 전송 횟수
+        self.skipped = 0   # 변화 없음으로 건너뛴 주기 수
+
+    def start(self):
+        """제어 스레드 시작"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._control_loop, name="G1VelocityStreamer", daemon=True)
+        self._thread.start()
+        logger.info(f"Velocity streaming started at {self.rate_hz:.0f} Hz")
+
+    def stop(self, timeout: float = 1.0):
+        """제어 스레드 종료"""
+        if not self._running:
+            return
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout)
+        logger.info("Velocity streaming stopped")
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def set_target(self, vx: float, vy: float, vyaw: float):
+        """목표 속도 갱신 (즉시 반환, RPC 없음)"""
+        with self._lock:
+            self._target = (float(vx), float(vy), float(vyaw))
+            self.updates += 1
+
+    def get_target(self) -> Tuple[float, float, float]:
+        with self._lock:
+            return self._target
+
+    def reset(self):
+        """목표 속도를 0으로 초기화 (정지 명령이 이미 전송된 경우 사용)"""
+        with self._lock:
+            self._target = (0.0, 0.0, 0.0)
+            self._last_sent = (0.0, 0.0, 0.0)
+            self._last_sent_time = time.monotonic()
+            if self.shaper:
+                self.shaper.reset()
+
+    def get_stats(self):
+        """스트리밍 통계"""
+        return {"rate_hz": self.rate_hz, "updates": self.updates,
+                "sent": self.sent, "skipped": self.skipped}
+
+    def _control_loop(self):
+        """고정 주기 전송 루프 (deadline 기반, 드리프트 없음)"""
+        period = 1.0 / self.rate_hz
+        next_tick = time.monotonic()
+
+        while self._running:
+            try:
+                self._tick()
+            except Exception as e:
+                logger.warning(f"Velocity streaming error: {e}")
+
+            next_tick += period
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # 한 주기 이상 밀렸으면 따라잡지 않고 기준 시각 재설정
+                next_tick = time.monotonic()
+
+    def _tick(self):
+        """한 주기 처리: 목표값이 바뀌었거나 keepalive 시점이면 전송"""
+        now = time.monotonic()
+        dt = now - self._last_tick if self._last_tick is not None else 1.0 / self.rate_hz
+        self._last_tick = now
+
+        with self._lock:
+            target = self._target
+            if self.shaper:
+                target = self.shaper.step(target, dt)
+            changed = target != self._last_sent
+            keepalive = (target != (0.0, 0.0, 0.0)
+                         and now - self._last_sent_time >= self.keepalive_interval)
+
+        if not changed and not keepalive:
+            self.skipped += 1
+            return
+
+        result = self._send(*target)
+        if result == 0:
+            with self._lock:
+                self._last_sent = target
+                self._last_sent_time = now
+        self.sent += 1
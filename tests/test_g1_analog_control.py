@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from g1_analog_control import G1RateLimiter
+
+DT = 0.02
+
+
+def _run(limiter, targets):
+    """목표 속도 시퀀스로 step을 반복하고 (vx 속도 목록, vx 가속도 목록) 반환"""
+    velocities, accels = [0.0], [0.0]
+    for target in targets:
+        velocities.append(limiter.step((target, 0.0, 0.0), DT)[0])
+        accels.append(limiter._accel[0])
+    return velocities, accels
+
+
+def _max_jerk(accels):
+    return max(abs(after - before) / DT for before, after in zip(accels, accels[1:]))
+
+
+def test_jerk_limited_approach_does_not_overshoot():
+    for jerk in (1.0, 4.0, 20.0):
+        limiter = G1RateLimiter({"vx": 2.0}, {"vx": jerk})
+        velocities, accels = _run(limiter, [0.6] * 300 + [-0.3] * 150 + [0.0] * 150)
+
+        assert max(velocities) <= 0.6 + 1e-12
+        assert min(velocities) >= -0.3 - 1e-12
+        assert velocities[-1] == 0.0 and accels[-1] == 0.0
+        assert _max_jerk(accels) <= jerk + 1e-9
+
+
+def test_jerk_limit_holds_when_target_changes_mid_ramp():
+    limiter = G1RateLimiter({"vx": 1.5}, {"vx": 6.0})
+    targets = [0.8] * 10 + [-0.5] * 10 + [0.3] * 40 + [0.0] * 60
+    velocities, accels = _run(limiter, targets)
+
+    assert _max_jerk(accels) <= 6.0 + 1e-9
+    assert velocities[-1] == 0.0
+
+
+def test_accel_only_reaches_target_linearly():
+    limiter = G1RateLimiter({"vx": 1.0})
+    velocities, _ = _run(limiter, [0.1] * 7)
+
+    assert [round(v, 6) for v in velocities[1:]] == [0.02, 0.04, 0.06, 0.08, 0.1, 0.1, 0.1]
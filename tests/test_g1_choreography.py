@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+from concurrent.futures import Future
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from g1_choreography import G1ChoreographyEngine, RESULT_CANCELLED
+
+
+class _CatalogueBridge:
+    """로봇 카탈로그에 clap만 있는 arm bridge"""
+
+    def resolve_action(self, action_name):
+        return 17 if action_name == "clap" else None
+
+
+class _SubController:
+    def __init__(self, arm_bridge=None):
+        self.arm_bridge = arm_bridge
+        self.submitted = []
+        self.on_submit = None
+
+    def get_fsm_id(self):
+        return 0, 500
+
+    def set_velocity_target(self, vx, vy, vyaw, wait=True):
+        return 0
+
+    def arm_action_async(self, action_name):
+        future = Future()
+        self.submitted.append(future)
+        if self.on_submit:
+            self.on_submit()
+        return future
+
+
+def test_cancel_during_submit_cancels_in_flight_action():
+    sub = _SubController()
+    engine = G1ChoreographyEngine(sub)
+    sub.on_submit = engine.cancel  # 제출과 action_future 등록 사이에 cancel
+
+    result = engine.run(["clap"])
+
+    assert result.result(timeout=1.0) == RESULT_CANCELLED
+    assert sub.submitted[0].cancelled()
+    assert not engine.is_running()
+
+
+def test_validate_uses_arm_bridge_catalogue():
+    engine = G1ChoreographyEngine(_SubController(_CatalogueBridge()), known_actions=["clap", "hug"])
+
+    engine.validate(["clap"])
+    with pytest.raises(ValueError):
+        engine.validate(["hug"])
+
+
+def test_validate_falls_back_to_known_actions_without_bridge():
+    engine = G1ChoreographyEngine(_SubController(), known_actions=["clap", "hug"])
+
+    engine.validate(["hug"])
+    with pytest.raises(ValueError):
+        engine.validate(["nope"])
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from g1_command_queue import G1LocoCommandQueue, COALESCE_DEDUPE, COALESCE_REPLACE
+
+
+def _run_blocked(submissions):
+    """첫 명령이 실행 중인 동안 나머지를 제출하고, 실행된 명령 이름을 순서대로 반환"""
+    queue = G1LocoCommandQueue()
+    queue.start()
+    executed = []
+    release = threading.Event()
+    started = threading.Event()
+
+    def blocker():
+        started.set()
+        release.wait(1.0)
+        return 0
+
+    queue.submit(blocker, "blocker")
+    started.wait(1.0)
+
+    futures = []
+    for name, key, policy in submissions:
+        futures.append(queue.submit(lambda name=name: executed.append(name) or 0, name, key, policy))
+    release.set()
+    for future in futures:
+        future.result(timeout=1.0)
+    stats = queue.get_stats()
+    queue.stop()
+    return executed, stats
+
+
+def test_dedupe_keeps_order_when_other_commands_are_between():
+    executed, stats = _run_blocked([
+        ("sit", ("sit",), COALESCE_DEDUPE),
+        ("stand_up", ("stand_up",), COALESCE_DEDUPE),
+        ("sit", ("sit",), COALESCE_DEDUPE),
+    ])
+    assert executed == ["sit", "stand_up", "sit"]
+    assert stats["deduplicated"] == 0
+
+
+def test_dedupe_toggled_flags_run_in_order():
+    executed, _ = _run_blocked([
+        ("gait_on", ("continuous_gait", True), COALESCE_DEDUPE),
+        ("gait_off", ("continuous_gait", False), COALESCE_DEDUPE),
+        ("gait_on", ("continuous_gait", True), COALESCE_DEDUPE),
+    ])
+    assert executed == ["gait_on", "gait_off", "gait_on"]
+
+
+def test_dedupe_merges_consecutive_duplicates():
+    executed, stats = _run_blocked([
+        ("fsm_500", ("set_fsm_id", 500), COALESCE_DEDUPE),
+        ("fsm_500", ("set_fsm_id", 500), COALESCE_DEDUPE),
+    ])
+    assert executed == ["fsm_500"]
+    assert stats["deduplicated"] == 1
+
+
+def test_replace_runs_latest_velocity_last():
+    executed, stats = _run_blocked([
+        ("move_a", "velocity", COALESCE_REPLACE),
+        ("stand_up", ("stand_up",), COALESCE_DEDUPE),
+        ("move_b", "velocity", COALESCE_REPLACE),
+    ])
+    assert executed == ["stand_up", "move_b"]
+    assert stats["coalesced"] == 1
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from g1_logger import _LogWriter, CONTROL, ERROR, INFO, WARNING
+
+
+def _writer(interval=60.0):
+    stream = io.StringIO()
+    return _LogWriter(rate_limit_interval=interval, stream=stream), stream
+
+
+def test_control_and_warning_levels_are_never_suppressed():
+    writer, stream = _writer()
+    for level in (CONTROL, WARNING, ERROR):
+        for _ in range(3):
+            writer.log("test", level, "same line")
+    writer.flush()
+
+    assert stream.getvalue().count("same line") == 9
+    assert writer.get_stats()["suppressed"] == 0
+
+
+def test_flush_reports_pending_suppressed_count():
+    writer, stream = _writer()
+    for _ in range(4):
+        writer.log("test", INFO, "tick")
+    writer.flush()
+
+    assert stream.getvalue().splitlines() == ["[INFO] tick", "[INFO] tick (suppressed 3 repeats)"]
+
+    # 이미 보고된 횟수는 다시 출력하지 않음
+    writer.flush()
+    assert stream.getvalue().count("suppressed") == 1
+
+
+def test_suppressed_count_is_reported_after_window_without_recurrence():
+    writer, stream = _writer(interval=0.1)
+    for _ in range(3):
+        writer.log("test", INFO, "tock")
+
+    deadline = time.monotonic() + 2.0
+    while "suppressed" not in stream.getvalue() and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    assert stream.getvalue().splitlines() == ["[INFO] tock", "[INFO] tock (suppressed 2 repeats)"]